@@ -12,18 +12,26 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
 import json
 import logging
+import math
 import os
 import sys
+import time
 
 from yaml import Dumper, dump
 from argparse import Namespace
 from typing import List
 from data_validation import (
+    batched_validation,
     cli_tools,
     clients,
     consts,
+    fused_validation,
+    partition_manifest,
+    schema_validation,
+    sliced_validation,
     state_manager,
 )
 from data_validation.config_manager import ConfigManager
@@ -43,6 +51,26 @@ LOG_LEVEL_MAP = {
     "CRITICAL": logging.CRITICAL,
 }
 
+# Column types aggregated by numeric aggregates, e.g. sum
+NUMERIC_DATA_TYPES = [
+    "float64",
+    "float32",
+    "int8",
+    "int16",
+    "int32",
+    "int64",
+    "decimal",
+    "!float64",
+    "!float32",
+    "!int8",
+    "!int16",
+    "!int32",
+    "!int64",
+    "!decimal",
+]
+STRING_DATA_TYPES = ["string", "!string"]
+TEMPORAL_DATA_TYPES = ["timestamp", "!timestamp", "date", "!date"]
+
 
 def _get_arg_config_file(args):
     """Return String YAML config file path."""
@@ -73,28 +101,13 @@ def get_aggregate_config(args, config_manager: ConfigManager):
         config_manager (ConfigManager): Validation config manager instance.
     """
     aggregate_configs = [config_manager.build_config_count_aggregate()]
-    supported_data_types = [
-        "float64",
-        "float32",
-        "int8",
-        "int16",
-        "int32",
-        "int64",
-        "decimal",
-        "!float64",
-        "!float32",
-        "!int8",
-        "!int16",
-        "!int32",
-        "!int64",
-        "!decimal",
-    ]
+    supported_data_types = list(NUMERIC_DATA_TYPES)
 
     if args.wildcard_include_string_len:
-        supported_data_types.extend(["string", "!string"])
+        supported_data_types.extend(STRING_DATA_TYPES)
 
     if args.wildcard_include_timestamp:
-        supported_data_types.extend(["timestamp", "!timestamp", "date", "!date"])
+        supported_data_types.extend(TEMPORAL_DATA_TYPES)
 
     cast_to_bigint = True if args.cast_to_bigint else False
 
@@ -157,6 +170,71 @@ def get_aggregate_config(args, config_manager: ConfigManager):
             supported_data_types,
             cast_to_bigint=cast_to_bigint,
         )
+    if getattr(args, "approx_count_distinct", None):
+        col_args = (
+            None
+            if args.approx_count_distinct == "*"
+            else cli_tools.get_arg_list(args.approx_count_distinct)
+        )
+        aggregate_configs += config_manager.build_config_column_aggregates(
+            "approx_count_distinct",
+            col_args,
+            args.exclude_columns,
+            None,
+            cast_to_bigint=cast_to_bigint,
+        )
+    if getattr(args, "approx_median", None):
+        col_args = (
+            None
+            if args.approx_median == "*"
+            else cli_tools.get_arg_list(args.approx_median)
+        )
+        aggregate_configs += config_manager.build_config_column_aggregates(
+            "approx_median",
+            col_args,
+            args.exclude_columns,
+            supported_data_types,
+            cast_to_bigint=cast_to_bigint,
+        )
+    return aggregate_configs
+
+
+def get_profile_config(args, config_manager: ConfigManager) -> List[dict]:
+    """Return the aggregation objects of the column profiles of a profile validation:
+        - null count and approximate distinct count of every column
+        - min and max of numeric, string (as length) and timestamp/date columns
+        - avg and std of numeric and string (as length) columns
+        - optionally, a fixed width histogram of numeric columns
+
+    Args:
+        config_manager (ConfigManager): Validation config manager instance.
+    """
+    col_args = (
+        None
+        if args.profile_columns == "*"
+        else cli_tools.get_arg_list(args.profile_columns)
+    )
+    profile_types = [
+        ("null_count", None),
+        ("approx_count_distinct", None),
+        ("min", NUMERIC_DATA_TYPES + STRING_DATA_TYPES + TEMPORAL_DATA_TYPES),
+        ("max", NUMERIC_DATA_TYPES + STRING_DATA_TYPES + TEMPORAL_DATA_TYPES),
+        ("avg", NUMERIC_DATA_TYPES + STRING_DATA_TYPES),
+        ("std", NUMERIC_DATA_TYPES + STRING_DATA_TYPES),
+    ]
+    aggregate_configs = [config_manager.build_config_count_aggregate()]
+    for agg_type, supported_data_types in profile_types:
+        aggregate_configs += config_manager.build_config_column_aggregates(
+            agg_type,
+            col_args,
+            args.exclude_columns,
+            supported_data_types,
+            strict_types=True,
+        )
+    if args.histogram_buckets:
+        aggregate_configs += config_manager.build_config_histogram_aggregates(
+            col_args, args.exclude_columns, NUMERIC_DATA_TYPES, args.histogram_buckets
+        )
     return aggregate_configs
 
 
@@ -285,13 +363,39 @@ def build_config_from_args(args: Namespace, config_manager: ConfigManager):
             )
         )
 
+    # Append the additional source shards of column and row validations
+    if getattr(args, "source_shards", None):
+        config_manager.append_source_shards(cli_tools.get_arg_list(args.source_shards))
+
+    if getattr(args, "skip_unchanged", False):
+        config_manager.append_skip_unchanged(True)
+
+    # Append the cache of source query results, reused when validating other targets
+    if getattr(args, "source_cache_ttl", None):
+        config_manager.append_source_cache(
+            args.source_cache_ttl, getattr(args, "source_cache_token", None)
+        )
+
     # Append COLUMN_VALIDATION configs, including custom-query column validation
     if (
         config_manager.validation_type == consts.COLUMN_VALIDATION
         or config_manager.validation_type == consts.CUSTOM_QUERY
         and args.custom_query_type == consts.COLUMN_VALIDATION.lower()
     ):
-        config_manager.append_aggregates(get_aggregate_config(args, config_manager))
+        if getattr(args, "validate_cmd", None) == "profile":
+            config_manager.append_aggregates(get_profile_config(args, config_manager))
+        else:
+            config_manager.append_aggregates(get_aggregate_config(args, config_manager))
+        if getattr(args, "aggregate_thresholds", None):
+            config_manager.append_aggregate_thresholds(
+                cli_tools.get_aggregate_thresholds(args.aggregate_thresholds)
+            )
+        if getattr(args, "max_aggregates", None):
+            config_manager.append_max_aggregates(args.max_aggregates)
+        if getattr(args, "max_query_workers", None):
+            config_manager.append_max_query_workers(args.max_query_workers)
+        if getattr(args, "approx_threshold", None) is not None:
+            config_manager.append_approx_threshold(args.approx_threshold)
         if (
             config_manager.validation_type == consts.COLUMN_VALIDATION
             and args.grouped_columns  # grouped_columns not supported in custom queries - at least now.
@@ -300,6 +404,17 @@ def build_config_from_args(args: Namespace, config_manager: ConfigManager):
             config_manager.append_query_groups(
                 config_manager.build_column_configs(grouped_columns)
             )
+            if getattr(args, "group_buckets", None):
+                config_manager.append_group_buckets(args.group_buckets)
+        if config_manager.validation_type == consts.COLUMN_VALIDATION and getattr(
+            args, "slices", None
+        ):
+            config_manager.append_slices(
+                args.slices,
+                config_manager.build_column_configs(
+                    cli_tools.get_arg_list(args.slice_keys)
+                ),
+            )
 
     # Append ROW_VALIDATION configs, including custom-query row validation
     if (
@@ -361,17 +476,12 @@ def config_runner(args):
     variable. This environment variable is set by the Kubernetes/Cloud Run container orchestrator.
     The orchestrator spins up containers to complete each validation, one at a time.
     """
-    if args.config_dir:
-        if args.kube_completions and (
-            ("JOB_COMPLETION_INDEX" in os.environ.keys())
-            or ("CLOUD_RUN_TASK_INDEX" in os.environ.keys())
-        ):
+    if not args.config_dir and partition_manifest.is_manifest_file(args.config_file):
+        manifest_runner(args)
+    elif args.config_dir:
+        job_index = _get_job_completion_index() if args.kube_completions else None
+        if job_index is not None:
             # Running in Kubernetes in Job completions - only run the yaml file corresponding to index
-            job_index = (
-                int(os.environ.get("JOB_COMPLETION_INDEX"))
-                if "JOB_COMPLETION_INDEX" in os.environ.keys()
-                else int(os.environ.get("CLOUD_RUN_TASK_INDEX"))
-            )
             config_file_path = (
                 f"{args.config_dir}{job_index:04d}.yaml"
                 if args.config_dir.endswith("/")
@@ -401,6 +511,50 @@ def config_runner(args):
         run_validations(args, config_managers)
 
 
+def manifest_runner(args):
+    """Run the validations of a partition manifest written by generate-table-partitions.
+
+    The manifest replaces the numbered YAML files, task N of the manifest being the
+    equivalent of file N. With --kube-completions only the task matching the job index is
+    run, otherwise tasks are built lazily one after another and share the same clients.
+    """
+    manifest_path = args.config_file
+    manifest = partition_manifest.PartitionManifest.read(manifest_path)
+    if getattr(args, "partition_max_rows", None) or getattr(
+        args, "partition_max_seconds", None
+    ):
+        logging.info(
+            "Partitions split at run time are not written back to partition manifest %s.",
+            manifest_path,
+        )
+
+    job_index = _get_job_completion_index() if args.kube_completions else None
+    if job_index is not None:
+        yaml_configs_list = [manifest.get_yaml_config(job_index)]
+    else:
+        if args.kube_completions:
+            logging.warning(
+                "--kube-completions or -kc specified, however not running in Kubernetes Job completion, check your command line."
+            )
+        yaml_configs_list = manifest.iter_yaml_configs()
+
+    clients_cache = {}
+    for yaml_configs in yaml_configs_list:
+        config_managers = build_config_managers_from_yaml_config(
+            args, yaml_configs, manifest_path, clients_cache=clients_cache
+        )
+        run_validations(args, config_managers)
+
+
+def _get_job_completion_index():
+    """Return the Kubernetes / Cloud Run task index or None when not running as an indexed job."""
+    if "JOB_COMPLETION_INDEX" in os.environ.keys():
+        return int(os.environ.get("JOB_COMPLETION_INDEX"))
+    if "CLOUD_RUN_TASK_INDEX" in os.environ.keys():
+        return int(os.environ.get("CLOUD_RUN_TASK_INDEX"))
+    return None
+
+
 def build_config_managers_from_yaml(args, config_file_path):
     """Returns List[ConfigManager] instances ready to be executed."""
     if args.config_dir:
@@ -408,12 +562,32 @@ def build_config_managers_from_yaml(args, config_file_path):
     else:
         yaml_configs = cli_tools.get_validation(config_file_path)
 
+    return build_config_managers_from_yaml_config(args, yaml_configs, config_file_path)
+
+
+def build_config_managers_from_yaml_config(
+    args, yaml_configs, config_file_path, clients_cache=None
+):
+    """Returns List[ConfigManager] instances for a YAML config dict.
+
+    Args:
+        yaml_configs (dict): YAML config, with source, target, result_handler and validations.
+        config_file_path (str): Name of the file the config was read from.
+        clients_cache (dict): Optional dict of clients by connection name, reused across calls.
+    """
+    clients_cache = {} if clients_cache is None else clients_cache
     mgr = state_manager.StateManager()
     source_conn = mgr.get_connection_config(yaml_configs[consts.YAML_SOURCE])
     target_conn = mgr.get_connection_config(yaml_configs[consts.YAML_TARGET])
 
-    source_client = clients.get_data_client(source_conn)
-    target_client = clients.get_data_client(target_conn)
+    for conn_name, conn in (
+        (yaml_configs[consts.YAML_SOURCE], source_conn),
+        (yaml_configs[consts.YAML_TARGET], target_conn),
+    ):
+        if conn_name not in clients_cache:
+            clients_cache[conn_name] = clients.get_data_client(conn)
+    source_client = clients_cache[yaml_configs[consts.YAML_SOURCE]]
+    target_client = clients_cache[yaml_configs[consts.YAML_TARGET]]
 
     config_managers = []
     for config in yaml_configs[consts.YAML_VALIDATIONS]:
@@ -490,11 +664,24 @@ def run_validation(config_manager, dry_run=False, verbose=False):
         dry_run (bool): Print source and target SQL to stdout in lieu of validation.
         verbose (bool): Validation setting to log queries run.
     """
+    if not dry_run and sliced_validation.is_sliced(config_manager):
+        validation = sliced_validation.SlicedValidation(config_manager, verbose=verbose)
+        if validation.is_mergeable():
+            config_manager.get_result_handler().execute(validation.get_report())
+            return
+        logging.warning(
+            "Aggregates of %s cannot be merged from slices, running a single query",
+            config_manager.full_source_table,
+        )
+
+    # The clients are shared so that validations see the table schemas prefetched on them
     with DataValidation(
         config_manager.config,
         validation_builder=None,
         result_handler=None,
         verbose=verbose,
+        source_client=config_manager.source_client,
+        target_client=config_manager.target_client,
     ) as validator:
 
         if dry_run:
@@ -535,6 +722,186 @@ def run_validation(config_manager, dry_run=False, verbose=False):
             validator.execute()
 
 
+def _is_splittable_validation(config_manager: ConfigManager) -> bool:
+    """Return True if the validation can be split into partitions on its primary keys."""
+    return bool(
+        config_manager.primary_keys
+        and not config_manager.source_shards
+        and (
+            config_manager.validation_type == consts.ROW_VALIDATION
+            or (
+                config_manager.validation_type == consts.CUSTOM_QUERY
+                and config_manager.custom_query_type == consts.ROW_VALIDATION.lower()
+            )
+        )
+    )
+
+
+def _split_config_manager(
+    config_manager: ConfigManager, validation_block: dict
+) -> ConfigManager:
+    """Return a ConfigManager for a partition of config_manager, re-using its clients."""
+    config = copy.copy(config_manager.config)
+    config[consts.CONFIG_FILTERS] = validation_block[consts.CONFIG_FILTERS]
+    return ConfigManager(
+        config,
+        source_client=config_manager.source_client,
+        target_client=config_manager.target_client,
+        verbose=config_manager.verbose,
+    )
+
+
+def run_partition_validation(args, config_manager: ConfigManager) -> List[dict]:
+    """Run a single validation, splitting it into smaller partitions when it is larger than the
+    --partition-max-rows or slower than the --partition-max-seconds targets.
+
+    A validation with more source rows than --partition-max-rows is split before it is run and the
+    new partitions are validated in its place. A validation which takes longer than
+    --partition-max-seconds is split after it has run, the new partitions are only used by
+    subsequent runs.
+
+    Args:
+        config_manager (ConfigManager): Validation config manager instance.
+
+    Returns:
+        A list of validation blocks to replace the validation in its YAML file, or None if the
+        validation was not split.
+    """
+    max_rows = getattr(args, "partition_max_rows", None)
+    max_seconds = getattr(args, "partition_max_seconds", None)
+    if (
+        args.dry_run
+        or not (max_rows or max_seconds)
+        or not _is_splittable_validation(config_manager)
+    ):
+        run_validation(config_manager, dry_run=args.dry_run, verbose=args.verbose)
+        return None
+
+    row_count = (
+        PartitionBuilder.get_source_row_count(config_manager)[0] if max_rows else None
+    )
+    if max_rows and row_count > max_rows:
+        split_num = math.ceil(row_count / max_rows)
+        logging.info(
+            "Validation has %s source rows, splitting it into %s partitions",
+            row_count,
+            split_num,
+        )
+        validation_blocks = PartitionBuilder.split_validation(
+            config_manager, split_num, source_count=row_count
+        )
+        for validation_block in validation_blocks:
+            run_validation(
+                _split_config_manager(config_manager, validation_block),
+                verbose=args.verbose,
+            )
+        return validation_blocks
+
+    start_time = time.monotonic()
+    run_validation(config_manager, verbose=args.verbose)
+    elapsed_seconds = time.monotonic() - start_time
+    if max_seconds and elapsed_seconds > max_seconds:
+        if row_count is None:
+            row_count = PartitionBuilder.get_source_row_count(config_manager)[0]
+        split_num = min(math.ceil(elapsed_seconds / max_seconds), row_count)
+        if split_num < 2:
+            return None
+        logging.info(
+            "Validation took %.1f seconds, splitting it into %s partitions for subsequent runs",
+            elapsed_seconds,
+            split_num,
+        )
+        return PartitionBuilder.split_validation(
+            config_manager, split_num, source_count=row_count
+        )
+    return None
+
+
+def store_split_partitions(args, config_file_path: str, split_validations: dict):
+    """Replace validations in a YAML config file with the partitions they were split into.
+
+    Args:
+        config_file_path (str): YAML config file path, relative to args.config_dir if provided.
+        split_validations (dict): Validation blocks, keyed on the index of the validation they replace.
+    """
+    if args.config_dir:
+        yaml_configs = cli_tools.get_validation(config_file_path, args.config_dir)
+        config_file_path = os.path.join(args.config_dir, config_file_path)
+    else:
+        yaml_configs = cli_tools.get_validation(config_file_path)
+
+    validations = []
+    for ind, validation in enumerate(yaml_configs[consts.YAML_VALIDATIONS]):
+        validations.extend(split_validations.get(ind, [validation]))
+    yaml_configs[consts.YAML_VALIDATIONS] = validations
+
+    cli_tools.store_validation(config_file_path, yaml_configs, include_log=False)
+    logging.info(
+        "Stored %s validations in YAML file %s", len(validations), config_file_path
+    )
+
+
+def run_fused_validation(config_managers, verbose=False):
+    """Run column validations of the same tables with a single query per table.
+
+    Args:
+        config_managers (list[ConfigManager]): Validations grouped by fused_validation.plan_validations.
+        verbose (bool): Validation setting to log queries run.
+
+    Returns:
+        False if the fused queries failed and the validations should be run one by one.
+    """
+    logging.info(
+        "Running %s column validations of %s in a single query",
+        len(config_managers),
+        config_managers[0].full_source_table,
+    )
+    try:
+        reports = fused_validation.FusedValidation(
+            config_managers, verbose=verbose
+        ).get_reports()
+    except Exception as e:
+        logging.warning(
+            "Fused column validation failed, running the validations one by one: %s",
+            str(e),
+        )
+        return False
+    for config_manager, result_df in zip(config_managers, reports):
+        config_manager.get_result_handler().execute(result_df)
+    return True
+
+
+def run_batched_validations(validation_groups, max_sql_length, verbose=False):
+    """Run column validations of many tables with a few UNION ALL queries per connection.
+
+    Args:
+        validation_groups (list[list[ConfigManager]]): Fusible validations grouped by fused_validation.plan_validations.
+        max_sql_length (int): Maximum length of the SQL of each union query.
+        verbose (bool): Validation setting to log queries run.
+
+    Returns:
+        The validation groups whose batched queries failed and which should be run table by table.
+    """
+    try:
+        reports = batched_validation.BatchedValidation(
+            validation_groups, max_sql_length=max_sql_length, verbose=verbose
+        ).get_reports()
+    except Exception as e:
+        logging.warning(
+            "Batched column validation failed, running the validations table by table: %s",
+            str(e),
+        )
+        return validation_groups
+    failed_groups = []
+    for validation_group, group_reports in zip(validation_groups, reports):
+        if group_reports is None:
+            failed_groups.append(validation_group)
+            continue
+        for config_manager, result_df in zip(validation_group, group_reports):
+            config_manager.get_result_handler().execute(result_df)
+    return failed_groups
+
+
 def run_validations(args, config_managers):
     """Run and manage a series of validations.
 
@@ -542,24 +909,70 @@ def run_validations(args, config_managers):
         config_managers (list[ConfigManager]): List of config manager instances.
     """
     # TODO(issue/31): Add parallel execution logic
-    for config_manager in config_managers:
-        if config_manager.config and consts.CONFIG_FILE in config_manager.config:
-            logging.info(
-                "Currently running the validation for YAML file: %s",
-                config_manager.config[consts.CONFIG_FILE],
-            )
-            try:
-                run_validation(
-                    config_manager, dry_run=args.dry_run, verbose=args.verbose
+    split_validations = {}
+    # Validations are regrouped below, keep the position of each one in the config file
+    config_indexes = {
+        id(config_manager): ind for ind, config_manager in enumerate(config_managers)
+    }
+    if args.dry_run:
+        validation_groups = [[_] for _ in config_managers]
+    else:
+        # Schema validations of many tables in a schema share one catalog query
+        schema_validation.prefetch_table_schemas(config_managers)
+        # Column validations of the same tables share a single scan of each table
+        validation_groups = fused_validation.plan_validations(config_managers)
+        if getattr(args, "batch_tables", False):
+            # Validations with more aggregates than a query allows are split on their own
+            batched_groups = [
+                _
+                for _ in validation_groups
+                if fused_validation.is_fusible(_[0])
+                and fused_validation.fits_max_aggregates(_)
+            ]
+            if len(batched_groups) > 1:
+                failed_groups = run_batched_validations(
+                    batched_groups, args.batch_max_sql_length, verbose=args.verbose
                 )
-            except Exception as e:
-                logging.error(
-                    "Error %s occurred while running config file %s. Skipping it for now.",
-                    str(e),
+                validation_groups = [
+                    _
+                    for _ in validation_groups
+                    if _ not in batched_groups or _ in failed_groups
+                ]
+    for validation_group in validation_groups:
+        if len(validation_group) > 1 and run_fused_validation(
+            validation_group, verbose=args.verbose
+        ):
+            continue
+        for config_manager in validation_group:
+            ind = config_indexes[id(config_manager)]
+            if config_manager.config and consts.CONFIG_FILE in config_manager.config:
+                logging.info(
+                    "Currently running the validation for YAML file: %s",
                     config_manager.config[consts.CONFIG_FILE],
                 )
-        else:
-            run_validation(config_manager, dry_run=args.dry_run, verbose=args.verbose)
+                try:
+                    validation_blocks = run_partition_validation(args, config_manager)
+                    if validation_blocks:
+                        split_validations[ind] = validation_blocks
+                except Exception as e:
+                    logging.error(
+                        "Error %s occurred while running config file %s. Skipping it for now.",
+                        str(e),
+                        config_manager.config[consts.CONFIG_FILE],
+                    )
+            else:
+                run_validation(
+                    config_manager, dry_run=args.dry_run, verbose=args.verbose
+                )
+
+    if split_validations and not config_managers[0].config[consts.CONFIG_FILE].endswith(
+        consts.PARTITION_MANIFEST_FILE
+    ):
+        # Persist the split partitions so the next run is balanced from the start.
+        # Manifest tasks are not rewritten as that would renumber the following tasks.
+        store_split_partitions(
+            args, config_managers[0].config[consts.CONFIG_FILE], split_validations
+        )
 
 
 def store_yaml_config_file(args, config_managers):
@@ -627,6 +1040,8 @@ def run_connections(args):
     """Run commands related to connection management."""
     if args.connect_cmd == "list":
         cli_tools.list_connections()
+    elif args.connect_cmd == "refresh-cache":
+        cli_tools.refresh_metadata_cache(args.connection_name)
     elif args.connect_cmd == "add":
         conn = cli_tools.get_connection_config_from_args(args)
         # Test getting a client to validate connection details
@@ -653,7 +1068,7 @@ def run_validation_configs(args):
 
 def validate(args):
     """Run commands related to data validation."""
-    if args.validate_cmd in ["column", "row", "schema", "custom-query"]:
+    if args.validate_cmd in ["column", "row", "schema", "custom-query", "profile"]:
         run(args)
     else:
         raise ValueError(f"Validation Argument '{args.validate_cmd}' is not supported")
@@ -678,7 +1093,8 @@ def main():
     elif args.command == "validate":
         validate(args)
     elif args.command == "generate-table-partitions":
-        cli_tools.check_no_yaml_files(args.partition_num, args.parts_per_file)
+        if args.partition_num and not args.partition_manifest:
+            cli_tools.check_no_yaml_files(args.partition_num, args.parts_per_file)
         partition_and_store_config_files(args)
     elif args.command == "deploy":
         from data_validation import app
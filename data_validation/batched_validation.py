@@ -0,0 +1,211 @@
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+""" Column validations of many tables are batched into a few UNION ALL queries per
+    connection, so that validating hundreds of small tables does not pay the latency
+    of two queries per table.
+
+    Each branch of a union is the fused aggregate query of one table (see fused_validation),
+    tagged with a batch id column used to split the results back into per table reports.
+    Branches are only combined when their aggregate column types match, and a union is
+    closed before its SQL exceeds the maximum length. When a union fails its branches are
+    run one by one, so that only the tables whose own query fails are left out of the
+    reports and validated table by table.
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+import ibis
+import pandas
+
+from data_validation import consts
+from data_validation.config_manager import ConfigManager
+from data_validation.fused_validation import FusedValidation
+
+
+def _get_sql_length(client, expr) -> int:
+    """Return the length of the SQL of an expression, or 0 if the client does not compile to SQL."""
+    try:
+        return len(str(client.compile(expr)))
+    except Exception:
+        return 0
+
+
+class _Branch(object):
+    def __init__(self, batch_id: int, query):
+        """A fused aggregate query with its columns ordered by type and renamed by position,
+        so that branches of different tables with the same types can be unioned.
+
+        Args:
+            batch_id (int): The id of the branch, used to find its row in the union results.
+            query (IbisTable): The fused aggregate query of a table.
+        """
+        schema = query.schema()
+        names = sorted(schema.names, key=lambda _: str(schema[_]))
+        self.batch_id = batch_id
+        self.signature = tuple(str(schema[_]) for _ in names)
+        self.columns = {
+            f"{consts.BATCH_COLUMN_PREFIX}{ind}": name for ind, name in enumerate(names)
+        }
+        self.expr = query.select(
+            [ibis.literal(batch_id, type="int64").name(consts.BATCH_ID_COLUMN)]
+            + [query[name].name(column) for column, name in self.columns.items()]
+        )
+
+
+class BatchedValidation(object):
+    def __init__(
+        self,
+        validation_groups: List[List[ConfigManager]],
+        max_sql_length: int = consts.BATCH_MAX_SQL_LENGTH,
+        verbose=False,
+    ):
+        """Initialize a BatchedValidation of column validations of many tables.
+
+        Args:
+            validation_groups (List[List[ConfigManager]]): Fusible validations grouped by
+                fused_validation.plan_validations.
+            max_sql_length (int): Maximum length of the SQL of each union query.
+            verbose (bool): If verbose, the queries run are logged.
+        """
+        self.fused_validations = [
+            FusedValidation(validation_group, verbose=verbose)
+            for validation_group in validation_groups
+        ]
+        self.max_sql_length = max_sql_length
+        self.verbose = verbose
+
+    def _plan_batches(self, clients: list, queries: list) -> List[tuple]:
+        """Pack the fused queries of one side into union batches.
+
+        Args:
+            clients (list): The client of each fused query.
+            queries (list): The fused query of each validation group.
+
+        Returns:
+            A list of (client, branches) tuples, one per union query to run.
+        """
+        batches = []
+        open_batches = {}
+        for batch_id, (client, query) in enumerate(zip(clients, queries)):
+            branch = _Branch(batch_id, query)
+            branch_length = _get_sql_length(client, branch.expr)
+            key = (id(client), branch.signature)
+            batch = open_batches.get(key)
+            if batch is None or (batch["length"] + branch_length > self.max_sql_length):
+                batch = {"client": client, "branches": [], "length": 0}
+                open_batches[key] = batch
+                batches.append(batch)
+            batch["branches"].append(branch)
+            batch["length"] += branch_length
+        return [(_["client"], _["branches"]) for _ in batches]
+
+    def _run_batch(
+        self, client, branches: List[_Branch]
+    ) -> Dict[int, pandas.DataFrame]:
+        """Run a union query and return the result row of each branch, with its fused column names.
+
+        If the union fails its branches are run one by one, branches which still fail are
+        left out of the results.
+        """
+        if len(branches) == 1:
+            query = branches[0].expr
+        else:
+            query = ibis.union(*[_.expr for _ in branches], distinct=False)
+        if self.verbose:
+            logging.info("-- ** Batched Query of %s Tables ** --", len(branches))
+            logging.info(query.compile())
+        try:
+            result_df = client.execute(query)
+        except Exception as e:
+            if len(branches) == 1:
+                logging.warning(
+                    "Batched column validation of %s failed, it will be validated on its own: %s",
+                    self.fused_validations[branches[0].batch_id]
+                    .config_managers[0]
+                    .full_source_table,
+                    str(e),
+                )
+                return {}
+            logging.warning(
+                "Batched query of %s tables failed, running the tables one by one: %s",
+                len(branches),
+                str(e),
+            )
+            results = {}
+            for branch in branches:
+                results.update(self._run_batch(client, [branch]))
+            return results
+        results = {}
+        for branch in branches:
+            branch_df = result_df[result_df[consts.BATCH_ID_COLUMN] == branch.batch_id]
+            results[branch.batch_id] = (
+                branch_df[list(branch.columns)]
+                .rename(columns=branch.columns)
+                .reset_index(drop=True)
+            )
+        return results
+
+    def _run_batches(self, batches: List[tuple]) -> Dict[int, pandas.DataFrame]:
+        """Run the union queries of one side concurrently and merge their results."""
+        results = {}
+        if not batches:
+            return results
+        with ThreadPoolExecutor(
+            max_workers=min(consts.BATCH_MAX_WORKERS, len(batches))
+        ) as executor:
+            futures = [
+                executor.submit(self._run_batch, client, branches)
+                for client, branches in batches
+            ]
+            for future in futures:
+                results.update(future.result())
+        return results
+
+    def get_reports(self) -> List[Optional[List[pandas.DataFrame]]]:
+        """Run the union queries and return the reports of each validation group.
+
+        The reports of a validation group are None if its source or target query failed.
+        """
+        source_batches = self._plan_batches(
+            [_.config_managers[0].source_client for _ in self.fused_validations],
+            [_.get_source_query() for _ in self.fused_validations],
+        )
+        target_batches = self._plan_batches(
+            [_.config_managers[0].target_client for _ in self.fused_validations],
+            [_.get_target_query() for _ in self.fused_validations],
+        )
+        logging.info(
+            "Running column validations of %s tables in %s source and %s target queries",
+            len(self.fused_validations),
+            len(source_batches),
+            len(target_batches),
+        )
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            source_future = executor.submit(self._run_batches, source_batches)
+            target_future = executor.submit(self._run_batches, target_batches)
+            source_results = source_future.result()
+            target_results = target_future.result()
+
+        return [
+            fused_validation.get_reports_from_results(
+                source_results[batch_id], target_results[batch_id]
+            )
+            if batch_id in source_results and batch_id in target_results
+            else None
+            for batch_id, fused_validation in enumerate(self.fused_validations)
+        ]
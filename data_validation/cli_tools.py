@@ -57,7 +57,14 @@ from argparse import Namespace
 from typing import Dict, List, Optional
 from yaml import Dumper, Loader, dump, load
 
-from data_validation import clients, consts, find_tables, state_manager, gcs_helper
+from data_validation import (
+    clients,
+    consts,
+    find_tables,
+    gcs_helper,
+    metadata_cache,
+    state_manager,
+)
 from data_validation.validation_builder import list_to_sublists
 
 
@@ -125,6 +132,10 @@ CONNECTION_SOURCE_FIELDS = {
         ["instance_id", "ID of Spanner instance to connect to"],
         ["database_id", "ID of Spanner database (schema) to connect to"],
         ["google_service_account_key_path", "(Optional) GCP SA Key Path"],
+        [
+            "partition_workers",
+            "(Optional) Number of partitions of row queries read concurrently (defaults to 0, not partitioned)",
+        ],
     ],
     "FileSystem": [
         ["table_name", "Table name to use as reference for file data"],
@@ -203,12 +214,23 @@ def _check_custom_query_args(parser: argparse.ArgumentParser, parsed_args: Names
         return  # old format - only one of them is present
 
 
+def _check_slice_args(parser: argparse.ArgumentParser, parsed_args: Namespace):
+    """Check that sliced column validations have the keys to slice on."""
+    if getattr(parsed_args, "slices", None) and not getattr(
+        parsed_args, "slice_keys", None
+    ):
+        parser.error(
+            f"{parsed_args.command}: --slice-keys/-sk must be specified with --slices/-sl"
+        )
+
+
 def get_parsed_args() -> Namespace:
     """Return ArgParser with configured CLI arguments."""
     parser = configure_arg_parser()
     args = ["--help"] if len(sys.argv) == 1 else None
     parsed_args = parser.parse_args(args)
     _check_custom_query_args(parser, parsed_args)
+    _check_slice_args(parser, parsed_args)
     return parsed_args
 
 
@@ -259,6 +281,24 @@ def _configure_partition_parser(subparsers):
         default=1,
         help="Number of partitions to be validated in a single yaml file.",
     )
+    optional_arguments.add_argument(
+        "--row-count-estimate",
+        "-rce",
+        action="store_true",
+        help="Derive the number of partitions from --rows-per-partition or --max-partition-mb with source row counts read from catalog statistics, falling back to COUNT(*) when filters are used or statistics are missing, and skip the target COUNT(*). The source is still counted once with COUNT(*) to place the partition boundaries, so the number of partitions is approximate but their boundaries are not.",
+    )
+    optional_arguments.add_argument(
+        "--bind-partition-filters",
+        "-bpf",
+        action="store_true",
+        help="Store the key values of partition filters as bind parameters so that all partitions run the same SQL statement, for databases accessed through SQLAlchemy.",
+    )
+    optional_arguments.add_argument(
+        "--partition-manifest",
+        "-pm",
+        action="store_true",
+        help="Store the partitions of each table in a single partitions.json manifest instead of one YAML file per parts-per-file partitions.",
+    )
 
     required_arguments.add_argument(
         "--config-dir",
@@ -270,13 +310,28 @@ def _configure_partition_parser(subparsers):
         "Local: Provide a relative path of the target directory. "
         "Eg: `partitions_dir`",
     )
-    required_arguments.add_argument(
+    # The number of partitions is either provided or derived from a target partition size
+    partition_size_mutually_exclusive = required_arguments.add_mutually_exclusive_group(
+        required=True
+    )
+    partition_size_mutually_exclusive.add_argument(
         "--partition-num",
         "-pn",
-        required=True,
         help="Number of partitions into which the table should be split",
         type=_check_positive,
     )
+    partition_size_mutually_exclusive.add_argument(
+        "--rows-per-partition",
+        "-rpp",
+        help="Number of source rows in each partition, the number of partitions is derived from the table row count",
+        type=_check_positive,
+    )
+    partition_size_mutually_exclusive.add_argument(
+        "--max-partition-mb",
+        "-mpmb",
+        help="Expected memory in MB used by the validation of each partition, the number of partitions is derived from the table row count and row width",
+        type=_check_positive,
+    )
     # User can provide tables or custom queries, but not both
     # However, Argparse does not support adding an argument_group to an argument_group or adding a
     # mutually_exclusive_group or argument_group to a mutually_exclusive_group since version 3.11.
@@ -397,7 +452,7 @@ def _configure_validation_config_parser(subparsers):
     run_parser.add_argument(
         "--config-file",
         "-c",
-        help="YAML Config File path to be used for building or running validations.",
+        help="YAML Config File path to be used for building or running validations, or partitions.json manifest written by generate-table-partitions --partition-manifest.",
     )
     run_parser.add_argument(
         "--config-dir",
@@ -410,6 +465,31 @@ def _configure_validation_config_parser(subparsers):
         action="store_true",
         help="When validating multiple table partitions generated by generate-table-partitions, using DVT in Kubernetes in index completion mode use this flag so that all the validations are completed",
     )
+    run_parser.add_argument(
+        "--partition-max-rows",
+        "-pmr",
+        type=_check_positive,
+        help="Split a row validation into smaller partitions before running it when its source row count exceeds this value. The new partitions are written back to the YAML config file.",
+    )
+    run_parser.add_argument(
+        "--partition-max-seconds",
+        "-pms",
+        type=_check_positive,
+        help="Split a row validation into smaller partitions for subsequent runs when it takes longer than this number of seconds. The new partitions are written back to the YAML config file.",
+    )
+    run_parser.add_argument(
+        "--batch-tables",
+        "-bt",
+        action="store_true",
+        help="Run the column validations of many tables in a few UNION ALL queries per connection instead of two queries per table.",
+    )
+    run_parser.add_argument(
+        "--batch-max-sql-length",
+        "-bmsl",
+        type=_check_positive,
+        default=consts.BATCH_MAX_SQL_LENGTH,
+        help="Maximum length of the SQL of each UNION ALL query with --batch-tables. Defaults to %(default)s.",
+    )
 
     get_parser = configs_subparsers.add_parser(
         "get", help="Get and print a validation config"
@@ -429,6 +509,14 @@ def _configure_connection_parser(subparsers):
     )
     connect_subparsers = connection_parser.add_subparsers(dest="connect_cmd")
     _ = connect_subparsers.add_parser("list", help="List your connections")
+    refresh_cache_parser = connect_subparsers.add_parser(
+        "refresh-cache", help="Remove cached table schemas and table lists"
+    )
+    refresh_cache_parser.add_argument(
+        "--connection-name",
+        "-c",
+        help="Name of the connection whose cached metadata is removed, defaults to all connections",
+    )
     add_parser = connect_subparsers.add_parser("add", help="Store a new connection")
     add_parser.add_argument(
         "--connection-name", "-c", help="Name of connection used as reference"
@@ -445,6 +533,12 @@ def _configure_connection_parser(subparsers):
         default=None,
         help="Project ID for the secret manager that stores the credentials",
     )
+    add_parser.add_argument(
+        "--fetch-size",
+        type=int,
+        default=None,
+        help="Stream query results of SQLAlchemy backends with server side cursors, fetching this many rows at a time",
+    )
     _configure_database_specific_parsers(add_parser)
 
 
@@ -504,6 +598,11 @@ def _configure_validate_parser(subparsers):
     )
     _configure_custom_query_parser(custom_query_parser)
 
+    profile_parser = validate_subparsers.add_parser(
+        "profile", help="Run a column profile validation"
+    )
+    _configure_profile_parser(profile_parser)
+
 
 def _configure_row_parser(
     parser,
@@ -627,6 +726,8 @@ def _configure_row_parser(
         optional_arguments,
         required_arguments,
         is_generate_partitions=is_generate_partitions,
+        include_source_shards=not is_generate_partitions,
+        include_source_cache=not is_generate_partitions,
     )
 
 
@@ -669,11 +770,36 @@ def _configure_column_parser(column_parser):
         "-std",
         help="Comma separated list of columns for standard deviation 'col_a,col_b' or * for all columns",
     )
+    optional_arguments.add_argument(
+        "--approx-count-distinct",
+        "-acd",
+        help="Comma separated list of columns for approximate count distinct 'col_a,col_b' or * for all columns",
+    )
+    optional_arguments.add_argument(
+        "--approx-median",
+        "-amed",
+        help="Comma separated list of columns for approximate median 'col_a,col_b' or * for all columns",
+    )
+    optional_arguments.add_argument(
+        "--approx-threshold",
+        "-ath",
+        type=threshold_float,
+        help=f"Minimum float max threshold for percent difference of approximate aggregates, defaults to {consts.DEFAULT_APPROX_THRESHOLD}",
+    )
     optional_arguments.add_argument(
         "--grouped-columns",
         "-gc",
         help="Comma separated list of columns to use in GroupBy 'col_a,col_b'",
     )
+    optional_arguments.add_argument(
+        "--group-buckets",
+        "-gbk",
+        type=_check_positive,
+        help=(
+            "Compare the grouped columns in this number of buckets of the first grouped column first, "
+            "and only fetch the groups of mismatching buckets. For high cardinality grouped columns."
+        ),
+    )
     optional_arguments.add_argument(
         "--exclude-columns",
         "-ec",
@@ -713,6 +839,46 @@ def _configure_column_parser(column_parser):
         action="store_true",
         help="Cast any int32 fields to int64 for large aggregations.",
     )
+    optional_arguments.add_argument(
+        "--batch-tables",
+        "-bt",
+        action="store_true",
+        help="Run the column validations of many tables in a few UNION ALL queries per connection instead of two queries per table.",
+    )
+    optional_arguments.add_argument(
+        "--batch-max-sql-length",
+        "-bmsl",
+        type=_check_positive,
+        default=consts.BATCH_MAX_SQL_LENGTH,
+        help="Maximum length of the SQL of each UNION ALL query with --batch-tables. Defaults to %(default)s.",
+    )
+    optional_arguments.add_argument(
+        "--max-aggregates",
+        "-mag",
+        type=_check_positive,
+        help=(
+            "The maximum number of aggregates in a single query. When there are more aggregates than this "
+            "the validation queries are split into concurrent sub-queries whose results are combined. "
+            "This option has engine specific defaults."
+        ),
+    )
+    optional_arguments.add_argument(
+        "--max-query-workers",
+        "-mqw",
+        type=_check_positive,
+        help=f"The maximum number of sub-queries of a split validation run concurrently on each side. Defaults to {consts.MAX_QUERY_WORKERS}.",
+    )
+    optional_arguments.add_argument(
+        "--slices",
+        "-sl",
+        type=_check_positive,
+        help="Split the aggregates of each table into this number of key range slices run concurrently and merged. Requires --slice-keys.",
+    )
+    optional_arguments.add_argument(
+        "--slice-keys",
+        "-sk",
+        help="Comma separated list of unique key columns 'col_a,col_b' used to slice the table with --slices.",
+    )
 
     # Group required arguments
     required_arguments = column_parser.add_argument_group("required arguments")
@@ -723,7 +889,95 @@ def _configure_column_parser(column_parser):
         required=True,
         help="Comma separated tables list in the form 'schema.table=target_schema.target_table'. Or shorthand schema.* for all tables.",
     )
-    _add_common_arguments(optional_arguments, required_arguments)
+    _add_common_arguments(
+        optional_arguments,
+        required_arguments,
+        include_source_shards=True,
+        include_source_cache=True,
+    )
+
+
+def _configure_profile_parser(profile_parser):
+    """Configure arguments to run column profile validations."""
+    # Group optional arguments
+    optional_arguments = profile_parser.add_argument_group("optional arguments")
+    optional_arguments.add_argument(
+        "--profile-columns",
+        "-pc",
+        default="*",
+        help="Comma separated list of columns to profile 'col_a,col_b' or * for all columns. Defaults to *.",
+    )
+    optional_arguments.add_argument(
+        "--histogram-buckets",
+        "-hb",
+        type=_check_positive,
+        help="Number of fixed width buckets of a histogram of numeric columns, between their source min and max.",
+    )
+    optional_arguments.add_argument(
+        "--aggregate-thresholds",
+        "-agth",
+        help="Comma separated thresholds of specific profile statistics 'avg=0.5,std=1.0', overriding --threshold.",
+    )
+    optional_arguments.add_argument(
+        "--approx-threshold",
+        "-ath",
+        type=threshold_float,
+        help=f"Minimum float max threshold for percent difference of approximate aggregates, defaults to {consts.DEFAULT_APPROX_THRESHOLD}",
+    )
+    optional_arguments.add_argument(
+        "--grouped-columns",
+        "-gc",
+        help="Comma separated list of columns to use in GroupBy 'col_a,col_b'",
+    )
+    optional_arguments.add_argument(
+        "--exclude-columns",
+        "-ec",
+        action="store_true",
+        help="Flag to indicate the list of columns should be excluded from the profile and not included.",
+    )
+    optional_arguments.add_argument(
+        "--threshold",
+        "-th",
+        type=threshold_float,
+        default=0.0,
+        help="Float max threshold for percent difference",
+    )
+    optional_arguments.add_argument(
+        "--filters",
+        "-filters",
+        type=get_filters,
+        default=[],
+        help="Filters in the format source_filter:target_filter",
+    )
+    optional_arguments.add_argument(
+        "--max-aggregates",
+        "-mag",
+        type=_check_positive,
+        help=(
+            "The maximum number of aggregates in a single query. When there are more aggregates than this "
+            "the validation queries are split into concurrent sub-queries whose results are combined. "
+            "This option has engine specific defaults."
+        ),
+    )
+    optional_arguments.add_argument(
+        "--max-query-workers",
+        "-mqw",
+        type=_check_positive,
+        help=f"The maximum number of sub-queries of a split validation run concurrently on each side. Defaults to {consts.MAX_QUERY_WORKERS}.",
+    )
+
+    # Group required arguments
+    required_arguments = profile_parser.add_argument_group("required arguments")
+    required_arguments.add_argument(
+        "--tables-list",
+        "-tbls",
+        default=None,
+        required=True,
+        help="Comma separated tables list in the form 'schema.table=target_schema.target_table'. Or shorthand schema.* for all tables.",
+    )
+    _add_common_arguments(
+        optional_arguments, required_arguments, include_source_cache=True
+    )
 
 
 def _configure_schema_parser(schema_parser):
@@ -865,6 +1119,22 @@ def _configure_custom_query_column_parser(custom_query_column_parser):
         "-std",
         help="Comma separated list of columns for standard deviation 'col_a,col_b' or * for all columns",
     )
+    optional_arguments.add_argument(
+        "--approx-count-distinct",
+        "-acd",
+        help="Comma separated list of columns for approximate count distinct 'col_a,col_b' or * for all columns",
+    )
+    optional_arguments.add_argument(
+        "--approx-median",
+        "-amed",
+        help="Comma separated list of columns for approximate median 'col_a,col_b' or * for all columns",
+    )
+    optional_arguments.add_argument(
+        "--approx-threshold",
+        "-ath",
+        type=threshold_float,
+        help=f"Minimum float max threshold for percent difference of approximate aggregates, defaults to {consts.DEFAULT_APPROX_THRESHOLD}",
+    )
     optional_arguments.add_argument(
         "--exclude-columns",
         "-ec",
@@ -909,6 +1179,23 @@ def _configure_custom_query_column_parser(custom_query_column_parser):
         "required arguments"
     )
 
+    optional_arguments.add_argument(
+        "--max-aggregates",
+        "-mag",
+        type=_check_positive,
+        help=(
+            "The maximum number of aggregates in a single query. When there are more aggregates than this "
+            "the validation queries are split into concurrent sub-queries whose results are combined. "
+            "This option has engine specific defaults."
+        ),
+    )
+    optional_arguments.add_argument(
+        "--max-query-workers",
+        "-mqw",
+        type=_check_positive,
+        help=f"The maximum number of sub-queries of a split validation run concurrently on each side. Defaults to {consts.MAX_QUERY_WORKERS}.",
+    )
+
     # Group for mutually exclusive source query arguments. Either must be supplied
     source_mutually_exclusive = required_arguments.add_mutually_exclusive_group(
         required=True
@@ -939,19 +1226,46 @@ def _configure_custom_query_column_parser(custom_query_column_parser):
         help="Target sql query",
     )
 
-    _add_common_arguments(optional_arguments, required_arguments)
+    _add_common_arguments(
+        optional_arguments,
+        required_arguments,
+        include_source_shards=True,
+        include_source_cache=True,
+    )
 
 
 def _add_common_arguments(
-    optional_arguments, required_arguments, is_generate_partitions=False
+    optional_arguments,
+    required_arguments,
+    is_generate_partitions=False,
+    include_source_shards=False,
+    include_source_cache=False,
 ):
     # Group all Required Arguments together
     required_arguments.add_argument(
         "--source-conn", "-sc", required=True, help="Source connection name"
     )
+    if include_source_shards:
+        optional_arguments.add_argument(
+            "--source-shards",
+            "-ssh",
+            help="Comma separated list of additional source connection names holding shards of the source table, which are merged and validated against the single target table.",
+        )
     required_arguments.add_argument(
         "--target-conn", "-tc", required=True, help="Target connection name"
     )
+    if include_source_cache:
+        optional_arguments.add_argument(
+            "--source-cache-ttl",
+            "-sct",
+            type=_check_positive,
+            help="Cache the source query results for this number of seconds, so that validations of the same source against other targets reuse them.",
+        )
+        optional_arguments.add_argument(
+            "--source-cache-token",
+            "-sctk",
+            help="Freshness token of cached source query results, e.g. a load timestamp. Results cached with another token are not reused.",
+        )
 
     # Optional arguments
     optional_arguments.add_argument(
@@ -966,6 +1280,17 @@ def _add_common_arguments(
         help="Path to SA key file for result handler output",
     )
     if not is_generate_partitions:
+        optional_arguments.add_argument(
+            "--skip-unchanged",
+            "-su",
+            action="store_true",
+            help=(
+                "Skip tables unchanged since their last successful validation, according to catalog metadata or file stats, "
+                "and report the results of that validation again. Postgres statistics counters lag committed changes by up "
+                "to about a second and a statistics reset invalidates stored fingerprints. Oracle tables are validated "
+                "unless their ALL_TAB_MODIFICATIONS row can be flushed and read."
+            ),
+        )
         optional_arguments.add_argument(
             "--config-file",
             "-c",
@@ -1023,6 +1348,9 @@ def get_connection_config_from_args(args):
     if args.connect_type == "Raw":
         return json.loads(args.json)
 
+    if getattr(args, consts.FETCH_SIZE, None):
+        config[consts.FETCH_SIZE] = getattr(args, consts.FETCH_SIZE)
+
     for field_obj in CONNECTION_SOURCE_FIELDS[args.connect_type]:
         field = field_obj[0]
         if getattr(args, field) is None:
@@ -1068,6 +1396,14 @@ def list_connections():
         logging.info(f"Connection Name: {conn_name} : {source_type}")
 
 
+def refresh_metadata_cache(connection_name=None):
+    """Remove the cached metadata of a saved connection, or of all connections."""
+    mgr = state_manager.StateManager()
+    connection = mgr.get_connection_config(connection_name) if connection_name else None
+    metadata_cache.clear_metadata_cache(mgr.get_metadata_cache_directory(), connection)
+    logging.info(f"Removed cached metadata of {connection_name or 'all connections'}")
+
+
 def get_connection(connection_name):
     """Return dict connection details for a specific connection."""
     mgr = state_manager.StateManager()
@@ -1133,6 +1469,19 @@ def get_labels(arg_labels):
     return labels
 
 
+def get_aggregate_thresholds(arg_thresholds: str) -> Dict[str, float]:
+    """Return dict of aggregate type to threshold from comma-separated key-value pairs."""
+    thresholds = {}
+    for pair in arg_thresholds.split(","):
+        kv = pair.split("=")
+        if len(kv) != 2:
+            raise ValueError(
+                "Aggregate thresholds must be comma-separated key-value pairs."
+            )
+        thresholds[kv[0].strip()] = threshold_float(kv[1])
+    return thresholds
+
+
 def get_filters(filter_value: str) -> List[Dict]:
     """Returns filters for source and target from --filters argument.
     A filter is the condition that is used in a SQL WHERE clause.
@@ -1389,7 +1738,7 @@ def get_pre_build_configs(args: Namespace, validate_cmd: str) -> List[Dict]:
 
     if validate_cmd == "Schema":
         config_type = consts.SCHEMA_VALIDATION
-    elif validate_cmd == "Column":
+    elif validate_cmd in ("Column", "Profile"):
         config_type = consts.COLUMN_VALIDATION
     elif validate_cmd == "Row":
         config_type = consts.ROW_VALIDATION
@@ -13,30 +13,129 @@
 # limitations under the License.
 
 
+import collections
 import copy
 import logging
-from typing import TYPE_CHECKING
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional
 import warnings
 
 import google.oauth2.service_account
 import ibis
+import ibis.expr.datatypes as dt
+import ibis.expr.schema as sch
 import pandas
+import sqlalchemy
 from google.cloud import bigquery
+from ibis.backends.base.sql.alchemy import BaseAlchemyBackend
+from ibis.backends.base.sql.alchemy.geospatial import geospatial_supported
 
-from data_validation import client_info, consts, exceptions
+from data_validation import client_info, consts, exceptions, metadata_cache
 from data_validation.secret_manager import SecretManagerBuilder
 from third_party.ibis.ibis_cloud_spanner.api import spanner_connect
+from third_party.ibis.ibis_file_system.api import file_system_connect
 from third_party.ibis.ibis_impala.api import impala_connect
 from third_party.ibis.ibis_mssql.api import mssql_connect
 from third_party.ibis.ibis_redshift.api import redshift_connect
 
 if TYPE_CHECKING:
-    import ibis.expr.schema as sch
     import ibis.expr.types as ir
 
 
 ibis.options.sql.default_limit = None
 
+_alchemy_fetch_from_cursor = BaseAlchemyBackend.fetch_from_cursor
+
+
+def _get_dbapi_cursor(cursor):
+    """Return the DB-API cursor of a SQLAlchemy result, or None if SQLAlchemy changes its rows."""
+    processors = getattr(getattr(cursor, "_metadata", None), "_processors", None)
+    if (
+        processors is None
+        or any(processors)
+        # Buffering strategies hold rows which were already fetched from the DB-API cursor
+        or type(getattr(cursor, "cursor_strategy", None))
+        is not sqlalchemy.engine.cursor.CursorFetchStrategy
+    ):
+        return None
+    return cursor.cursor
+
+
+def _get_records(rows: list) -> list:
+    if rows and not isinstance(rows[0], tuple):
+        return [tuple(_) for _ in rows]
+    return rows
+
+
+def _fetch_from_cursor(self, cursor, schema: "sch.Schema") -> pandas.DataFrame:
+    """Fetch the rows of SQLAlchemy backends straight from the DB-API cursor.
+
+    Wrapping each row in a SQLAlchemy Row object takes longer than fetching the rows. The
+    rows are only passed to the SQLAlchemy result when it has result processors converting
+    the values of a column. Clients with a fetch size stream their results instead.
+    """
+    fetch_size = getattr(self, "_fetch_size", None)
+    if isinstance(fetch_size, int) and fetch_size > 0:
+        return _fetch_batches_from_cursor(self, cursor, schema, fetch_size)
+    dbapi_cursor = _get_dbapi_cursor(cursor)
+    if dbapi_cursor is None:
+        return _alchemy_fetch_from_cursor(self, cursor, schema)
+    df = pandas.DataFrame.from_records(
+        _get_records(dbapi_cursor.fetchall()), columns=schema.names, coerce_float=True
+    )
+    df = schema.apply_to(df)
+    if not df.empty and geospatial_supported:
+        return self._to_geodataframe(df, schema)
+    return df
+
+
+def _iter_fetched_batches(
+    cursor, schema: "sch.Schema", fetch_size: int
+) -> Iterator[pandas.DataFrame]:
+    """Yield DataFrames of at most fetch_size rows of a SQLAlchemy result."""
+    rows_cursor = _get_dbapi_cursor(cursor) or cursor
+    while rows := rows_cursor.fetchmany(fetch_size):
+        yield schema.apply_to(
+            pandas.DataFrame.from_records(
+                _get_records(rows), columns=schema.names, coerce_float=True
+            )
+        )
+
+
+def _fetch_batches_from_cursor(
+    self, cursor, schema: "sch.Schema", fetch_size: int
+) -> pandas.DataFrame:
+    """Fetch a streamed SQLAlchemy result in batches of fetch_size rows.
+
+    Only one batch of rows is held as Python objects, the batches are typed with the query
+    schema as they arrive and the typed batches are concatenated.
+    """
+    batches = list(_iter_fetched_batches(cursor, schema, fetch_size))
+    if not batches:
+        df = schema.apply_to(
+            pandas.DataFrame.from_records([], columns=schema.names, coerce_float=True)
+        )
+    elif len(batches) == 1:
+        df = batches[0]
+    else:
+        df = pandas.concat(batches, ignore_index=True)
+        # Batches may infer different dtypes for a column, e.g. a batch of NULLs, these
+        # columns are inferred again from all their values.
+        for name in schema.names:
+            if len({str(_[name].dtype) for _ in batches}) > 1:
+                values = df[name].astype(object).where(df[name].notna(), None)
+                column_df = pandas.DataFrame.from_records(
+                    list(zip(values)), columns=[name], coerce_float=True
+                )
+                df[name] = sch.Schema({name: schema[name]}).apply_to(column_df)[name]
+    if not df.empty and geospatial_supported:
+        return self._to_geodataframe(df, schema)
+    return df
+
+
+BaseAlchemyBackend.fetch_from_cursor = _fetch_from_cursor
+
 # Filter Ibis MySQL error when loading client.table()
 warnings.filterwarnings(
     "ignore",
@@ -54,6 +153,149 @@ IBIS_ALCHEMY_BACKENDS = [
     "snowflake",
 ]
 
+# Catalog queries returning the row count recorded in table statistics, used to avoid a full
+# COUNT(*) scan when an estimate is good enough. A NULL, zero or negative value means that
+# statistics have not been gathered for the table.
+ROW_COUNT_ESTIMATE_SQL = {
+    "postgres": (
+        "SELECT CAST(c.reltuples AS BIGINT) FROM pg_catalog.pg_class c "
+        "JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace "
+        "WHERE n.nspname = :schema_name AND c.relname = :table_name"
+    ),
+    "redshift": (
+        'SELECT estimated_visible_rows FROM svv_table_info WHERE "schema" = :schema_name AND "table" = :table_name'
+    ),
+    "mysql": (
+        "SELECT table_rows FROM information_schema.tables "
+        "WHERE table_schema = :schema_name AND table_name = :table_name"
+    ),
+    "oracle": (
+        "SELECT num_rows FROM all_tables "
+        "WHERE owner = UPPER(:schema_name) AND table_name = UPPER(:table_name)"
+    ),
+    "mssql": (
+        "SELECT SUM(p.rows) FROM sys.partitions p "
+        "JOIN sys.tables t ON t.object_id = p.object_id "
+        "JOIN sys.schemas s ON s.schema_id = t.schema_id "
+        "WHERE s.name = :schema_name AND t.name = :table_name AND p.index_id IN (0, 1)"
+    ),
+    "db2": (
+        "SELECT card FROM syscat.tables "
+        "WHERE tabschema = UPPER(:schema_name) AND tabname = UPPER(:table_name)"
+    ),
+    "snowflake": (
+        "SELECT row_count FROM information_schema.tables "
+        "WHERE table_schema = UPPER(:schema_name) AND table_name = UPPER(:table_name)"
+    ),
+    # Teradata does not go through SQLAlchemy, the names are inlined as string literals.
+    "teradata": (
+        "SELECT MAX(RowCount) FROM DBC.TableStatsV "
+        "WHERE DatabaseName = '{schema_name}' AND TableName = '{table_name}'"
+    ),
+}
+
+# Catalog queries returning a value which changes whenever the data of a table changes
+TABLE_FINGERPRINT_SQL = {
+    # The counters are cleared by pg_stat_reset and server crashes, the reset and server start
+    # times are part of the fingerprint so that counters which happen to match after a reset
+    # do not match a stored fingerprint.
+    "postgres": (
+        "SELECT CONCAT_WS(':', pg_postmaster_start_time(), d.stats_reset, "
+        "s.n_tup_ins, s.n_tup_upd, s.n_tup_del) "
+        "FROM pg_stat_user_tables s JOIN pg_stat_database d ON d.datname = current_database() "
+        "WHERE s.schemaname = :schema_name AND s.relname = :table_name"
+    ),
+    # Tables without a modifications row, e.g. after statistics were gathered, have no
+    # fingerprint, as the last analyzed time alone does not change with DML.
+    "oracle": (
+        "SELECT TO_CHAR(t.last_analyzed, 'YYYY-MM-DD HH24:MI:SS') || ':' || m.inserts "
+        "|| ':' || m.updates || ':' || m.deletes || ':' || m.truncated "
+        "|| ':' || TO_CHAR(m.timestamp, 'YYYY-MM-DD HH24:MI:SS') "
+        "FROM all_tables t JOIN all_tab_modifications m "
+        "ON m.table_owner = t.owner AND m.table_name = t.table_name AND m.partition_name IS NULL "
+        "WHERE t.owner = UPPER(:schema_name) AND t.table_name = UPPER(:table_name)"
+    ),
+    "snowflake": (
+        "SELECT TO_VARCHAR(last_altered) || ':' || row_count FROM information_schema.tables "
+        "WHERE table_schema = UPPER(:schema_name) AND table_name = UPPER(:table_name)"
+    ),
+}
+
+# Statements run before TABLE_FINGERPRINT_SQL so that it sees the latest changes.
+# ALL_TAB_MODIFICATIONS is only filled when the monitoring information is flushed.
+TABLE_FINGERPRINT_FLUSH_SQL = {
+    "oracle": "BEGIN DBMS_STATS.FLUSH_DATABASE_MONITORING_INFO; END;",
+}
+
+# Catalog queries returning the table name, column name, data type, precision, scale and
+# nullability of every column in a schema, so that the schemas of many tables are read with
+# a single query instead of reflecting each table.
+TABLE_COLUMNS_SQL = {
+    "postgres": (
+        "SELECT table_name, column_name, data_type, numeric_precision, numeric_scale, is_nullable "
+        "FROM information_schema.columns WHERE table_schema = :schema_name "
+        "ORDER BY table_name, ordinal_position"
+    ),
+    "redshift": (
+        "SELECT table_name, column_name, data_type, numeric_precision, numeric_scale, is_nullable "
+        "FROM information_schema.columns WHERE table_schema = :schema_name "
+        "ORDER BY table_name, ordinal_position"
+    ),
+    "mssql": (
+        "SELECT table_name, column_name, data_type, numeric_precision, numeric_scale, is_nullable "
+        "FROM information_schema.columns WHERE table_schema = :schema_name "
+        "ORDER BY table_name, ordinal_position"
+    ),
+    "snowflake": (
+        "SELECT table_name, column_name, data_type, numeric_precision, numeric_scale, is_nullable "
+        "FROM information_schema.columns WHERE table_schema = UPPER(:schema_name) "
+        "ORDER BY table_name, ordinal_position"
+    ),
+    "oracle": (
+        "SELECT table_name, column_name, data_type, data_precision, data_scale, nullable "
+        "FROM all_tab_columns WHERE owner = UPPER(:schema_name) "
+        "ORDER BY table_name, column_id"
+    ),
+    # Teradata does not go through SQLAlchemy, the names are inlined as string literals.
+    "teradata": (
+        "SELECT TableName, ColumnName, ColumnType, DecimalTotalDigits, DecimalFractionalDigits, Nullable "
+        "FROM DBC.ColumnsV WHERE DatabaseName = '{schema_name}' "
+        "ORDER BY TableName, ColumnId"
+    ),
+    "bigquery": (
+        "SELECT table_name, column_name, data_type, NULL, NULL, is_nullable "
+        "FROM `{dataset}`.INFORMATION_SCHEMA.COLUMNS "
+        "ORDER BY table_name, ordinal_position"
+    ),
+}
+
+# Catalog queries returning the schema and name of every table and view in a list of schemas,
+# matching the names listed by the SQLAlchemy inspector, so that a catalog is listed with a
+# single query instead of one query per schema. Views are listed after tables as they are by
+# list_tables.
+SCHEMA_TABLES_SQL = {
+    "postgres": (
+        "SELECT n.nspname, c.relname FROM pg_class c "
+        "JOIN pg_namespace n ON n.oid = c.relnamespace "
+        "WHERE c.relkind IN ('r', 'p', 'v', 'm') AND n.nspname IN :schema_names "
+        "ORDER BY n.nspname, c.relkind IN ('v', 'm'), c.relname"
+    ),
+    "oracle": (
+        "SELECT owner, table_name, 0 AS is_view FROM all_tables "
+        "WHERE nvl(tablespace_name, 'no tablespace') NOT IN ('SYSTEM', 'SYSAUX') "
+        "AND iot_name IS NULL AND duration IS NULL AND owner IN :schema_names "
+        "UNION ALL SELECT owner, view_name, 1 FROM all_views WHERE owner IN :schema_names "
+        "ORDER BY 1, 3, 2"
+    ),
+}
+# Oracle limits IN lists to 1000 expressions
+SCHEMA_TABLES_BATCH_SIZE = 1000
+
+# Parameterised BigQuery types, e.g. NUMERIC(10, 2) or STRING(20)
+BIGQUERY_TYPE_PATTERN = re.compile(r"^(\w+)(?:\((\d+)(?:,\s*(\d+))?\))?$")
+# Time zone suffixes of SQL timestamp types, e.g. TIMESTAMP(6) WITH LOCAL TIME ZONE
+TIME_ZONE_SUFFIX_PATTERN = re.compile(r"\s+with(out)?\s+(local\s+)?time\s+zone$", re.I)
+
 
 def _raise_missing_client_error(msg):
     def get_client_call(*args, **kwargs):
@@ -115,26 +357,14 @@ def get_bigquery_client(project_id, dataset_id="", credentials=None):
 
 
 def get_pandas_client(table_name, file_path, file_type):
-    """Return pandas client and env with file loaded into DataFrame
+    """Return pandas client reading a file as a table when it is first queried
 
     table_name (str): Table name to use as reference for file data
-    file_path (str): The local, s3, or GCS file path to the data
+    file_path (str): The local, s3, or GCS file path to the data, a directory of
+        partitioned files or a glob of files
     file_type (str): The file type of the file (csv, json, orc or parquet)
     """
-    if file_type == "csv":
-        df = pandas.read_csv(file_path)
-    elif file_type == "json":
-        df = pandas.read_json(file_path)
-    elif file_type == "orc":
-        df = pandas.read_orc(file_path)
-    elif file_type == "parquet":
-        df = pandas.read_parquet(file_path)
-    else:
-        raise ValueError(f"Unknown Pandas File Type: {file_type}")
-
-    pandas_client = ibis.pandas.connect({table_name: df})
-
-    return pandas_client
+    return file_system_connect(table_name, file_path, file_type)
 
 
 def is_oracle_client(client):
@@ -145,6 +375,11 @@ def is_oracle_client(client):
         return False
 
 
+def _get_metadata_cache(client) -> Optional[metadata_cache.MetadataCache]:
+    cache = getattr(client, "_metadata_cache", None)
+    return cache if isinstance(cache, metadata_cache.MetadataCache) else None
+
+
 def get_ibis_table(client, schema_name, table_name, database_name=None):
     """Return Ibis Table for Supplied Client.
 
@@ -153,6 +388,19 @@ def get_ibis_table(client, schema_name, table_name, database_name=None):
     table_name (str): Table name of table object
     database_name (str): Database name (generally default is used)
     """
+    cache = _get_metadata_cache(client)
+    if cache:
+        # Table expressions hold reflected SQLAlchemy tables and are only memoized in process
+        return cache.get_or_load(
+            "table",
+            (schema_name, table_name, database_name),
+            lambda: _get_ibis_table(client, schema_name, table_name, database_name),
+            persist=False,
+        )
+    return _get_ibis_table(client, schema_name, table_name, database_name)
+
+
+def _get_ibis_table(client, schema_name, table_name, database_name=None):
     if client.name in [
         "oracle",
         "postgres",
@@ -184,6 +432,22 @@ def get_ibis_table_schema(client, schema_name: str, table_name: str) -> "sch.Sch
     table_name (str): Table name of table object
     database_name (str): Database name (generally default is used)
     """
+    cached_schemas = getattr(client, "_table_schemas", {}).get(schema_name) or {}
+    if table_name and table_name.casefold() in cached_schemas:
+        return cached_schemas[table_name.casefold()]
+    cache = _get_metadata_cache(client)
+    if cache:
+        return cache.get_or_load(
+            "schema",
+            (schema_name, table_name),
+            lambda: _get_ibis_table_schema(client, schema_name, table_name),
+            dump=metadata_cache.schema_to_json,
+            restore=metadata_cache.schema_from_json,
+        )
+    return _get_ibis_table_schema(client, schema_name, table_name)
+
+
+def _get_ibis_table_schema(client, schema_name: str, table_name: str) -> "sch.Schema":
     if client.name in IBIS_ALCHEMY_BACKENDS:
         return client.table(table_name, schema=schema_name).schema()
     else:
@@ -202,6 +466,13 @@ def get_ibis_query_schema(client, query_str) -> "sch.Schema":
 
 def list_schemas(client):
     """Return a list of schemas in the DB."""
+    cache = _get_metadata_cache(client)
+    if cache:
+        return cache.get_or_load("schemas", (), lambda: _list_schemas(client))
+    return _list_schemas(client)
+
+
+def _list_schemas(client):
     if hasattr(client, "list_databases"):
         try:
             return client.list_databases()
@@ -213,42 +484,384 @@ def list_schemas(client):
 
 def list_tables(client, schema_name):
     """Return a list of tables in the DB schema."""
+    cache = _get_metadata_cache(client)
+    if cache:
+        return cache.get_or_load(
+            "tables", (schema_name,), lambda: _list_tables(client, schema_name)
+        )
+    return _list_tables(client, schema_name)
+
+
+def _list_tables(client, schema_name):
     if client.name in ["db2", "mssql", "redshift", "snowflake"]:
         return client.list_tables()
     return client.list_tables(database=schema_name)
 
 
+def _list_schema_tables(
+    client, schema_names: List[str]
+) -> Optional[Dict[str, List[str]]]:
+    """Return the tables of each schema, read with a single catalog query, or None if unsupported."""
+    if client.name not in SCHEMA_TABLES_SQL or None in schema_names:
+        return None
+    dialect = client.con.dialect
+    normalize_names = dialect.requires_name_normalize
+    catalog_names = {
+        (dialect.denormalize_name(_) if normalize_names else _): _ for _ in schema_names
+    }
+    schema_tables = {_: [] for _ in schema_names}
+    sql = sqlalchemy.text(SCHEMA_TABLES_SQL[client.name]).bindparams(
+        sqlalchemy.bindparam("schema_names", expanding=True)
+    )
+    names = list(catalog_names)
+    try:
+        with client.begin() as con:
+            for i in range(0, len(names), SCHEMA_TABLES_BATCH_SIZE):
+                rows = con.execute(
+                    sql, {"schema_names": names[i : i + SCHEMA_TABLES_BATCH_SIZE]}
+                ).fetchall()
+                for row in rows:
+                    table_name = (
+                        dialect.normalize_name(row[1]) if normalize_names else row[1]
+                    )
+                    schema_tables[catalog_names[row[0]]].append(table_name)
+    except Exception as e:
+        logging.warning(f"Catalog tables unavailable: {e}")
+        return None
+    return schema_tables
+
+
+def _list_tables_or_none(client, schema_name):
+    try:
+        return list_tables(client, schema_name)
+    except Exception as e:
+        logging.warning(f"List Tables Error: {schema_name} -> {e}")
+        return None
+
+
 def get_all_tables(client, allowed_schemas=None):
     """Return a list of tuples with database and table names.
 
     client (IbisClient): Client to use for tables
     allowed_schemas (List[str]): List of schemas to pull.
+
+    The tables of all schemas are listed with a single catalog query where the engine supports
+    one, otherwise the schemas are listed concurrently.
     """
-    table_objs = []
-    schemas = list_schemas(client)
-    for schema_name in schemas:
-        if allowed_schemas and schema_name not in allowed_schemas:
-            continue
-        try:
-            tables = list_tables(client, schema_name)
-        except Exception as e:
-            logging.warning(f"List Tables Error: {schema_name} -> {e}")
-            continue
+    schemas = [
+        _ for _ in list_schemas(client) if not allowed_schemas or _ in allowed_schemas
+    ]
+    if not schemas:
+        return []
+
+    cache = _get_metadata_cache(client)
+    schema_tables = None
+    if len(schemas) > 1:
+        if cache:
+            schema_tables = cache.get_or_load(
+                "schema_tables",
+                tuple(schemas),
+                lambda: _list_schema_tables(client, schemas),
+            )
+        else:
+            schema_tables = _list_schema_tables(client, schemas)
+    if schema_tables is not None:
+        if cache:
+            # Share the tables with later list_tables calls of the same schemas
+            for schema_name, tables in schema_tables.items():
+                cache.get_or_load("tables", (schema_name,), lambda: tables)
+        tables_lists = [schema_tables[_] for _ in schemas]
+    elif len(schemas) == 1:
+        tables_lists = [_list_tables_or_none(client, schemas[0])]
+    else:
+        with ThreadPoolExecutor(
+            max_workers=min(consts.LIST_TABLES_MAX_WORKERS, len(schemas))
+        ) as executor:
+            tables_lists = list(
+                executor.map(lambda _: _list_tables_or_none(client, _), schemas)
+            )
 
-        for table_name in tables:
+    table_objs = []
+    for schema_name, tables in zip(schemas, tables_lists):
+        for table_name in tables or []:
             table_objs.append((schema_name, table_name))
 
     return table_objs
 
 
+def get_table_row_count_estimate(
+    client, schema_name: str, table_name: str
+) -> Optional[int]:
+    """Return the row count of a table from catalog statistics, without scanning the table.
+
+    client (IbisClient): Client to use for the catalog query
+    schema_name (str): Schema name of table object
+    table_name (str): Table name of table object
+
+    Returns None when the engine has no supported statistics or they have not been gathered,
+    in which case callers should fall back to an exact count.
+    """
+    if not schema_name or not table_name:
+        return None
+    try:
+        if client.name == "bigquery":
+            dataset = (
+                schema_name
+                if "." in schema_name
+                else f"{client.data_project}.{schema_name}"
+            )
+            row_count = client.client.get_table(f"{dataset}.{table_name}").num_rows
+        elif client.name == "teradata":
+            sql = ROW_COUNT_ESTIMATE_SQL["teradata"].format(
+                schema_name=schema_name.replace("'", "''"),
+                table_name=table_name.replace("'", "''"),
+            )
+            df = client._execute(sql, results=True)
+            row_count = df.values[0][0] if len(df) else None
+        elif client.name in ROW_COUNT_ESTIMATE_SQL:
+            with client.begin() as con:
+                row_count = con.execute(
+                    sqlalchemy.text(ROW_COUNT_ESTIMATE_SQL[client.name]),
+                    {"schema_name": schema_name, "table_name": table_name},
+                ).scalar()
+        else:
+            return None
+    except Exception as e:
+        logging.warning(
+            f"Row count statistics unavailable for {schema_name}.{table_name}: {e}"
+        )
+        return None
+
+    if row_count is None or pandas.isna(row_count) or row_count <= 0:
+        return None
+    return int(row_count)
+
+
+def get_table_fingerprint(client, schema_name: str, table_name: str) -> Optional[str]:
+    """Return a value from catalog metadata which changes whenever the data of a table changes.
+
+    client (IbisClient): Client to use for the catalog query
+    schema_name (str): Schema name of table object
+    table_name (str): Table name of table object
+
+    Returns None when the engine has no supported change metadata, or when it cannot tell
+    whether the table changed, in which case the table is validated.
+    """
+    if not schema_name or not table_name:
+        return None
+    try:
+        if client.name == "bigquery":
+            dataset = (
+                schema_name
+                if "." in schema_name
+                else f"{client.data_project}.{schema_name}"
+            )
+            table = client.client.get_table(f"{dataset}.{table_name}")
+            fingerprint = f"{table.modified.isoformat()}:{table.num_rows}"
+        elif client.name in TABLE_FINGERPRINT_SQL:
+            with client.begin() as con:
+                if client.name in TABLE_FINGERPRINT_FLUSH_SQL:
+                    con.execute(
+                        sqlalchemy.text(TABLE_FINGERPRINT_FLUSH_SQL[client.name])
+                    )
+                fingerprint = con.execute(
+                    sqlalchemy.text(TABLE_FINGERPRINT_SQL[client.name]),
+                    {"schema_name": schema_name, "table_name": table_name},
+                ).scalar()
+        else:
+            return None
+    except Exception as e:
+        logging.warning(
+            f"Change metadata unavailable for {schema_name}.{table_name}: {e}"
+        )
+        return None
+
+    return str(fingerprint) if fingerprint is not None else None
+
+
+def _get_sqlalchemy_dtype(
+    dialect, data_type: str, precision, scale, nullable: bool
+) -> Optional[dt.DataType]:
+    """Return the Ibis type of a catalog column type, mirroring SQLAlchemy reflection."""
+    type_name = re.sub(r"\(\d+\)", "", data_type).strip()
+    time_zone = TIME_ZONE_SUFFIX_PATTERN.search(type_name)
+    type_class = None
+    for name in (type_name, TIME_ZONE_SUFFIX_PATTERN.sub("", type_name)):
+        for candidate in (name, name.lower(), name.upper()):
+            type_class = type_class or dialect.ischema_names.get(candidate)
+    if type_class is None:
+        return None
+
+    if dialect.name == "oracle" and type_name.upper() == "NUMBER":
+        if precision is None and scale == 0:
+            satype = sqlalchemy.types.INTEGER()
+        else:
+            satype = type_class(precision, scale)
+    elif issubclass(type_class, sqlalchemy.types.Float):
+        # Only SQL Server reports the binary precision that tells REAL from FLOAT
+        satype = type_class(precision) if dialect.name == "mssql" else type_class()
+    elif issubclass(type_class, sqlalchemy.types.Numeric):
+        satype = type_class(precision, scale)
+    elif issubclass(type_class, sqlalchemy.types.DateTime):
+        satype = type_class(timezone=bool(time_zone and not time_zone.group(1)))
+    else:
+        satype = type_class()
+    return dt.dtype(dialect, satype, nullable=nullable)
+
+
+def _get_bigquery_dtype(data_type: str, nullable: bool) -> Optional[dt.DataType]:
+    """Return the Ibis type of a BigQuery INFORMATION_SCHEMA column type."""
+    match = BIGQUERY_TYPE_PATTERN.match(data_type)
+    if not match:
+        # ARRAY and STRUCT types are left to the table metadata
+        return None
+    type_name, precision, scale = match.groups()
+    field = bigquery.SchemaField(
+        "column",
+        type_name,
+        mode="NULLABLE" if nullable else "REQUIRED",
+        precision=int(precision)
+        if precision and type_name.endswith("NUMERIC")
+        else None,
+        scale=int(scale) if scale and type_name.endswith("NUMERIC") else None,
+    )
+    dtype = dt.dtype(field)
+    return dtype if isinstance(dtype, dt.DataType) else None
+
+
+def _get_teradata_dtype(
+    data_type: str, precision, scale, nullable: bool
+) -> Optional[dt.DataType]:
+    """Return the Ibis type of a Teradata DBC.ColumnsV column type."""
+    from third_party.ibis.ibis_teradata.datatypes import TeradataTypeTranslator
+
+    if not data_type:
+        # Columns of views have no type in DBC.ColumnsV
+        return None
+    col_data = {"Type": data_type, "Nullable": "Y" if nullable else "N"}
+    if precision is not None:
+        col_data["DecimalTotalDigits"] = precision
+    if scale is not None:
+        col_data["DecimalFractionalDigits"] = scale
+    return TeradataTypeTranslator.to_ibis(col_data)
+
+
+def get_schema_table_schemas(
+    client, schema_name: str
+) -> Optional[Dict[str, "sch.Schema"]]:
+    """Return the Ibis schemas of all tables in a schema, read with a single catalog query.
+
+    client (IbisClient): Client to use for the catalog query
+    schema_name (str): Schema name of the tables
+
+    The schemas are keyed on the casefolded table name. Tables with a column type which cannot
+    be mapped from the catalog, or whose name only differs in case from another table, are left
+    out, so that callers fall back to reflecting them.
+    Returns None when the engine has no supported catalog query.
+    """
+    if not schema_name or client.name not in TABLE_COLUMNS_SQL:
+        return None
+    dialect = None
+    try:
+        if client.name == "bigquery":
+            dataset = (
+                schema_name
+                if "." in schema_name
+                else f"{client.data_project}.{schema_name}"
+            )
+            rows = client.client.query(
+                TABLE_COLUMNS_SQL["bigquery"].format(dataset=dataset)
+            ).result()
+        elif client.name == "teradata":
+            sql = TABLE_COLUMNS_SQL["teradata"].format(
+                schema_name=schema_name.replace("'", "''")
+            )
+            rows = client._execute(sql, results=True).itertuples(index=False)
+        else:
+            dialect = client.con.dialect
+            with client.begin() as con:
+                rows = con.execute(
+                    sqlalchemy.text(TABLE_COLUMNS_SQL[client.name]),
+                    {"schema_name": schema_name},
+                ).fetchall()
+    except Exception as e:
+        logging.warning(f"Catalog schemas unavailable for {schema_name}: {e}")
+        return None
+
+    normalize_names = dialect is not None and dialect.requires_name_normalize
+    table_columns = {}
+    for table_name, column_name, data_type, precision, scale, nullable in rows:
+        table_name, column_name = table_name.rstrip(), column_name.rstrip()
+        if normalize_names:
+            table_name = dialect.normalize_name(table_name)
+            column_name = dialect.normalize_name(column_name)
+        precision = None if pandas.isna(precision) else int(precision)
+        scale = None if pandas.isna(scale) else int(scale)
+        nullable = str(nullable).upper().startswith("Y")
+        try:
+            if client.name == "bigquery":
+                dtype = _get_bigquery_dtype(data_type, nullable)
+            elif client.name == "teradata":
+                dtype = _get_teradata_dtype(data_type, precision, scale, nullable)
+            else:
+                dtype = _get_sqlalchemy_dtype(
+                    dialect, data_type, precision, scale, nullable
+                )
+        except Exception:
+            dtype = None
+        table_columns.setdefault(table_name, []).append((column_name, dtype))
+
+    casefold_counts = collections.Counter(_.casefold() for _ in table_columns)
+    return {
+        table_name.casefold(): sch.Schema(dict(columns))
+        for table_name, columns in table_columns.items()
+        if all(dtype is not None for _, dtype in columns)
+        and casefold_counts[table_name.casefold()] == 1
+    }
+
+
+def prefetch_table_schemas(client, schema_name: str) -> int:
+    """Cache the schemas of all tables in a schema on the client for get_ibis_table_schema.
+
+    Returns the number of table schemas cached.
+    """
+    table_schemas = get_schema_table_schemas(client, schema_name)
+    if not table_schemas:
+        return 0
+    if not hasattr(client, "_table_schemas"):
+        client._table_schemas = {}
+    client._table_schemas[schema_name] = table_schemas
+    return len(table_schemas)
+
+
+def set_fetch_size(client, fetch_size: int):
+    """Stream the query results of a SQLAlchemy backend, fetching fetch_size rows at a time.
+
+    Queries run with server side cursors where the driver supports them, i.e. named cursors
+    for Postgres and Redshift and SSCursor for MySQL, and Oracle fetches fetch_size rows per
+    round trip. Other backends keep fetching whole results.
+    """
+    if client.name not in IBIS_ALCHEMY_BACKENDS:
+        logging.warning(f"Ignoring fetch size of {client.name} connection")
+        return
+    client._fetch_size = fetch_size
+    client.con = client.con.execution_options(
+        stream_results=True, max_row_buffer=fetch_size
+    )
+    if client.name == "oracle":
+        client.con.dialect.arraysize = fetch_size
+
+
 def get_data_client(connection_config):
     """Return DataClient client from given configuration"""
+    cache = metadata_cache.get_metadata_cache(connection_config)
     connection_config = copy.deepcopy(connection_config)
     source_type = connection_config.pop(consts.SOURCE_TYPE)
     secret_manager_type = connection_config.pop(consts.SECRET_MANAGER_TYPE, None)
     secret_manager_project_id = connection_config.pop(
         consts.SECRET_MANAGER_PROJECT_ID, None
     )
+    fetch_size = connection_config.pop(consts.FETCH_SIZE, None)
 
     decrypted_connection_config = {}
     if secret_manager_type is not None:
@@ -281,6 +894,9 @@ def get_data_client(connection_config):
     try:
         data_client = CLIENT_LOOKUP[source_type](**decrypted_connection_config)
         data_client._source_type = source_type
+        data_client._metadata_cache = cache
+        if fetch_size:
+            set_fetch_size(data_client, int(fetch_size))
     except Exception as e:
         msg = 'Connection Type "{source_type}" could not connect: {error}'.format(
             source_type=source_type, error=str(e)
@@ -305,6 +921,11 @@ def get_max_column_length(client):
     return 128
 
 
+def get_max_aggregates(client) -> Optional[int]:
+    """Return the default maximum number of aggregates in a single query of a client, if any."""
+    return consts.MAX_AGGREGATES_DEFAULTS.get(client.name)
+
+
 def get_max_in_list_size(client, in_list_over_expressions=False):
     if client.name == "snowflake":
         if in_list_over_expressions:
@@ -20,9 +20,10 @@ from typing import TYPE_CHECKING, Optional, Union, List, Dict
 
 import google.oauth2.service_account
 import ibis.expr.datatypes as dt
+import pandas
 import yaml
 
-from data_validation import clients, consts, gcs_helper, state_manager
+from data_validation import clients, consts, gcs_helper, result_cache, state_manager
 from data_validation.result_handlers.bigquery import BigQueryResultHandler
 from data_validation.result_handlers.text import TextResultHandler
 from data_validation.validation_builder import ValidationBuilder
@@ -38,6 +39,7 @@ class ConfigManager(object):
     _state_manager = None
     source_client = None
     target_client = None
+    _source_shard_clients = None
 
     def __init__(self, config, source_client=None, target_client=None, verbose=False):
         """Initialize a ConfigManager client which supplies the
@@ -66,6 +68,9 @@ class ConfigManager(object):
         if self.validation_type not in consts.CONFIG_TYPES:
             raise ValueError(f"Unknown Configuration Type: {self.validation_type}")
         self._comparison_max_col_length = None
+        self._validation_builder = None
+        self._validation_builder_config = None
+        self._calculated_tables = {}
 
     @property
     def config(self):
@@ -94,6 +99,64 @@ class ConfigManager(object):
 
         return self._target_conn
 
+    @property
+    def source_shards(self) -> List[str]:
+        """Return the connection names of the additional source shards."""
+        return self._config.get(consts.CONFIG_SOURCE_SHARDS, [])
+
+    def append_source_shards(self, source_shards: List[str]):
+        """Append the connection names of additional source shards to existing config."""
+        self._config[consts.CONFIG_SOURCE_SHARDS] = self.source_shards + source_shards
+
+    def get_source_shard_clients(self) -> list:
+        """Return the source client followed by the clients of the additional source shards."""
+        if self._source_shard_clients is None:
+            self._source_shard_clients = [self.source_client] + [
+                clients.get_data_client(
+                    self._state_manager.get_connection_config(conn_name)
+                )
+                for conn_name in self.source_shards
+            ]
+        return self._source_shard_clients
+
+    @property
+    def source_cache_ttl(self) -> Optional[int]:
+        """Return the number of seconds source query results are cached for."""
+        return self._config.get(consts.CONFIG_SOURCE_CACHE_TTL)
+
+    @property
+    def source_cache_token(self) -> Optional[str]:
+        """Return the freshness token of cached source query results."""
+        return self._config.get(consts.CONFIG_SOURCE_CACHE_TOKEN)
+
+    def append_source_cache(self, ttl: int, token: str = None):
+        """Append the source result cache TTL and freshness token to existing config."""
+        self._config[consts.CONFIG_SOURCE_CACHE_TTL] = ttl
+        self._config[consts.CONFIG_SOURCE_CACHE_TOKEN] = token
+
+    @property
+    def skip_unchanged(self) -> bool:
+        """Return True if validations of tables unchanged since their last successful run are skipped."""
+        return bool(self._config.get(consts.CONFIG_SKIP_UNCHANGED, False))
+
+    def append_skip_unchanged(self, skip_unchanged: bool):
+        """Append skip_unchanged to existing config."""
+        self._config[consts.CONFIG_SKIP_UNCHANGED] = skip_unchanged
+
+    def get_source_result_cache(self) -> Optional[result_cache.ResultCache]:
+        """Return the cache of source query results, or None if results are not cached."""
+        if not self.source_cache_ttl:
+            return None
+        if self._state_manager.file_system != state_manager.FileSystem.LOCAL:
+            logging.warning(
+                "Source results are only cached under a local %s directory",
+                consts.ENV_DIRECTORY_VAR,
+            )
+            return None
+        return result_cache.ResultCache(
+            self._state_manager.get_result_cache_directory(), self.source_cache_ttl
+        )
+
     def close_client_connections(self):
         """Attempt to clean up any source/target connections, based on the client types.
 
@@ -106,6 +169,9 @@ class ConfigManager(object):
                 self.source_client.con.dispose()
             if self.target_client and self.target_client.name in ("oracle", "postgres"):
                 self.target_client.con.dispose()
+            for shard_client in (self._source_shard_clients or [])[1:]:
+                if shard_client.name in ("oracle", "postgres"):
+                    shard_client.con.dispose()
         except Exception as exc:
             # No need to reraise, we can silently fail if exiting throws up an issue.
             logging.warning("Exception closing connections: %s", str(exc))
@@ -176,6 +242,30 @@ class ConfigManager(object):
             self.query_groups + grouped_column_configs
         )
 
+    @property
+    def group_buckets(self) -> Optional[int]:
+        """Return the number of buckets grouped columns are hashed into before comparing groups."""
+        return self._config.get(consts.CONFIG_GROUP_BUCKETS)
+
+    def append_group_buckets(self, group_buckets: int):
+        """Append the number of group buckets to existing config."""
+        self._config[consts.CONFIG_GROUP_BUCKETS] = group_buckets
+
+    @property
+    def slices(self) -> int:
+        """Return the number of key range slices a column validation is split into."""
+        return self._config.get(consts.CONFIG_SLICES) or 1
+
+    @property
+    def slice_keys(self):
+        """Return the column configs of the keys used to slice a column validation."""
+        return self._config.get(consts.CONFIG_SLICE_KEYS, [])
+
+    def append_slices(self, slices: int, slice_key_configs: list):
+        """Append the number of slices and slice key configs to existing config."""
+        self._config[consts.CONFIG_SLICES] = slices
+        self._config[consts.CONFIG_SLICE_KEYS] = slice_key_configs
+
     @property
     def custom_query_type(self):
         """Return custom query type from config"""
@@ -304,6 +394,27 @@ class ConfigManager(object):
         """Return int limit for query executions."""
         return self._config.get(consts.CONFIG_RESULT_HANDLER) or {}
 
+    @property
+    def max_aggregates(self) -> Optional[int]:
+        """Return the maximum number of aggregates in a single column validation query."""
+        return self._config.get(consts.CONFIG_MAX_AGGREGATES)
+
+    def append_max_aggregates(self, max_aggregates: int):
+        """Append the maximum number of aggregates per query to existing config."""
+        self._config[consts.CONFIG_MAX_AGGREGATES] = max_aggregates
+
+    @property
+    def max_query_workers(self) -> int:
+        """Return the maximum number of sub-queries of a validation run concurrently on each side."""
+        return (
+            self._config.get(consts.CONFIG_MAX_QUERY_WORKERS)
+            or consts.MAX_QUERY_WORKERS
+        )
+
+    def append_max_query_workers(self, max_query_workers: int):
+        """Append the maximum number of concurrent sub-queries per side to existing config."""
+        self._config[consts.CONFIG_MAX_QUERY_WORKERS] = max_query_workers
+
     @property
     def query_limit(self):
         """Return int limit for query executions."""
@@ -314,6 +425,35 @@ class ConfigManager(object):
         """Return threshold from Config"""
         return self._config.get(consts.CONFIG_THRESHOLD, 0.0)
 
+    @property
+    def approx_threshold(self) -> float:
+        """Return the minimum threshold of approximate aggregates from Config"""
+        return self._config.get(
+            consts.CONFIG_APPROX_THRESHOLD, consts.DEFAULT_APPROX_THRESHOLD
+        )
+
+    def append_approx_threshold(self, approx_threshold: float):
+        """Append the minimum threshold of approximate aggregates to existing config."""
+        self._config[consts.CONFIG_APPROX_THRESHOLD] = approx_threshold
+
+    @property
+    def aggregate_thresholds(self) -> Dict[str, float]:
+        """Return the thresholds of specific aggregate types from Config"""
+        return self._config.get(consts.CONFIG_AGGREGATE_THRESHOLDS) or {}
+
+    def append_aggregate_thresholds(self, aggregate_thresholds: Dict[str, float]):
+        """Append the thresholds of specific aggregate types to existing config."""
+        self._config[consts.CONFIG_AGGREGATE_THRESHOLDS] = aggregate_thresholds
+
+    def get_aggregate_threshold(self, aggregate_type: str) -> float:
+        """Return the threshold of an aggregate type. Unless set for their type, approximate
+        aggregates have at least the approximate threshold."""
+        if aggregate_type in self.aggregate_thresholds:
+            return self.aggregate_thresholds[aggregate_type]
+        if aggregate_type in consts.APPROX_AGGREGATES:
+            return max(self.threshold, self.approx_threshold)
+        return self.threshold
+
     @property
     def source_query(self):
         return self._config.get(consts.CONFIG_SOURCE_QUERY, None)
@@ -387,19 +527,54 @@ class ConfigManager(object):
             )
         return self._source_ibis_table
 
+    def _is_config_unchanged(self, config_snapshot: Optional[dict]) -> bool:
+        """Return True if the config is the one a shallow snapshot was taken of.
+
+        The append methods replace config values rather than mutating them, and the snapshot
+        keeps the values alive, so comparing the identity of the values is enough.
+        """
+        return (
+            config_snapshot is not None
+            and config_snapshot.keys() == self._config.keys()
+            and all(self._config[k] is v for k, v in config_snapshot.items())
+        )
+
+    def _get_validation_builder(self) -> ValidationBuilder:
+        """Return a ValidationBuilder of the config, built again only after the config changes."""
+        if self._validation_builder is None or not self._is_config_unchanged(
+            self._validation_builder_config
+        ):
+            self._validation_builder = ValidationBuilder(self)
+            self._validation_builder_config = dict(self._config)
+            self._calculated_tables = {}
+        return self._validation_builder
+
+    def _get_calculated_table(self, side: str, depth=None):
+        validation_builder = self._get_validation_builder()
+        if (side, depth) not in self._calculated_tables:
+            if side == "source":
+                table = (
+                    self.get_source_ibis_table_from_query()
+                    if self.validation_type == consts.CUSTOM_QUERY
+                    else self.get_source_ibis_table()
+                )
+                query_builder = validation_builder.source_builder
+            else:
+                table = (
+                    self.get_target_ibis_table_from_query()
+                    if self.validation_type == consts.CUSTOM_QUERY
+                    else self.get_target_ibis_table()
+                )
+                query_builder = validation_builder.target_builder
+            self._calculated_tables[(side, depth)] = table.mutate(
+                query_builder.compile_calculated_fields(table, n=depth)
+            )
+        return self._calculated_tables[(side, depth)]
+
     def get_source_ibis_calculated_table(self, depth=None):
         """Return mutated IbisTable from source
         depth: Int the depth of subquery requested"""
-        if self.validation_type == consts.CUSTOM_QUERY:
-            table = self.get_source_ibis_table_from_query()
-        else:
-            table = self.get_source_ibis_table()
-        vb = ValidationBuilder(self)
-        calculated_table = table.mutate(
-            vb.source_builder.compile_calculated_fields(table, n=depth)
-        )
-
-        return calculated_table
+        return self._get_calculated_table("source", depth=depth)
 
     def get_target_ibis_table(self):
         """Return IbisTable from target."""
@@ -420,16 +595,7 @@ class ConfigManager(object):
     def get_target_ibis_calculated_table(self, depth=None):
         """Return mutated IbisTable from target
         n: Int the depth of subquery requested"""
-        if self.validation_type == consts.CUSTOM_QUERY:
-            table = self.get_target_ibis_table_from_query()
-        else:
-            table = self.get_target_ibis_table()
-        vb = ValidationBuilder(self)
-        calculated_table = table.mutate(
-            vb.target_builder.compile_calculated_fields(table, n=depth)
-        )
-
-        return calculated_table
+        return self._get_calculated_table("target", depth=depth)
 
     def get_yaml_validation_block(self):
         """Return Dict object formatted for a Yaml file."""
@@ -833,9 +999,19 @@ class ConfigManager(object):
         )
 
     def build_config_column_aggregates(
-        self, agg_type, arg_value, exclude_cols, supported_types, cast_to_bigint=False
+        self,
+        agg_type,
+        arg_value,
+        exclude_cols,
+        supported_types,
+        cast_to_bigint=False,
+        strict_types=False,
     ):
-        """Return list of aggregate objects of given agg_type."""
+        """Return list of aggregate objects of given agg_type.
+
+        Unless strict_types is set, explicitly listed columns may also be strings,
+        timestamps, dates and binaries besides supported_types.
+        """
 
         def require_pre_agg_calc_field(
             column_type: str,
@@ -843,7 +1019,13 @@ class ConfigManager(object):
             agg_type: str,
             cast_to_bigint: bool,
         ) -> bool:
-            if column_type in ["string", "!string"] and target_column_type in [
+            if agg_type == "approx_count_distinct" and column_type not in [
+                "binary",
+                "!binary",
+            ]:
+                # Distinct values are counted on the column itself, not its length.
+                return False
+            elif column_type in ["string", "!string"] and target_column_type in [
                 "string",
                 "!string",
             ]:
@@ -891,7 +1073,7 @@ class ConfigManager(object):
                 ]
                 arg_value = included_cols
 
-            if supported_types:
+            if supported_types and not strict_types:
                 # This mutates external supported_types, making it local as part of adding more values.
                 supported_types = supported_types + [
                     "string",
@@ -910,17 +1092,9 @@ class ConfigManager(object):
                 )
 
         allowlist_columns = arg_value or casefold_source_columns
+        source_table_schema = source_table.schema()
+        target_table_schema = target_table.schema()
         for column_position, column in enumerate(casefold_source_columns):
-            # Get column type and remove precision/scale attributes
-            source_column_ibis_type = source_table[
-                casefold_source_columns[column]
-            ].type()
-            column_type = str(source_column_ibis_type).split("(")[0]
-            target_column_ibis_type = target_table[
-                casefold_target_columns[column]
-            ].type()
-            target_column_type = str(target_column_ibis_type).split("(")[0]
-
             if column not in allowlist_columns:
                 continue
             elif column not in casefold_target_columns:
@@ -928,7 +1102,17 @@ class ConfigManager(object):
                     f"Skipping {agg_type} on {column} as column is not present in target table"
                 )
                 continue
-            elif supported_types and (
+
+            # Get column type and remove precision/scale attributes
+            source_column_ibis_type = source_table_schema[
+                casefold_source_columns[column]
+            ]
+            column_type = str(source_column_ibis_type).split("(")[0]
+            target_column_ibis_type = target_table_schema[
+                casefold_target_columns[column]
+            ]
+            target_column_type = str(target_column_ibis_type).split("(")[0]
+            if supported_types and (
                 column_type not in supported_types
                 or target_column_type not in supported_types
             ):
@@ -966,6 +1150,70 @@ class ConfigManager(object):
 
         return aggregate_configs
 
+    def build_config_histogram_aggregates(
+        self, arg_value, exclude_cols, supported_types, buckets: int
+    ) -> List[dict]:
+        """Return bucket_count aggregates of a fixed width histogram of each numeric column.
+
+        The buckets split the range between the source min and max of each column, the
+        first and last buckets are unbounded to also count target values out of the range.
+        """
+        column_configs = [
+            aggregate_config
+            for aggregate_config in self.build_config_column_aggregates(
+                "bucket_count",
+                arg_value,
+                exclude_cols,
+                supported_types,
+                strict_types=True,
+            )
+            if not aggregate_config.get(consts.CONFIG_CAST)
+        ]
+        if not column_configs:
+            return []
+
+        source_table = self.get_source_ibis_calculated_table()
+        bounds = (
+            source_table.aggregate(
+                [
+                    metric
+                    for i, aggregate_config in enumerate(column_configs)
+                    for metric in (
+                        source_table[aggregate_config[consts.CONFIG_SOURCE_COLUMN]]
+                        .min()
+                        .name(f"min_{i}"),
+                        source_table[aggregate_config[consts.CONFIG_SOURCE_COLUMN]]
+                        .max()
+                        .name(f"max_{i}"),
+                    )
+                ]
+            )
+            .execute()
+            .iloc[0]
+        )
+
+        aggregate_configs = []
+        for i, aggregate_config in enumerate(column_configs):
+            lower, upper = bounds[f"min_{i}"], bounds[f"max_{i}"]
+            if pandas.isna(lower) or pandas.isna(upper):
+                continue
+            width = (float(upper) - float(lower)) / buckets
+            edges = [float(lower) + width * n for n in range(1, buckets)]
+            for n in range(buckets):
+                aggregate_configs.append(
+                    dict(
+                        aggregate_config,
+                        **{
+                            consts.CONFIG_FIELD_ALIAS: f"{aggregate_config[consts.CONFIG_FIELD_ALIAS]}_{n}",
+                            consts.CONFIG_BUCKET_LOWER: edges[n - 1] if n else None,
+                            consts.CONFIG_BUCKET_UPPER: edges[n]
+                            if n < buckets - 1
+                            else None,
+                        },
+                    )
+                )
+        return aggregate_configs
+
     def build_config_calculated_fields(
         self,
         source_reference: list,
@@ -1023,8 +1271,8 @@ class ConfigManager(object):
         if col_config["calc_type"] != "cast":
             return col_config
 
-        source_table_schema = {k: v for k, v in source_table.schema().items()}
-        target_table_schema = {k: v for k, v in target_table.schema().items()}
+        source_table_schema = source_table.schema()
+        target_table_schema = target_table.schema()
 
         if isinstance(
             source_table_schema[source_column], (dt.Date, dt.Timestamp)
@@ -17,6 +17,7 @@
 SOURCE_TYPE = "source_type"
 SECRET_MANAGER_TYPE = "secret_manager_type"
 SECRET_MANAGER_PROJECT_ID = "secret_manager_project_id"
+FETCH_SIZE = "fetch_size"
 CONFIG = "config"
 CONFIG_FILE = "config_file"
 CONFIG_FILE_JSON = "config_file_json"
@@ -40,6 +41,19 @@ CONFIG_FIELD_ALIAS = "field_alias"
 CONFIG_AGGREGATES = "aggregates"
 CONFIG_CALCULATED_FIELDS = "calculated_fields"
 CONFIG_GROUPED_COLUMNS = "grouped_columns"
+CONFIG_GROUP_BUCKETS = "group_buckets"
+CONFIG_SLICES = "slices"
+CONFIG_SLICE_KEYS = "slice_keys"
+CONFIG_SOURCE_SHARDS = "source_shards"
+CONFIG_MAX_AGGREGATES = "max_aggregates"
+CONFIG_MAX_QUERY_WORKERS = "max_query_workers"
+CONFIG_SOURCE_CACHE_TTL = "source_cache_ttl"
+CONFIG_SOURCE_CACHE_TOKEN = "source_cache_token"
+CONFIG_SKIP_UNCHANGED = "skip_unchanged"
+CONFIG_APPROX_THRESHOLD = "approx_threshold"
+CONFIG_AGGREGATE_THRESHOLDS = "aggregate_thresholds"
+CONFIG_BUCKET_LOWER = "bucket_lower"
+CONFIG_BUCKET_UPPER = "bucket_upper"
 CONFIG_CALCULATED_SOURCE_COLUMNS = "source_calculated_columns"
 CONFIG_CALCULATED_TARGET_COLUMNS = "target_calculated_columns"
 CONFIG_USE_RANDOM_ROWS = "use_random_rows"
@@ -60,6 +74,8 @@ CONFIG_LIMIT = "limit"
 CONFIG_FILTERS = "filters"
 CONFIG_FILTER_SOURCE = "source"
 CONFIG_FILTER_TARGET = "target"
+CONFIG_FILTER_SOURCE_PARAMETERS = "source_parameters"
+CONFIG_FILTER_TARGET_PARAMETERS = "target_parameters"
 CONFIG_MAX_RECURSIVE_QUERY_SIZE = "max_recursive_query_size"
 CONFIG_SOURCE_QUERY = "source_query"
 CONFIG_SOURCE_QUERY_FILE = "source_query_file"
@@ -105,6 +121,28 @@ CONFIG_TYPES = [
 # State Manager Fields
 DEFAULT_ENV_DIRECTORY = "~/.config/google-pso-data-validator/"
 ENV_DIRECTORY_VAR = "PSO_DV_CONN_HOME"
+RESULT_CACHE_DIRECTORY = "result_cache"
+FINGERPRINTS_DIRECTORY = "fingerprints"
+METADATA_CACHE_DIRECTORY = "metadata_cache"
+ENV_METADATA_CACHE_TTL_VAR = "PSO_DV_METADATA_CACHE_TTL"
+
+# Size in bytes beyond which the oldest cached source results are evicted
+SOURCE_CACHE_MAX_BYTES = 1024**3
+
+# Number of schemas whose tables are listed concurrently
+LIST_TABLES_MAX_WORKERS = 8
+
+# Number of slices of a sliced column validation run concurrently on each side
+SLICE_MAX_WORKERS = 8
+
+# Default number of sub-queries of a split validation run concurrently on each side
+MAX_QUERY_WORKERS = 4
+
+# Number of batched UNION ALL queries run concurrently on each side
+BATCH_MAX_WORKERS = 4
+
+# Modulus of the group keys summed by the group fingerprint of bucketed validations
+GROUP_FINGERPRINT_MODULUS = 2**24
 
 # Yaml File Config Fields
 YAML_RESULT_HANDLER = "result_handler"
@@ -112,6 +150,36 @@ YAML_SOURCE = "source"
 YAML_TARGET = "target"
 YAML_VALIDATIONS = "validations"
 
+# Number of rows sampled to estimate the width of validation rows when sizing partitions
+PARTITION_SAMPLE_ROWS = 1000
+
+# Prefix of the column names of aggregates in fused column validation queries
+FUSED_AGGREGATE_PREFIX = "dvt_agg_"
+
+# Suffix separator of the partial aggregates of sliced column validations
+PARTIAL_STATE_SEPARATOR = "__dvt_"
+
+# Aggregates computed from sketches, compared with at least the approximate threshold
+APPROX_AGGREGATES = ["approx_count_distinct", "approx_median"]
+DEFAULT_APPROX_THRESHOLD = 2.0
+
+# Batched column validations of many tables in UNION ALL queries
+BATCH_ID_COLUMN = "dvt_batch_id"
+BATCH_COLUMN_PREFIX = "dvt_col_"
+BATCH_MAX_SQL_LENGTH = 500000
+
+# Filter of a table split into a single partition
+PARTITION_ALL_ROWS_FILTER = "1 = 1"
+
+# Prefix of the bind parameter names in partition filters
+PARTITION_BIND_PARAMETER_PREFIX = "dvt_p"
+
+# Partition Manifest Fields
+PARTITION_MANIFEST_FILE = "partitions.json"
+MANIFEST_PARTS_PER_FILE = "parts_per_file"
+MANIFEST_VALIDATION = "validation"
+MANIFEST_PARTITIONS = "partitions"
+
 # BigQuery Result Handler Configs
 PROJECT_ID = "project_id"
 TABLE_ID = "table_id"
@@ -189,3 +257,22 @@ MAX_CONCAT_COLUMNS_DEFAULTS = {
     # Minimizing risk of: [Error 3556] Too many columns defined for this table.
     "teradata": 500,
 }
+
+# Default limit for the number of aggregates in a single column validation query, beyond
+# which the aggregates are split into concurrent sub-queries.
+MAX_AGGREGATES_DEFAULTS = {
+    # Preventing: SQL0840N The number of items returned in the select list exceeded the allowable maximum.
+    "db2": 1000,
+    # Preventing: The query has too many columns (4096).
+    "mssql": 4000,
+    # Preventing: Too many columns (4096).
+    "mysql": 4000,
+    # Preventing: ORA-01792: maximum number of columns in a table or view is 1000
+    "oracle": 1000,
+    # Preventing: target lists can have at most 1664 entries
+    "postgres": 1600,
+    # Preventing: target lists can have at most 1664 entries
+    "redshift": 1600,
+    # Preventing: [Error 3556] Too many columns defined for this table.
+    "teradata": 2000,
+}
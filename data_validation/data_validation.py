@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
 import json
 import logging
 import warnings
@@ -20,7 +21,14 @@ from concurrent.futures import ThreadPoolExecutor
 import ibis.backends.pandas
 import pandas
 
-from data_validation import combiner, consts, metadata
+from data_validation import (
+    combiner,
+    consts,
+    metadata,
+    result_cache,
+    sharded_validation,
+    table_fingerprints,
+)
 from data_validation.config_manager import ConfigManager
 from data_validation.query_builder.random_row_builder import RandomRowBuilder
 from data_validation.schema_validation import SchemaValidation
@@ -43,6 +51,8 @@ class DataValidation(object):
         schema_validator=None,
         result_handler=None,
         verbose=False,
+        source_client=None,
+        target_client=None,
     ):
         """Initialize a DataValidation client
 
@@ -52,13 +62,20 @@ class DataValidation(object):
             schema_validator (SchemaValidation): Optional instance of a SchemaValidation.
             result_handler (ResultHandler): Optional instance of as ResultHandler client.
             verbose (bool): If verbose, the Data Validation client will print the queries run.
+            source_client (IbisClient): Optional source client shared with other validations.
+            target_client (IbisClient): Optional target client shared with other validations.
         """
         self.verbose = verbose
 
         # Data Client Management
         self.config = config
 
-        self.config_manager = ConfigManager(config, verbose=self.verbose)
+        self.config_manager = ConfigManager(
+            config,
+            source_client=source_client,
+            target_client=target_client,
+            verbose=self.verbose,
+        )
 
         self.run_metadata = metadata.RunMetadata()
         self.run_metadata.labels = self.config_manager.labels
@@ -75,17 +92,40 @@ class DataValidation(object):
         # Initialize the default Result Handler if None was supplied
         self.result_handler = result_handler or self.config_manager.get_result_handler()
 
+        # Split queries of each side share one bounded pool across recursive validations
+        self._query_executors = {}
+
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc_value, exc_traceback):
+        for executor in getattr(self, "_query_executors", {}).values():
+            executor.shutdown(wait=False)
         if hasattr(self, "config_manager"):
             self.config_manager.close_client_connections()
 
+    def _get_query_executor(self, side: str) -> ThreadPoolExecutor:
+        """Return the pool running the split queries of a side, created on first use."""
+        if side not in self._query_executors:
+            self._query_executors[side] = ThreadPoolExecutor(
+                max_workers=self.config_manager.max_query_workers
+            )
+        return self._query_executors[side]
+
     # TODO(dhercher) we planned on shifting this to use an Execution Handler.
     # Leaving to to swast on the design of how this should look.
     def execute(self):
         """Execute Queries and Store Results"""
+        # Re-emit the results of the last successful run of unchanged tables
+        fingerprints = None
+        if self.config_manager.skip_unchanged:
+            fingerprints = table_fingerprints.get_fingerprints(self.config_manager)
+            result_df = table_fingerprints.get_unchanged_result(
+                self.config_manager, fingerprints, self.run_metadata
+            )
+            if result_df is not None:
+                return self.result_handler.execute(result_df)
+
         # Apply random row filter before validations run
         if self.config_manager.use_random_rows():
             self._add_random_row_filter()
@@ -96,6 +136,12 @@ class DataValidation(object):
             result_df = self.execute_recursive_validation(
                 self.validation_builder, grouped_fields
             )
+        elif (
+            self.config_manager.validation_type == consts.COLUMN_VALIDATION
+            and self.config_manager.group_buckets
+            and self.config_manager.query_groups
+        ):
+            result_df = self.execute_bucketed_validation(self.validation_builder)
         elif self.config_manager.validation_type == consts.SCHEMA_VALIDATION:
             """Perform only schema validation"""
             result_df = self.schema_validator.execute()
@@ -104,6 +150,11 @@ class DataValidation(object):
                 self.validation_builder, process_in_memory=True
             )
 
+        if fingerprints:
+            table_fingerprints.store_result(
+                self.config_manager, fingerprints, result_df
+            )
+
         # Call Result Handler to Manage Results
         return self.result_handler.execute(result_df)
 
@@ -270,6 +321,66 @@ class DataValidation(object):
 
         return pandas.concat(past_results)
 
+    def execute_bucketed_validation(self, validation_builder):
+        """Grouped column validation which only fetches the groups of mismatching buckets.
+
+        The groups are first bucketed on the first grouped column (see GroupedField),
+        and the aggregates of each bucket are compared. Only the groups of the buckets which
+        differ are then aggregated and compared on their own, so that the rows fetched
+        scale with the mismatches rather than with the number of groups. Buckets which
+        match are reported as a whole.
+
+        The buckets are also compared on a fingerprint of the values of all grouped
+        columns (see AggregateField.group_fingerprint), so that rows moving between
+        groups of a bucket fail it. Differences which cancel out within a bucket on
+        the validation aggregates and the fingerprint are not detected.
+        """
+        grouped_fields = validation_builder.pop_grouped_fields()
+        bucket_alias = f"bucket__{grouped_fields[0][consts.CONFIG_FIELD_ALIAS]}"
+        bucket_field = dict(
+            grouped_fields[0],
+            **{
+                consts.CONFIG_FIELD_ALIAS: bucket_alias,
+                consts.CONFIG_GROUP_BUCKETS: self.config_manager.group_buckets,
+            },
+        )
+
+        bucket_builder = validation_builder.clone()
+        bucket_builder.add_query_group(bucket_field)
+        fingerprint_alias = f"{bucket_alias}__fingerprint"
+        bucket_builder.add_group_fingerprint(grouped_fields, fingerprint_alias)
+        bucket_df = self._execute_validation(bucket_builder, process_in_memory=True)
+
+        failed_keys = bucket_df[
+            bucket_df[consts.VALIDATION_STATUS] == consts.VALIDATION_STATUS_FAIL
+        ][consts.GROUP_BY_COLUMNS].unique()
+        bucket_df = bucket_df[
+            bucket_df["validation_name"] != fingerprint_alias
+        ].reset_index(drop=True)
+        if len(failed_keys) == 0:
+            return bucket_df
+        buckets = [json.loads(_)[bucket_alias] for _ in failed_keys]
+        logging.info(
+            "Comparing the groups of %s mismatching buckets out of %s",
+            len(buckets),
+            bucket_df[consts.GROUP_BY_COLUMNS].nunique(),
+        )
+
+        group_builder = validation_builder.clone()
+        for grouped_field in grouped_fields:
+            group_builder.add_query_group(grouped_field)
+        group_builder.add_bucket_filter(
+            bucket_field, [None if _ == "null" else _ for _ in buckets]
+        )
+        group_df = self._execute_validation(group_builder, process_in_memory=True)
+        return pandas.concat(
+            [
+                bucket_df[~bucket_df[consts.GROUP_BY_COLUMNS].isin(failed_keys)],
+                group_df,
+            ],
+            ignore_index=True,
+        )
+
     def _add_recursive_validation_filter(self, validation_builder, row):
         """Return ValidationBuilder Configured for Next Recursive Search"""
         group_by_columns = json.loads(row[consts.GROUP_BY_COLUMNS])
@@ -287,12 +398,65 @@ class DataValidation(object):
             }
             validation_builder.add_filter(filter_field)
 
+    @staticmethod
+    def _execute_queries(client, queries, join_on_fields, executor=None):
+        """Execute the sub-queries of one side concurrently and stitch their columns together.
+
+        Args:
+            client (IbisClient): The client of the side.
+            queries (list): Queries with the same filters and grouped columns, each with a
+                subset of the aggregates.
+            join_on_fields (set): The grouped columns shared by the sub-query results.
+            executor (ThreadPoolExecutor): The pool running the sub-queries, they are run
+                one after the other when None.
+        """
+        if len(queries) == 1:
+            return client.execute(queries[0])
+        results = list((executor.map if executor else map)(client.execute, queries))
+        if not join_on_fields:
+            return pandas.concat(results, axis=1)
+        return functools.reduce(
+            lambda left, right: left.merge(right, how="outer", on=list(join_on_fields)),
+            results,
+        )
+
+    def _execute_source_queries(self, queries, join_on_fields):
+        """Execute the source queries, reusing cached results when a source cache is configured."""
+        source_client = self.config_manager.source_client
+        cache = self.config_manager.get_source_result_cache()
+        query_texts = (
+            [result_cache.get_query_text(source_client, _) for _ in queries]
+            if cache
+            else []
+        )
+        executor = self._get_query_executor(consts.RESULT_TYPE_SOURCE)
+        if not cache or None in query_texts:
+            return self._execute_queries(
+                source_client, queries, join_on_fields, executor=executor
+            )
+
+        key = result_cache.get_key(
+            self.config_manager.get_source_connection(),
+            query_texts,
+            self.config_manager.source_cache_token,
+        )
+        source_df = cache.get(key)
+        if source_df is not None:
+            logging.info("Using cached source results of %s", key)
+            return source_df
+        source_df = self._execute_queries(
+            source_client, queries, join_on_fields, executor=executor
+        )
+        cache.put(key, source_df)
+        return source_df
+
     def _execute_validation(self, validation_builder, process_in_memory=True):
         """Execute Against a Supplied Validation Builder"""
         self.run_metadata.validations = validation_builder.get_metadata()
 
-        source_query = validation_builder.get_source_query()
-        target_query = validation_builder.get_target_query()
+        # Wide column validations may be split into several queries per side
+        source_queries = validation_builder.get_source_queries()
+        target_queries = validation_builder.get_target_queries()
 
         join_on_fields = (
             set(validation_builder.get_primary_keys())
@@ -317,14 +481,29 @@ class DataValidation(object):
             futures = []
             with ThreadPoolExecutor() as executor:
                 # Submit the two query network calls concurrently
-                futures.append(
-                    executor.submit(
-                        self.config_manager.source_client.execute, source_query
+                if sharded_validation.is_sharded(self.config_manager):
+                    futures.append(
+                        executor.submit(
+                            sharded_validation.get_source_df,
+                            self.config_manager,
+                            validation_builder,
+                        )
+                    )
+                else:
+                    futures.append(
+                        executor.submit(
+                            self._execute_source_queries,
+                            source_queries,
+                            join_on_fields,
+                        )
                     )
-                )
                 futures.append(
                     executor.submit(
-                        self.config_manager.target_client.execute, target_query
+                        self._execute_queries,
+                        self.config_manager.target_client,
+                        target_queries,
+                        join_on_fields,
+                        executor=self._get_query_executor(consts.RESULT_TYPE_TARGET),
                     )
                 )
                 source_df = futures[0].result()
@@ -357,8 +536,8 @@ class DataValidation(object):
             result_df = combiner.generate_report(
                 self.config_manager.source_client,
                 self.run_metadata,
-                source_query,
-                target_query,
+                source_queries[0],
+                target_queries[0],
                 join_on_fields=join_on_fields,
                 is_value_comparison=is_value_comparison,
                 verbose=self.verbose,
@@ -33,10 +33,10 @@ def _compare_match_tables(source_table_map, target_table_map, score_cutoff=0.8)
     # TODO(dhercher): evaluate if improved comparison and score cutoffs should be used.
     table_configs = []
 
-    target_keys = target_table_map.keys()
+    target_index = jellyfish_distance.ClosestMatchIndex(target_table_map.keys())
     for source_key in source_table_map:
-        target_key = jellyfish_distance.extract_closest_match(
-            source_key, target_keys, score_cutoff=score_cutoff
+        target_key = target_index.extract_closest_match(
+            source_key, score_cutoff=score_cutoff
         )
         if target_key is None:
             continue
@@ -127,6 +127,8 @@ def expand_tables_of_asterisk(
         list: New version of tables_list with expanded "table_name": "*" entries.
     """
     new_list = []
+    # The target tables of all schemas are matched, list them once for all entries.
+    target_table_map = None
     for mapping in tables_list:
         if (
             mapping
@@ -137,10 +139,15 @@ def expand_tables_of_asterisk(
             and not mapping.get(consts.CONFIG_TARGET_TABLE_NAME, None)
         ):
             # Expand the "*" to all tables in the schema.
-            expanded_tables = get_mapped_table_configs(
-                source_client,
-                target_client,
-                allowed_schemas=[mapping[consts.CONFIG_SCHEMA_NAME]],
+            if target_table_map is None:
+                target_table_map = _get_table_map(target_client)
+            expanded_tables = _compare_match_tables(
+                _get_table_map(
+                    source_client,
+                    allowed_schemas=[mapping[consts.CONFIG_SCHEMA_NAME]],
+                ),
+                target_table_map,
+                score_cutoff=1,
             )
             new_list.extend(expanded_tables)
         else:
@@ -0,0 +1,260 @@
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+""" Column validations of the same source and target tables are fused into a single
+    aggregate query per side, so that a table is only scanned once however many
+    validations use it.
+
+    The filters of each validation become conditional aggregates (e.g. SUM(x) FILTER (WHERE ...)
+    or SUM(CASE WHEN ... THEN x END)) and the results are split back into one report per validation.
+"""
+
+import functools
+import json
+import logging
+import operator
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+import ibis.backends.pandas
+import pandas
+
+from data_validation import clients, combiner, consts, metadata
+from data_validation.config_manager import ConfigManager
+from data_validation.query_builder.query_builder import QueryBuilder
+from data_validation.validation_builder import ValidationBuilder
+
+
+def is_fusible(config_manager: ConfigManager) -> bool:
+    """Return True if a validation is a single row aggregate over a table, which can be fused."""
+    return (
+        config_manager.validation_type == consts.COLUMN_VALIDATION
+        and not config_manager.query_groups
+        and not config_manager.comparison_fields
+        and not config_manager.use_random_rows()
+        and config_manager.slices == 1
+        and not config_manager.source_shards
+        and not config_manager.skip_unchanged
+        # Cached source results are keyed on the queries of a single validation
+        and not config_manager.source_cache_ttl
+        and bool(config_manager.source_table)
+        and bool(config_manager.target_table)
+    )
+
+
+def _get_fusion_key(config_manager: ConfigManager) -> str:
+    """Return a key identifying the source and target tables of a validation."""
+    return json.dumps(
+        [
+            config_manager.get_source_connection(),
+            config_manager.get_target_connection(),
+            config_manager.source_schema,
+            config_manager.source_table,
+            config_manager.target_schema,
+            config_manager.target_table,
+        ],
+        sort_keys=True,
+        default=str,
+    )
+
+
+def _get_max_aggregates(config_manager: ConfigManager) -> Optional[int]:
+    """Return the maximum number of aggregates in a query of the validation on either side, if any."""
+    limits = [
+        config_manager.max_aggregates or clients.get_max_aggregates(client)
+        for client in (config_manager.source_client, config_manager.target_client)
+    ]
+    limits = [_ for _ in limits if _]
+    return min(limits) if limits else None
+
+
+def fits_max_aggregates(group: List[ConfigManager]) -> bool:
+    """Return True if the fused query of a group has no more aggregates than any of its
+    validations allows in a single query."""
+    limits = [_ for _ in map(_get_max_aggregates, group) if _]
+    return not limits or sum(len(_.aggregates) for _ in group) <= min(limits)
+
+
+def plan_validations(config_managers: List[ConfigManager]) -> List[List[ConfigManager]]:
+    """Group validations which can share a table scan, keeping the order of the first validation of each group.
+
+    Validations are grouped when they are column validations without grouped columns on the same
+    source and target tables, their calculated fields do not use the same alias for different
+    calculations and the fused query does not exceed the maximum number of aggregates per query
+    of the validations, which would otherwise be split into several queries.
+
+    Returns:
+        A list of groups of validations, a group of one validation being run as usual.
+    """
+    groups = []
+    open_groups = {}
+    for config_manager in config_managers:
+        if not is_fusible(config_manager):
+            groups.append([config_manager])
+            continue
+        key = _get_fusion_key(config_manager)
+        group = open_groups.get(key)
+        if group is not None:
+            group_calculated_fields = {
+                _[consts.CONFIG_FIELD_ALIAS]: _
+                for member in group
+                for _ in member.calculated_fields
+            }
+            if all(
+                group_calculated_fields.get(_[consts.CONFIG_FIELD_ALIAS], _) == _
+                for _ in config_manager.calculated_fields
+            ) and fits_max_aggregates(group + [config_manager]):
+                group.append(config_manager)
+                continue
+        open_groups[key] = [config_manager]
+        groups.append(open_groups[key])
+    return groups
+
+
+def generate_aggregate_report(
+    config_manager: ConfigManager,
+    validation_builder: ValidationBuilder,
+    source_df: pandas.DataFrame,
+    target_df: pandas.DataFrame,
+    join_on_fields=(),
+    verbose=False,
+) -> pandas.DataFrame:
+    """Return the report of a single column validation from its source and target aggregates.
+
+    Args:
+        join_on_fields (Sequence[str]): The group aliases of a grouped column validation.
+    """
+    run_metadata = metadata.RunMetadata()
+    run_metadata.labels = config_manager.labels
+    run_metadata.validations = validation_builder.get_metadata()
+    pandas_client = ibis.pandas.connect(
+        {combiner.DEFAULT_SOURCE: source_df, combiner.DEFAULT_TARGET: target_df}
+    )
+    return combiner.generate_report(
+        pandas_client,
+        run_metadata,
+        pandas_client.table(combiner.DEFAULT_SOURCE),
+        pandas_client.table(combiner.DEFAULT_TARGET),
+        join_on_fields=join_on_fields,
+        is_value_comparison=False,
+        verbose=verbose,
+    )
+
+
+class FusedValidation(object):
+    def __init__(self, config_managers: List[ConfigManager], verbose=False):
+        """Initialize a FusedValidation of column validations sharing source and target tables.
+
+        Args:
+            config_managers (List[ConfigManager]): Validations grouped by plan_validations.
+            verbose (bool): If verbose, the queries run are logged.
+        """
+        self.config_managers = config_managers
+        self.verbose = verbose
+        self.validation_builders = [
+            ValidationBuilder(config_manager) for config_manager in config_managers
+        ]
+
+    def _build_query(self, table, query_builders: List[QueryBuilder]):
+        """Return the fused aggregate query for one side and, for each validation, the mapping of
+        fused column names to the aggregate aliases of the validation.
+
+        Args:
+            table (IbisTable): The source or target table.
+            query_builders (List[QueryBuilder]): The source or target builder of each validation.
+        """
+        calculated_fields = {}
+        for query_builder in query_builders:
+            for calculated_field in query_builder.calculated_fields:
+                calculated_fields.setdefault(
+                    calculated_field.config[consts.CONFIG_FIELD_ALIAS], calculated_field
+                )
+        calculated_table = QueryBuilder(
+            [], list(calculated_fields.values()), [], [], []
+        ).compile(consts.COLUMN_VALIDATION, table)
+
+        aggregates = []
+        aliases = []
+        for query_builder in query_builders:
+            filters = query_builder.compile_filter_fields(calculated_table)
+            where = functools.reduce(operator.and_, filters) if filters else None
+            validation_aliases = {}
+            for aggregate_field in query_builder.aggregate_fields:
+                name = f"{consts.FUSED_AGGREGATE_PREFIX}{len(aggregates)}"
+                aggregates.append(
+                    aggregate_field.compile(calculated_table, where=where).name(name)
+                )
+                validation_aliases[name] = aggregate_field.alias
+            aliases.append(validation_aliases)
+        return calculated_table.aggregate(aggregates), aliases
+
+    def get_source_query(self):
+        """Return the fused source query, aggregating the source table once for all validations."""
+        source_query, self._source_aliases = self._build_query(
+            self.config_managers[0].get_source_ibis_table(),
+            [_.source_builder for _ in self.validation_builders],
+        )
+        return source_query
+
+    def get_target_query(self):
+        """Return the fused target query, aggregating the target table once for all validations."""
+        target_query, self._target_aliases = self._build_query(
+            self.config_managers[0].get_target_ibis_table(),
+            [_.target_builder for _ in self.validation_builders],
+        )
+        return target_query
+
+    def get_reports_from_results(
+        self, source_df: pandas.DataFrame, target_df: pandas.DataFrame
+    ) -> List[pandas.DataFrame]:
+        """Split the results of the fused source and target queries into the report of each validation."""
+        reports = []
+        for ind, config_manager in enumerate(self.config_managers):
+            result_df = generate_aggregate_report(
+                config_manager,
+                self.validation_builders[ind],
+                source_df[list(self._source_aliases[ind])].rename(
+                    columns=self._source_aliases[ind]
+                ),
+                target_df[list(self._target_aliases[ind])].rename(
+                    columns=self._target_aliases[ind]
+                ),
+                verbose=self.verbose,
+            )
+            reports.append(result_df)
+        return reports
+
+    def get_reports(self) -> List[pandas.DataFrame]:
+        """Run the fused source and target queries and return the report of each validation."""
+        config_manager = self.config_managers[0]
+        source_query = self.get_source_query()
+        target_query = self.get_target_query()
+        if self.verbose:
+            logging.info("-- ** Fused Source Query ** --")
+            logging.info(source_query.compile())
+            logging.info("-- ** Fused Target Query ** --")
+            logging.info(target_query.compile())
+
+        with ThreadPoolExecutor() as executor:
+            # Submit the two query network calls concurrently
+            source_future = executor.submit(
+                config_manager.source_client.execute, source_query
+            )
+            target_future = executor.submit(
+                config_manager.target_client.execute, target_query
+            )
+            source_df = source_future.result()
+            target_df = target_future.result()
+
+        return self.get_reports_from_results(source_df, target_df)
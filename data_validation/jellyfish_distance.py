@@ -12,7 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import collections
+
 import jellyfish
+import numpy
+
+# Tolerance of the Jaro upper bounds against the similarities computed by jellyfish
+_BOUND_TOLERANCE = 1e-9
 
 
 def extract_closest_match(search_key, target_list, score_cutoff=0):
@@ -33,3 +39,82 @@ def extract_closest_match(search_key, target_list, score_cutoff=0):
             highest_value_key = target_key
 
     return highest_value_key
+
+
+class ClosestMatchIndex(object):
+    def __init__(self, target_list):
+        """Initialize an index of target strings for repeated closest match searches.
+
+        extract_closest_match below computes the Jaro similarity of every target. The index
+        instead bounds the similarity of all targets at once from their lengths and character
+        counts, and only computes the similarity of targets whose bound can reach the best
+        match. It returns the same match as extract_closest_match.
+
+        Args:
+            target_list (list): A list of strings for comparison.
+        """
+        self.target_list = list(target_list)
+        self._positions = {key: i for i, key in enumerate(self.target_list)}
+        char_positions = {}
+        for key in self.target_list:
+            for char in key:
+                char_positions.setdefault(char, len(char_positions))
+        self._char_positions = char_positions
+        self._lengths = numpy.array([len(_) for _ in self.target_list], dtype=float)
+        # One row of counts per character, to sum only the rows of the search key
+        self._char_counts = numpy.zeros(
+            (len(char_positions), len(self.target_list)), dtype=numpy.int32
+        )
+        for i, key in enumerate(self.target_list):
+            for char, count in collections.Counter(key).items():
+                self._char_counts[char_positions[char], i] = count
+
+    def _get_upper_bounds(self, search_key):
+        """Return the upper bound of the Jaro similarity of the search key with each target.
+
+        Jaro similarity is (m / len1 + m / len2 + (m - t) / m) / 3 for m matching and t
+        transposed characters, and m is at most the number of characters in common.
+        """
+        common = numpy.zeros(len(self.target_list))
+        for char, count in collections.Counter(search_key).items():
+            if char in self._char_positions:
+                common += numpy.minimum(
+                    self._char_counts[self._char_positions[char]], count
+                )
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            upper_bounds = (common / len(search_key) + common / self._lengths + 1) / 3
+        return numpy.where(common > 0, upper_bounds, 0.0)
+
+    def extract_closest_match(self, search_key, score_cutoff=0):
+        """Return str value from the targets with highest score using Jaro
+        for String distance, the last one of equal scores like extract_closest_match.
+
+         search_key (str): A string used to search for closest match.
+         score_cutoff (float): A score cutoff (betwen 0 and 1) to be met.
+        """
+        if not self.target_list or score_cutoff > 1:
+            return None
+        if search_key and search_key in self._positions:
+            # Only identical strings have a Jaro similarity of 1
+            return search_key
+
+        upper_bounds = self._get_upper_bounds(search_key)
+        candidates = numpy.nonzero(upper_bounds >= score_cutoff - _BOUND_TOLERANCE)[0]
+        candidates = candidates[numpy.argsort(-upper_bounds[candidates], kind="stable")]
+
+        highest_score = score_cutoff
+        highest_position = None
+        for position in candidates:
+            if upper_bounds[position] < highest_score - _BOUND_TOLERANCE:
+                break
+            score = jellyfish.jaro_similarity(search_key, self.target_list[position])
+            if score > highest_score or (
+                score == highest_score
+                and (highest_position is None or position > highest_position)
+            ):
+                highest_score = score
+                highest_position = position
+
+        if highest_position is None:
+            return None
+        return self.target_list[highest_position]
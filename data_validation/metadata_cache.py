@@ -0,0 +1,189 @@
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+""" A cache of database metadata, i.e. table schemas, tables and lists of schemas and tables,
+    so that the startup of runs over many tables is not dominated by reflection. Lookups are
+    memoized in process for each connection, so that the clients of the validations of a run
+    share them. When PSO_DV_METADATA_CACHE_TTL is set,
+    table schemas and lists are also stored as JSON files under the StateManager root, keyed
+    on the identity of the connection and the object, and reused by later runs until the TTL
+    expires or `data-validation connections refresh-cache` removes them.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+import uuid
+from typing import Any, Callable, Dict, Optional
+
+import ibis.expr.datatypes as dt
+import ibis.expr.schema as sch
+
+from data_validation import consts, state_manager
+
+# Connection config keys which do not identify the objects of a connection
+_NON_IDENTITY_KEYS = ("password",)
+# Connections whose metadata is read from local data and is never stored
+_UNCACHED_SOURCE_TYPES = ("FileSystem", "Pandas")
+# The caches of each connection in this process, keyed on the connection key, directory and TTL
+_CACHES = {}
+_CACHES_LOCK = threading.Lock()
+
+
+def get_connection_key(connection: Dict) -> str:
+    """Return the key of the cached metadata of a connection."""
+    identity = {
+        key: value for key, value in connection.items() if key not in _NON_IDENTITY_KEYS
+    }
+    return hashlib.sha256(
+        json.dumps(identity, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+
+
+def schema_to_json(schema: sch.Schema) -> Dict[str, str]:
+    return {name: str(dtype) for name, dtype in schema.items()}
+
+
+def schema_from_json(fields: Dict[str, str]) -> sch.Schema:
+    return sch.Schema({name: dt.dtype(dtype) for name, dtype in fields.items()})
+
+
+class MetadataCache(object):
+    def __init__(self, directory: Optional[str] = None, ttl: int = 0):
+        """Initialize a MetadataCache of a connection.
+
+        Args:
+            directory (str): The local directory holding the stored metadata of the
+                connection, or None to only memoize metadata in process.
+            ttl (int): The number of seconds stored metadata is valid for.
+        """
+        self.directory = directory
+        self.ttl = ttl
+        self._memo = {}
+
+    def _get_path(self, kind: str, names: tuple) -> str:
+        key = hashlib.sha256(
+            json.dumps([kind, *names], default=str).encode("utf-8")
+        ).hexdigest()
+        return os.path.join(self.directory, f"{key}.json")
+
+    def _read(self, path: str) -> Optional[Any]:
+        try:
+            if time.time() - os.path.getmtime(path) > self.ttl:
+                os.remove(path)
+                return None
+            with open(path) as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def _write(self, path: str, value: Any):
+        temp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(temp_path, "w") as f:
+                json.dump(value, f)
+            os.replace(temp_path, path)
+        except Exception as e:
+            logging.warning("Unable to cache metadata: %s", e)
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def get_or_load(
+        self,
+        kind: str,
+        names: tuple,
+        load: Callable[[], Any],
+        dump: Callable[[Any], Any] = None,
+        restore: Callable[[Any], Any] = None,
+        persist: bool = True,
+    ) -> Any:
+        """Return cached metadata, loading and caching it when missing or expired.
+
+        Args:
+            kind (str): The kind of metadata, e.g. "schema" or "tables".
+            names (tuple): The names of the object the metadata describes.
+            load (Callable): Loads the metadata from the database.
+            dump (Callable): Converts the metadata to JSON, defaults to the metadata itself.
+            restore (Callable): Converts JSON back to the metadata.
+            persist (bool): Whether the metadata can be stored beyond this run.
+        """
+        memo_key = (kind, *names)
+        if memo_key in self._memo:
+            return self._memo[memo_key]
+
+        path = self._get_path(kind, names) if self.directory and persist else None
+        value = None
+        if path:
+            stored = self._read(path)
+            if stored is not None:
+                try:
+                    value = restore(stored) if restore else stored
+                except Exception as e:
+                    logging.debug("Ignoring unreadable cached metadata: %s", e)
+        if value is None:
+            value = load()
+            if path:
+                self._write(path, dump(value) if dump else value)
+
+        self._memo[memo_key] = value
+        return value
+
+
+def get_metadata_cache(connection: Dict) -> MetadataCache:
+    """Return the metadata cache of a connection config, shared by all its clients in this process."""
+    if connection.get(consts.SOURCE_TYPE) in _UNCACHED_SOURCE_TYPES:
+        return MetadataCache()
+
+    ttl = int(os.environ.get(consts.ENV_METADATA_CACHE_TTL_VAR) or 0)
+    directory = None
+    if ttl > 0:
+        mgr = state_manager.StateManager()
+        if mgr.file_system == state_manager.FileSystem.LOCAL:
+            directory = os.path.join(
+                mgr.get_metadata_cache_directory(), get_connection_key(connection)
+            )
+        else:
+            logging.warning(
+                "Metadata is only cached under a local %s directory",
+                consts.ENV_DIRECTORY_VAR,
+            )
+            ttl = 0
+
+    key = (get_connection_key(connection), directory, ttl)
+    with _CACHES_LOCK:
+        if key not in _CACHES:
+            _CACHES[key] = MetadataCache(directory, ttl)
+        return _CACHES[key]
+
+
+def clear_metadata_cache(directory: str, connection: Dict = None):
+    """Remove the stored metadata of a connection, or of all connections.
+
+    Args:
+        directory (str): The root directory of the metadata cache.
+        connection (Dict): The connection config, or None for all connections.
+    """
+    connection_key = get_connection_key(connection) if connection is not None else None
+    with _CACHES_LOCK:
+        for key in list(_CACHES):
+            if connection_key in (None, key[0]):
+                del _CACHES[key]
+    if connection_key:
+        directory = os.path.join(directory, connection_key)
+    shutil.rmtree(directory, ignore_errors=True)
@@ -12,16 +12,23 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import math
 import os
 import ibis
+import numpy
 import pandas
 import logging
 import re
-from typing import List, Dict
+import sqlalchemy as sa
+from typing import List, Dict, Tuple, Union
 from argparse import Namespace
 
-from data_validation import cli_tools, consts
+from data_validation import cli_tools, clients, consts
 from data_validation.config_manager import ConfigManager
+from data_validation.partition_manifest import (
+    PartitionManifest,
+    get_partition_filter,
+)
 from data_validation.query_builder.partition_row_builder import PartitionRowBuilder
 from data_validation.validation_builder import ValidationBuilder
 from data_validation.validation_builder import list_to_sublists
@@ -61,18 +68,15 @@ class PartitionBuilder:
             A dict which represents a yaml file.
         """
         # Create multiple yaml validation blocks corresponding to the filters provided
-        yaml_validations = []
-        for (source_filter, target_filter) in zip(source_filters, target_filters):
-            filter_dict = {
-                "type": "custom",
-                "source": source_filter,
-                "target": target_filter,
-            }
-            # Append partition new filter
-            config_manager.filters.append(filter_dict)
-            yaml_validations.append(config_manager.get_yaml_validation_block())
-            config_manager.filters.pop()
+        yaml_validations = self._get_validation_blocks(
+            config_manager, source_filters, target_filters
+        )
+        return self._get_yaml_config(config_manager, yaml_validations)
 
+    def _get_yaml_config(
+        self, config_manager: ConfigManager, yaml_validations: List[Dict]
+    ) -> Dict:
+        """Return a dict which represents a yaml file holding the validation blocks."""
         yaml_config = {
             consts.YAML_SOURCE: self.args.source_conn,
             consts.YAML_TARGET: self.args.target_conn,
@@ -81,6 +85,129 @@ class PartitionBuilder:
         }
         return yaml_config
 
+    @staticmethod
+    def _get_validation_block(config_manager: ConfigManager) -> Dict:
+        """Return the validation block of a ConfigManager with its current filters."""
+        validation_block = config_manager.get_yaml_validation_block()
+        # Validations loaded from a YAML file carry the name of the file, which is not part of the block
+        validation_block.pop(consts.CONFIG_FILE, None)
+        return validation_block
+
+    @staticmethod
+    def _get_validation_blocks(
+        config_manager: ConfigManager,
+        source_filters: List[str],
+        target_filters: List[str],
+    ) -> List[Dict]:
+        """Return one validation block per pair of source and target filters, each block being
+        the validation of the ConfigManager with the partition filter appended to its filters."""
+        validation_blocks = []
+        for (source_filter, target_filter) in zip(source_filters, target_filters):
+            filter_dict = get_partition_filter(source_filter, target_filter)
+            # Append partition new filter
+            config_manager.filters.append(filter_dict)
+            validation_blocks.append(
+                PartitionBuilder._get_validation_block(config_manager)
+            )
+            config_manager.filters.pop()
+        return validation_blocks
+
+    @staticmethod
+    def split_validation(
+        config_manager: ConfigManager, split_num: int, source_count: int = None
+    ) -> List[Dict]:
+        """Split the validation of a ConfigManager into split_num smaller partitions. The existing filters
+        (including the filter of a partition generated by generate-table-partitions) are retained, so the
+        new partitions cover exactly the rows of the original validation.
+
+        Args:
+            config_manager (ConfigManager): Config manager instance of a row validation.
+            split_num (int): Number of partitions into which the validation should be split.
+            source_count (int): The number of source rows of the validation, counted when not provided.
+        Returns:
+            A list of validation blocks, one per new partition, which can be written to a yaml file.
+        """
+        # Keep using bind parameters when the partition being split has them
+        use_bind_parameters = any(
+            consts.CONFIG_FILTER_SOURCE_PARAMETERS in _
+            or consts.CONFIG_FILTER_TARGET_PARAMETERS in _
+            for _ in config_manager.filters
+        )
+        source_filters, target_filters = PartitionBuilder.get_table_partition_filters(
+            config_manager,
+            split_num,
+            source_count=source_count,
+            use_bind_parameters=use_bind_parameters,
+        )
+        return PartitionBuilder._get_validation_blocks(
+            config_manager, source_filters, target_filters
+        )
+
+    def _get_partition_num(self, config_manager: ConfigManager, row_count: int) -> int:
+        """Return the number of partitions for a table pair, either --partition-num or derived from
+        --rows-per-partition or --max-partition-mb and the source table row count and row width."""
+        if self.args.partition_num:
+            return self.args.partition_num
+
+        # Source and target rows are held in memory together while a partition is validated
+        row_bytes = 2 * self.get_source_row_bytes(config_manager)
+        if self.args.rows_per_partition:
+            rows_per_partition = self.args.rows_per_partition
+        else:
+            rows_per_partition = max(
+                1, int(self.args.max_partition_mb * 1024 * 1024 / max(row_bytes, 1))
+            )
+        partition_num = max(1, math.ceil(row_count / rows_per_partition))
+        logging.info(
+            f"{config_manager.full_source_table}: {row_count} rows of about {row_bytes} bytes, "
+            f"{partition_num} partitions of {rows_per_partition} rows, "
+            f"expected memory per partition {rows_per_partition * row_bytes / 1024 / 1024:.1f} MB"
+        )
+        if not getattr(self.args, "partition_manifest", False):
+            cli_tools.check_no_yaml_files(partition_num, self.args.parts_per_file)
+        return partition_num
+
+    @staticmethod
+    def get_source_row_bytes(config_manager: ConfigManager) -> int:
+        """Return the average in-memory size in bytes of a source row of the validation, as projected
+        by the validation query (primary keys plus hash, concat or comparison columns), from a sample."""
+        validation_builder = ValidationBuilder(config_manager)
+        sample = (
+            validation_builder.get_source_query()
+            .limit(consts.PARTITION_SAMPLE_ROWS)
+            .execute()
+        )
+        if sample.empty:
+            return 0
+        return math.ceil(
+            sample.memory_usage(index=False, deep=True).sum() / len(sample)
+        )
+
+    @staticmethod
+    def get_source_row_count(
+        config_manager: ConfigManager, estimate: bool = False
+    ) -> Tuple[int, bool]:
+        """Return the number of source rows of a validation, after applying its filters, and
+        whether it is exact rather than read from catalog statistics.
+
+        Args:
+            config_manager (ConfigManager): Config manager instance for the table pair.
+            estimate (bool): Use catalog statistics when the validation has no filters.
+        """
+        validation_builder = ValidationBuilder(config_manager)
+        source_partition_row_builder = PartitionRowBuilder(
+            config_manager.get_primary_keys_list(),
+            config_manager.source_client,
+            config_manager.source_schema,
+            config_manager.source_table,
+            config_manager.source_query,
+            validation_builder.source_builder,
+        )
+        source_count = source_partition_row_builder.get_count(estimate=estimate)
+        if isinstance(source_count, pandas.DataFrame):
+            source_count = source_count.values[0][0]
+        return int(source_count), not source_partition_row_builder.is_count_estimate
+
     def partition_configs(self) -> None:
         """Takes a list of ConfigManager object and splits each it into multiple
         ConfigManager objects applying supplied partition logic.
@@ -91,8 +218,11 @@ class PartitionBuilder:
 
         # Default partition logic: Use NTILE function to create partitions, ordering by primary keys.
         partition_filters = self._get_partition_key_filters()
-        yaml_configs_list = self._add_partition_filters(partition_filters)
-        self._store_partitions(yaml_configs_list)
+        if getattr(self.args, "partition_manifest", False):
+            self._store_partition_manifests(partition_filters)
+        else:
+            yaml_configs_list = self._add_partition_filters(partition_filters)
+            self._store_partitions(yaml_configs_list)
 
     @staticmethod
     def _extract_where(table_expr, client) -> str:
@@ -114,6 +244,50 @@ class PartitionBuilder:
             r"\s\s+", " ", ibis.to_sql(table_expr).sql.split("WHERE")[1]
         ).replace("t0.", "")
 
+    @staticmethod
+    def _extract_where_with_parameters(table_expr, client) -> Tuple[str, Dict]:
+        """Given a ibis table expression with a filter (i.e. WHERE) clause on a SQLAlchemy backend, this
+        function extracts the where clause with the key values as named bind parameters (:dvt_p0, ...).
+        Partitions of the same shape then share the same SQL text, which the database can parse once.
+
+        Returns:
+            Tuple with the where condition and a dict of the bind parameter values
+        """
+        dialect_class = sa.dialects.registry.load(
+            client.compiler.translator_class._dialect_name
+        )
+        compiled = client.compile(table_expr).compile(
+            dialect=dialect_class(paramstyle="named")
+        )
+        where = re.sub(r"\s\s+", " ", str(compiled).split("WHERE")[1]).replace(
+            "t0.", ""
+        )
+        params = {}
+        for ind, (name, value) in enumerate(compiled.params.items()):
+            bind_name = f"{consts.PARTITION_BIND_PARAMETER_PREFIX}{ind}"
+            where = re.sub(rf":{name}\b", f":{bind_name}", where)
+            params[bind_name] = PartitionBuilder._get_bind_value(value)
+        return where, params
+
+    @staticmethod
+    def _get_bind_value(value):
+        """Return a bind parameter value as a plain Python type, see partition_manifest.dump_bind_parameters."""
+        if isinstance(value, numpy.generic):
+            value = value.item()
+        if isinstance(value, pandas.Timestamp):
+            value = value.to_pydatetime()
+        return value
+
+    @staticmethod
+    def _extract_partition_filter(
+        table_expr, client, use_bind_parameters: bool = False
+    ) -> Union[str, Tuple[str, Dict]]:
+        """Return the where clause of a partition, with bind parameters when requested and
+        supported by the client, see partition_manifest.get_partition_filter."""
+        if use_bind_parameters and client.name in clients.IBIS_ALCHEMY_BACKENDS:
+            return PartitionBuilder._extract_where_with_parameters(table_expr, client)
+        return PartitionBuilder._extract_where(table_expr, client)
+
     def _get_partition_key_filters(self) -> List[List[List[str]]]:
         """The PartitionBuilder object contains the configuration of the table pairs (source and target)
            to be validated and the args (number of partitions). Generate the partitions for each table
@@ -125,238 +299,293 @@ class PartitionBuilder:
             A list of list of list of strings for the source and target tables for each table pair
             i.e. (list of strings - 1 per partition) x (source and target) x (number of table pairs)
         """
+        use_row_count_estimate = getattr(self.args, "row_count_estimate", False)
         master_filter_list = []
         for config_manager in self.config_managers:  # For each pair of tables
-            validation_builder = ValidationBuilder(config_manager)
-
-            source_pks, target_pks = [], []
-            for pk in config_manager.primary_keys:
-                source_pks.append(pk["source_column"])
-                target_pks.append(pk["target_column"])
-
-            source_partition_row_builder = PartitionRowBuilder(
-                source_pks,
-                config_manager.source_client,
-                config_manager.source_schema,
-                config_manager.source_table,
-                config_manager.source_query,
-                validation_builder.source_builder,
+            row_count, is_exact = (
+                (None, False)
+                if self.args.partition_num
+                else self.get_source_row_count(
+                    config_manager, estimate=use_row_count_estimate
+                )
             )
-            source_table = source_partition_row_builder.query
-            target_partition_row_builder = PartitionRowBuilder(
-                target_pks,
-                config_manager.target_client,
-                config_manager.target_schema,
-                config_manager.target_table,
-                config_manager.target_query,
-                validation_builder.target_builder,
+            master_filter_list.append(
+                self.get_table_partition_filters(
+                    config_manager,
+                    self._get_partition_num(config_manager, row_count),
+                    # An estimated row count only sizes the partitions, the boundaries
+                    # are placed with an exact count
+                    source_count=row_count if is_exact else None,
+                    use_row_count_estimate=use_row_count_estimate,
+                    use_bind_parameters=getattr(
+                        self.args, "bind_partition_filters", False
+                    ),
+                )
             )
-            target_table = target_partition_row_builder.query
+        return master_filter_list
+
+    @staticmethod
+    def _get_single_partition_filters() -> List[List[str]]:
+        """Return the source and target filters of a single partition holding all the rows."""
+        return [[consts.PARTITION_ALL_ROWS_FILTER], [consts.PARTITION_ALL_ROWS_FILTER]]
+
+    @staticmethod
+    def get_table_partition_filters(
+        config_manager: ConfigManager,
+        partition_num: int,
+        source_count: int = None,
+        use_row_count_estimate: bool = False,
+        use_bind_parameters: bool = False,
+    ) -> List[List[str]]:
+        """Generate the partition filters for a single table pair. The filters of the ConfigManager
+           are applied before the partitions are calculated, which allows an existing partition to be
+           split further by calling this method with the partition filter in place.
+
+        Args:
+            config_manager (ConfigManager): Config manager instance for the table pair.
+            partition_num (int): Number of partitions requested. A single partition covers all the rows.
+            source_count (int): The exact number of source rows, counted when not provided.
+            use_row_count_estimate (bool): Use catalog statistics for the target row count, which only
+                serves the row count difference warning. The partition boundaries are always placed
+                with the exact source row count, as stale statistics would misplace them.
+            use_bind_parameters (bool): Return (filter, bind parameters) tuples for SQLAlchemy backends.
+        Returns:
+            A list of two lists of strings, the source and target filters - 1 per partition.
+        """
+        validation_builder = ValidationBuilder(config_manager)
+
+        source_pks, target_pks = [], []
+        for pk in config_manager.primary_keys:
+            source_pks.append(pk["source_column"])
+            target_pks.append(pk["target_column"])
+
+        source_partition_row_builder = PartitionRowBuilder(
+            source_pks,
+            config_manager.source_client,
+            config_manager.source_schema,
+            config_manager.source_table,
+            config_manager.source_query,
+            validation_builder.source_builder,
+        )
+        source_table = source_partition_row_builder.query
+        target_partition_row_builder = PartitionRowBuilder(
+            target_pks,
+            config_manager.target_client,
+            config_manager.target_schema,
+            config_manager.target_table,
+            config_manager.target_query,
+            validation_builder.target_builder,
+        )
+        target_table = target_partition_row_builder.query
 
-            # Get Source and Target row Count
+        # Get Source and Target row Count
+        if source_count is None:
             source_count = source_partition_row_builder.get_count()
-            target_count = target_partition_row_builder.get_count()
-
-            # For some reason Teradata connector returns a dataframe with the count element,
-            # while the other connectors return a numpy.int64 value
-            if isinstance(source_count, pandas.DataFrame):
-                source_count = source_count.values[0][0]
-            if isinstance(target_count, pandas.DataFrame):
-                target_count = target_count.values[0][0]
-
-            if abs(source_count - target_count) > source_count * 0.1:
-                logging.warning(
-                    "Source and Target table row counts vary by more than 10%,"
-                    "partitioning may result in partitions with very different sizes"
-                )
+        target_count = target_partition_row_builder.get_count(
+            estimate=use_row_count_estimate
+        )
 
-            # Decide on number of partitions after checking number requested is not > number of rows in source
-            number_of_part = (
-                self.args.partition_num
-                if self.args.partition_num < source_count
-                else source_count
+        # For some reason Teradata connector returns a dataframe with the count element,
+        # while the other connectors return a numpy.int64 value
+        if isinstance(source_count, pandas.DataFrame):
+            source_count = source_count.values[0][0]
+        if isinstance(target_count, pandas.DataFrame):
+            target_count = target_count.values[0][0]
+
+        if abs(source_count - target_count) > source_count * 0.1:
+            logging.warning(
+                "Source and Target table row counts vary by more than 10%,"
+                "partitioning may result in partitions with very different sizes"
             )
 
-            # First we number each row in the source table. Using row_number instead of ntile since it is
-            # available on all platforms (Teradata does not support NTILE). For our purposes, it is likely
-            # more efficient
-            window1 = ibis.window(order_by=source_pks)
-            row_number = (ibis.row_number().over(window1) + 1).name(consts.DVT_POS_COL)
-
-            if config_manager.trim_string_pks():
-                dvt_keys = []
-                for key in source_pks.copy():
-                    if source_table[key].type().is_string():
-                        rstrip_key = source_table[key].rstrip().name(key)
-                        dvt_keys.append(rstrip_key)
-                    else:
-                        dvt_keys.append(key)
-            else:
-                dvt_keys = source_pks.copy()
-
-            dvt_keys.append(row_number)
-            rownum_table = source_table.select(dvt_keys)
-            # Rownum table is just the primary key columns in the source table along with
-            # an additional column with the row number associated with each row.
-
-            # This rather complicated expression below is a filter (where) clause condition that filters the row numbers
-            # that correspond to the first element of the partition. The number of a partition is
-            # ceiling(row number * # of partitions / total number of rows). The first element of the partition is where
-            # the remainder, i.e. row number * # of partitions % total number of rows is > 0 and <= number of partitions.
-            # The remainder function does not work well with Teradata, hence writing that out explicitly.
-            cond = (
-                rownum_table
-                if source_count == number_of_part
-                else (
-                    (
-                        rownum_table[consts.DVT_POS_COL] * number_of_part
-                        - (
-                            rownum_table[consts.DVT_POS_COL]
-                            * number_of_part
-                            / source_count
-                        ).floor()
-                        * source_count
-                    )
-                    <= number_of_part
+        # Decide on number of partitions after checking number requested is not > number of rows in source
+        number_of_part = partition_num if partition_num < source_count else source_count
+        if number_of_part <= 1:
+            return PartitionBuilder._get_single_partition_filters()
+
+        # First we number each row in the source table. Using row_number instead of ntile since it is
+        # available on all platforms (Teradata does not support NTILE). For our purposes, it is likely
+        # more efficient
+        window1 = ibis.window(order_by=source_pks)
+        row_number = (ibis.row_number().over(window1) + 1).name(consts.DVT_POS_COL)
+
+        if config_manager.trim_string_pks():
+            dvt_keys = []
+            for key in source_pks.copy():
+                if source_table[key].type().is_string():
+                    rstrip_key = source_table[key].rstrip().name(key)
+                    dvt_keys.append(rstrip_key)
+                else:
+                    dvt_keys.append(key)
+        else:
+            dvt_keys = source_pks.copy()
+
+        dvt_keys.append(row_number)
+        rownum_table = source_table.select(dvt_keys)
+        # Rownum table is just the primary key columns in the source table along with
+        # an additional column with the row number associated with each row.
+
+        # This rather complicated expression below is a filter (where) clause condition that filters the row numbers
+        # that correspond to the first element of the partition. The number of a partition is
+        # ceiling(row number * # of partitions / total number of rows). The first element of the partition is where
+        # the remainder, i.e. row number * # of partitions % total number of rows is > 0 and <= number of partitions.
+        # The remainder function does not work well with Teradata, hence writing that out explicitly.
+        cond = (
+            rownum_table
+            if source_count == number_of_part
+            else (
+                (
+                    rownum_table[consts.DVT_POS_COL] * number_of_part
+                    - (
+                        rownum_table[consts.DVT_POS_COL] * number_of_part / source_count
+                    ).floor()
+                    * source_count
                 )
-                & (
-                    (
-                        rownum_table[consts.DVT_POS_COL] * number_of_part
-                        - (
-                            rownum_table[consts.DVT_POS_COL]
-                            * number_of_part
-                            / source_count
-                        ).floor()
-                        * source_count
-                    )
-                    > 0
+                <= number_of_part
+            )
+            & (
+                (
+                    rownum_table[consts.DVT_POS_COL] * number_of_part
+                    - (
+                        rownum_table[consts.DVT_POS_COL] * number_of_part / source_count
+                    ).floor()
+                    * source_count
                 )
+                > 0
             )
-            first_keys_table = rownum_table[cond].order_by(source_pks)
-
-            # Up until this point, we have built the table expression, have not executed the query yet.
-            # The query is now executed to find the first element of each partition
-            first_elements = first_keys_table.execute().to_numpy()
-
-            # Once we have the first element of each partition, we can generate the where clause
-            # i.e. greater than or equal to first element and less than first element of next partition
-            # The first and the last partitions have special where clauses - less than first element of second
-            # partition and greater than or equal to the first element of the last partition respectively
-            source_where_list = []
-            target_where_list = []
-
-            # Given a list of primary keys and corresponding values, the following lambda function builds the filter expression
-            # to find all rows before the row containing the values in the sort order. The next function geq_value, finds all
-            # rows after the row containing the values in the sort order, including the row specified by values.
-
-            def less_than_value(table, keys, values):
-                key_column = table.__getattr__(keys[0])
-                if key_column.type().is_date():
-                    # Ensure date PKs are treated as date literals as per #1191
-                    value = values[0].date()
-                else:
-                    value = values[0]
+        )
+        first_keys_table = rownum_table[cond].order_by(source_pks)
+
+        # Up until this point, we have built the table expression, have not executed the query yet.
+        # The query is now executed to find the first element of each partition
+        first_elements = first_keys_table.execute().to_numpy()
+        if first_elements.shape[0] < 2:
+            # Rows were deleted since they were counted
+            return PartitionBuilder._get_single_partition_filters()
+
+        # Once we have the first element of each partition, we can generate the where clause
+        # i.e. greater than or equal to first element and less than first element of next partition
+        # The first and the last partitions have special where clauses - less than first element of second
+        # partition and greater than or equal to the first element of the last partition respectively
+        source_where_list = []
+        target_where_list = []
+
+        # Given a list of primary keys and corresponding values, the following lambda function builds the filter expression
+        # to find all rows before the row containing the values in the sort order. The next function geq_value, finds all
+        # rows after the row containing the values in the sort order, including the row specified by values.
+
+        def less_than_value(table, keys, values):
+            key_column = table.__getattr__(keys[0])
+            if key_column.type().is_date():
+                # Ensure date PKs are treated as date literals as per #1191
+                value = values[0].date()
+            else:
+                value = values[0]
 
-                if len(keys) == 1:
-                    return key_column < value
-                else:
-                    return (key_column < value) | (
-                        (key_column == value)
-                        & less_than_value(table, keys[1:], values[1:])
-                    )
-
-            def geq_value(table, keys, values):
-                key_column = table.__getattr__(keys[0])
-                if key_column.type().is_date():
-                    value = values[0].date()
-                else:
-                    value = values[0]
+            if len(keys) == 1:
+                return key_column < value
+            else:
+                return (key_column < value) | (
+                    (key_column == value) & less_than_value(table, keys[1:], values[1:])
+                )
 
-                if len(keys) == 1:
-                    return key_column >= value
-                else:
-                    return (key_column > value) | (
-                        (key_column == value) & geq_value(table, keys[1:], values[1:])
-                    )
+        def geq_value(table, keys, values):
+            key_column = table.__getattr__(keys[0])
+            if key_column.type().is_date():
+                value = values[0].date()
+            else:
+                value = values[0]
 
-            filter_source_clause = less_than_value(
-                source_table,
-                source_pks,
-                first_elements[1, : len(source_pks)],
-            )
-            filter_target_clause = less_than_value(
-                target_table,
-                target_pks,
-                first_elements[1, : len(target_pks)],
-            )
-            source_where_list.append(
-                self._extract_where(
-                    source_table.filter(filter_source_clause),
-                    config_manager.source_client,
+            if len(keys) == 1:
+                return key_column >= value
+            else:
+                return (key_column > value) | (
+                    (key_column == value) & geq_value(table, keys[1:], values[1:])
                 )
+
+        filter_source_clause = less_than_value(
+            source_table,
+            source_pks,
+            first_elements[1, : len(source_pks)],
+        )
+        filter_target_clause = less_than_value(
+            target_table,
+            target_pks,
+            first_elements[1, : len(target_pks)],
+        )
+        source_where_list.append(
+            PartitionBuilder._extract_partition_filter(
+                source_table.filter(filter_source_clause),
+                config_manager.source_client,
+                use_bind_parameters,
             )
-            target_where_list.append(
-                self._extract_where(
-                    target_table.filter(filter_target_clause),
-                    config_manager.target_client,
-                )
+        )
+        target_where_list.append(
+            PartitionBuilder._extract_partition_filter(
+                target_table.filter(filter_target_clause),
+                config_manager.target_client,
+                use_bind_parameters,
             )
+        )
 
-            for i in range(1, first_elements.shape[0] - 1):
-                filter_source_clause = geq_value(
-                    source_table,
-                    source_pks,
-                    first_elements[i, : len(source_pks)],
-                ) & less_than_value(
-                    source_table,
-                    source_pks,
-                    first_elements[i + 1, : len(source_pks)],
-                )
-                filter_target_clause = geq_value(
-                    target_table,
-                    target_pks,
-                    first_elements[i, : len(target_pks)],
-                ) & less_than_value(
-                    target_table,
-                    target_pks,
-                    first_elements[i + 1, : len(target_pks)],
-                )
-                source_where_list.append(
-                    self._extract_where(
-                        source_table.filter(filter_source_clause),
-                        config_manager.source_client,
-                    )
-                )
-                target_where_list.append(
-                    self._extract_where(
-                        target_table.filter(filter_target_clause),
-                        config_manager.target_client,
-                    )
-                )
+        for i in range(1, first_elements.shape[0] - 1):
             filter_source_clause = geq_value(
                 source_table,
                 source_pks,
-                first_elements[len(first_elements) - 1, : len(source_pks)],
+                first_elements[i, : len(source_pks)],
+            ) & less_than_value(
+                source_table,
+                source_pks,
+                first_elements[i + 1, : len(source_pks)],
             )
             filter_target_clause = geq_value(
                 target_table,
                 target_pks,
-                first_elements[len(first_elements) - 1, : len(target_pks)],
+                first_elements[i, : len(target_pks)],
+            ) & less_than_value(
+                target_table,
+                target_pks,
+                first_elements[i + 1, : len(target_pks)],
             )
             source_where_list.append(
-                self._extract_where(
+                PartitionBuilder._extract_partition_filter(
                     source_table.filter(filter_source_clause),
                     config_manager.source_client,
+                    use_bind_parameters,
                 )
             )
             target_where_list.append(
-                self._extract_where(
+                PartitionBuilder._extract_partition_filter(
                     target_table.filter(filter_target_clause),
                     config_manager.target_client,
+                    use_bind_parameters,
                 )
             )
-            master_filter_list.append([source_where_list, target_where_list])
-        return master_filter_list
+        filter_source_clause = geq_value(
+            source_table,
+            source_pks,
+            first_elements[len(first_elements) - 1, : len(source_pks)],
+        )
+        filter_target_clause = geq_value(
+            target_table,
+            target_pks,
+            first_elements[len(first_elements) - 1, : len(target_pks)],
+        )
+        source_where_list.append(
+            PartitionBuilder._extract_partition_filter(
+                source_table.filter(filter_source_clause),
+                config_manager.source_client,
+                use_bind_parameters,
+            )
+        )
+        target_where_list.append(
+            PartitionBuilder._extract_partition_filter(
+                target_table.filter(filter_target_clause),
+                config_manager.target_client,
+                use_bind_parameters,
+            )
+        )
+        return [source_where_list, target_where_list]
 
     def _add_partition_filters(
         self,
@@ -428,3 +657,59 @@ class PartitionBuilder:
         logging.info(
             f"Success! Table partition configs written to directory: {self.config_dir}"
         )
+
+    def _get_partition_manifests(
+        self, partition_filters: List[List[List[str]]]
+    ) -> List[Dict]:
+        """Build one PartitionManifest per table pair from the partition filters.
+
+        Args:
+            partition_filters: (list of filter strings, one per partition) x 2 (source & target) x number of table pairs
+        Returns:
+            List of dicts with the target folder name and the PartitionManifest, one for each table pair.
+        """
+        manifests = []
+        for ind, config_manager in enumerate(self.config_managers):
+            source_filters, target_filters = partition_filters[ind]
+            # The base validation is stored without a partition filter
+            yaml_config = self._get_yaml_config(
+                config_manager, [self._get_validation_block(config_manager)]
+            )
+            manifests.append(
+                {
+                    "target_folder_name": config_manager.full_source_table,
+                    "manifest": PartitionManifest.build(
+                        yaml_config,
+                        list(zip(source_filters, target_filters)),
+                        self.args.parts_per_file,
+                    ),
+                }
+            )
+        return manifests
+
+    def _store_partition_manifests(
+        self, partition_filters: List[List[List[str]]]
+    ) -> None:
+        """Save one partition manifest per table pair to the target folder
+
+        Args:
+            partition_filters: (list of filter strings, one per partition) x 2 (source & target) x number of table pairs
+
+        Returns:
+            None
+        """
+        logging.info(
+            f"Writing table partition manifests to directory: {self.config_dir}"
+        )
+
+        for table in self._get_partition_manifests(partition_filters):
+            target_folder_path = os.path.join(
+                self.config_dir, table["target_folder_name"]
+            )
+            table["manifest"].store(
+                os.path.join(target_folder_path, consts.PARTITION_MANIFEST_FILE)
+            )
+
+        logging.info(
+            f"Success! Table partition manifests written to directory: {self.config_dir}"
+        )
@@ -0,0 +1,212 @@
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""A compact alternative to one YAML file per chunk of table partitions.
+
+A partition manifest is a single JSON file per table pair holding the base validation
+once plus the list of (source filter, target filter) boundaries of every partition:
+
+    {
+        "source": "source_conn",
+        "target": "target_conn",
+        "result_handler": {},
+        "parts_per_file": 1,
+        "validation": {...},
+        "partitions": [["id < 100", "id < 100"], ["id >= 100", "id >= 100"]]
+    }
+
+A filter may also be a [where clause, bind parameters] pair, see get_partition_filter.
+Date, timestamp and decimal bind parameters are stored with their type, e.g.
+{"type": "date", "value": "2024-01-31"}, see dump_bind_parameters.
+
+Partitions are grouped into tasks of parts_per_file partitions, task N being the
+equivalent of the YAML file N generated without a manifest.
+"""
+
+import copy
+import datetime
+import decimal
+import json
+import math
+import os
+from typing import Dict, Iterator, List
+
+from data_validation import consts, gcs_helper
+
+
+class PartitionManifest(object):
+    def __init__(self, manifest: Dict):
+        """Initialize a PartitionManifest from the deserialized manifest file.
+
+        Args:
+            manifest (Dict): The manifest, as written by PartitionBuilder.
+        """
+        self._manifest = manifest
+
+    @staticmethod
+    def build(yaml_config: Dict, partitions: List[List[str]], parts_per_file: int):
+        """Return a PartitionManifest for a base YAML config and its partition filters.
+
+        Args:
+            yaml_config (Dict): A YAML config dict with a single validation, without partition filter.
+            partitions (List[List[str]]): (source filter, target filter) for each partition.
+            parts_per_file (int): Number of partitions validated by each task.
+        """
+        return PartitionManifest(
+            {
+                consts.YAML_SOURCE: yaml_config[consts.YAML_SOURCE],
+                consts.YAML_TARGET: yaml_config[consts.YAML_TARGET],
+                consts.YAML_RESULT_HANDLER: yaml_config[consts.YAML_RESULT_HANDLER],
+                consts.MANIFEST_PARTS_PER_FILE: parts_per_file,
+                consts.MANIFEST_VALIDATION: yaml_config[consts.YAML_VALIDATIONS][0],
+                consts.MANIFEST_PARTITIONS: [
+                    [
+                        _ if isinstance(_, str) else [_[0], dump_bind_parameters(_[1])]
+                        for _ in partition
+                    ]
+                    for partition in partitions
+                ],
+            }
+        )
+
+    @staticmethod
+    def read(file_path: str):
+        """Return the PartitionManifest stored in a local or GCS file."""
+        return PartitionManifest(json.loads(gcs_helper.read_file(file_path)))
+
+    def store(self, file_path: str):
+        """Write the manifest to a local or GCS file."""
+        gcs_helper.write_file(file_path, json.dumps(self._manifest), include_log=False)
+
+    @property
+    def partitions(self) -> List[List[str]]:
+        return self._manifest[consts.MANIFEST_PARTITIONS]
+
+    @property
+    def parts_per_file(self) -> int:
+        return self._manifest.get(consts.MANIFEST_PARTS_PER_FILE) or 1
+
+    def __len__(self) -> int:
+        """Return the number of tasks, i.e. the number of YAML files the manifest replaces."""
+        return math.ceil(len(self.partitions) / self.parts_per_file)
+
+    def get_validation(self, partition_index: int) -> Dict:
+        """Return the validation block of a single partition."""
+        source_filter, target_filter = self.partitions[partition_index]
+        validation = copy.deepcopy(self._manifest[consts.MANIFEST_VALIDATION])
+        validation[consts.CONFIG_FILTERS] = (
+            validation.get(consts.CONFIG_FILTERS) or []
+        ) + [get_partition_filter(source_filter, target_filter)]
+        return validation
+
+    def get_yaml_config(self, task_index: int) -> Dict:
+        """Return the YAML config dict of a task, equivalent to YAML file task_index.
+
+        Args:
+            task_index (int): Index of the task, i.e. JOB_COMPLETION_INDEX in Kubernetes.
+        """
+        if task_index < 0 or task_index >= len(self):
+            raise ValueError(
+                f"Partition manifest task index {task_index} out of range, the manifest has {len(self)} tasks"
+            )
+        first = task_index * self.parts_per_file
+        last = min(first + self.parts_per_file, len(self.partitions))
+        return {
+            consts.YAML_SOURCE: self._manifest[consts.YAML_SOURCE],
+            consts.YAML_TARGET: self._manifest[consts.YAML_TARGET],
+            consts.YAML_RESULT_HANDLER: self._manifest[consts.YAML_RESULT_HANDLER],
+            consts.YAML_VALIDATIONS: [
+                self.get_validation(_) for _ in range(first, last)
+            ],
+        }
+
+    def iter_yaml_configs(self) -> Iterator[Dict]:
+        """Lazily yield the YAML config dict of each task in order."""
+        for task_index in range(len(self)):
+            yield self.get_yaml_config(task_index)
+
+
+def get_partition_filter(source_filter, target_filter) -> Dict:
+    """Return the custom filter of a partition.
+
+    Args:
+        source_filter, target_filter: The where clause of the partition, or a (where clause,
+            bind parameters) pair when generated with --bind-partition-filters.
+    """
+    partition_filter = {consts.CONFIG_TYPE: consts.FILTER_TYPE_CUSTOM}
+    for side, side_filter, params_key in (
+        (
+            consts.CONFIG_FILTER_SOURCE,
+            source_filter,
+            consts.CONFIG_FILTER_SOURCE_PARAMETERS,
+        ),
+        (
+            consts.CONFIG_FILTER_TARGET,
+            target_filter,
+            consts.CONFIG_FILTER_TARGET_PARAMETERS,
+        ),
+    ):
+        if isinstance(side_filter, (list, tuple)):
+            partition_filter[side] = side_filter[0]
+            partition_filter[params_key] = dump_bind_parameters(side_filter[1])
+        else:
+            partition_filter[side] = side_filter
+    return partition_filter
+
+
+# Bind parameter types which JSON and YAML files do not restore on their own
+_BIND_PARAMETER_TYPES = {
+    "date": (datetime.date, datetime.date.fromisoformat),
+    "timestamp": (datetime.datetime, datetime.datetime.fromisoformat),
+    "decimal": (decimal.Decimal, decimal.Decimal),
+}
+
+
+def dump_bind_parameters(params: Dict) -> Dict:
+    """Return bind parameters with date, timestamp and decimal values stored as
+    {"type": ..., "value": ...} so they are bound with their type after being read back."""
+    dumped = {}
+    for name, value in params.items():
+        # datetime is a subclass of date, check the most specific type first
+        for type_name in ("timestamp", "date", "decimal"):
+            if isinstance(value, _BIND_PARAMETER_TYPES[type_name][0]):
+                value = {
+                    consts.CONFIG_TYPE: type_name,
+                    "value": value.isoformat()
+                    if type_name != "decimal"
+                    else str(value),
+                }
+                break
+        dumped[name] = value
+    return dumped
+
+
+def load_bind_parameters(params: Dict) -> Dict:
+    """Return bind parameters with the typed values of dump_bind_parameters restored."""
+    if not params:
+        return params
+    loaded = {}
+    for name, value in params.items():
+        if isinstance(value, dict) and value.get(consts.CONFIG_TYPE) in (
+            _BIND_PARAMETER_TYPES
+        ):
+            value = _BIND_PARAMETER_TYPES[value[consts.CONFIG_TYPE]][1](value["value"])
+        loaded[name] = value
+    return loaded
+
+
+def is_manifest_file(file_path: str) -> bool:
+    """Return True if the file path names a partition manifest."""
+    return bool(file_path) and (
+        os.path.basename(file_path) == consts.PARTITION_MANIFEST_FILE
+    )
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import logging
+
 import ibis
 from data_validation import clients
 from data_validation.query_builder.query_builder import QueryBuilder
@@ -37,6 +39,12 @@ class PartitionRowBuilder(object):
             query_builder (QueryBuilder): QueryBuilder object.
         """
         self.primary_keys = primary_keys
+        self.data_client = data_client
+        self.schema_name = schema_name
+        self.table_name = table_name
+        self.is_filtered = False
+        # Whether the last count was read from catalog statistics
+        self.is_count_estimate = False
         self.query = self._compile_query(
             data_client, schema_name, table_name, custom_query, query_builder
         )
@@ -63,9 +71,27 @@ class PartitionRowBuilder(object):
         else:
             table = clients.get_ibis_query(data_client, custom_query)
         compiled_filters = query_builder.compile_filter_fields(table)
+        self.is_filtered = bool(compiled_filters)
         filtered_table = table.filter(compiled_filters) if compiled_filters else table
         return filtered_table
 
-    def get_count(self) -> int:
-        """Return a count of rows of primary keys - they should be all distinct"""
+    def get_count(self, estimate: bool = False) -> int:
+        """Return a count of rows of primary keys - they should be all distinct
+
+        Args:
+            estimate (bool): Read the row count from catalog statistics instead of counting the rows.
+                The exact count is still used for custom queries, filtered tables and when statistics
+                are missing.
+        """
+        if estimate and self.table_name and not self.is_filtered:
+            row_count = clients.get_table_row_count_estimate(
+                self.data_client, self.schema_name, self.table_name
+            )
+            if row_count is not None:
+                self.is_count_estimate = True
+                return row_count
+            logging.info(
+                f"No row count statistics for {self.schema_name}.{self.table_name}, counting rows instead"
+            )
+        self.is_count_estimate = False
         return self.query[self.primary_keys].count().force_cast("int64").execute()
@@ -12,15 +12,35 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import datetime
+import functools
 import logging
+import math
+import operator
+
 import ibis
+import pandas
 from data_validation import consts
 from ibis.expr.types import StringScalar
 from third_party.ibis.ibis_addon import api, operations
 
+# The partial states from which each aggregation type can be merged
+PARTIAL_STATES = {
+    "count": ["count"],
+    "null_count": ["null_count"],
+    "sum": ["sum", "count"],
+    "min": ["min"],
+    "max": ["max"],
+    "bit_xor": ["bit_xor", "count"],
+    "avg": ["sum", "count"],
+    "std": ["count", "avg", "var"],
+}
+
 
 class AggregateField(object):
-    def __init__(self, ibis_expr, field_name=None, alias=None, cast=None):
+    def __init__(
+        self, ibis_expr, field_name=None, alias=None, cast=None, aggregate_type=None
+    ):
         """A representation of a table or column aggregate in Ibis
 
         Args:
@@ -28,11 +48,13 @@ class AggregateField(object):
             field_name (String: A field to act on in the table.
                 Table level expr do not have a field name
             alias (String): A field to use as the aggregate alias name
+            aggregate_type (String): The aggregation type, e.g. sum, used to merge partial aggregates
         """
         self.expr = ibis_expr
         self.field_name = field_name
         self.alias = alias
         self.cast = cast
+        self.aggregate_type = aggregate_type
 
     @staticmethod
     def count(field_name=None, alias=None, cast=None):
@@ -42,6 +64,7 @@ class AggregateField(object):
                 field_name=field_name,
                 alias=alias,
                 cast=cast,
+                aggregate_type="count",
             )
         else:
             return AggregateField(
@@ -49,6 +72,7 @@ class AggregateField(object):
                 field_name=field_name,
                 alias=alias,
                 cast=cast,
+                aggregate_type="count",
             )
 
     @staticmethod
@@ -58,6 +82,7 @@ class AggregateField(object):
             field_name=field_name,
             alias=alias,
             cast=cast,
+            aggregate_type="min",
         )
 
     @staticmethod
@@ -67,6 +92,7 @@ class AggregateField(object):
             field_name=field_name,
             alias=alias,
             cast=cast,
+            aggregate_type="avg",
         )
 
     @staticmethod
@@ -76,6 +102,7 @@ class AggregateField(object):
             field_name=field_name,
             alias=alias,
             cast=cast,
+            aggregate_type="max",
         )
 
     @staticmethod
@@ -85,6 +112,7 @@ class AggregateField(object):
             field_name=field_name,
             alias=alias,
             cast=cast,
+            aggregate_type="sum",
         )
 
     @staticmethod
@@ -94,6 +122,7 @@ class AggregateField(object):
             field_name=field_name,
             alias=alias,
             cast=cast,
+            aggregate_type="bit_xor",
         )
 
     @staticmethod
@@ -103,13 +132,79 @@ class AggregateField(object):
             field_name=field_name,
             alias=alias,
             cast=cast,
+            aggregate_type="std",
         )
 
-    def compile(self, ibis_table):
+    @staticmethod
+    def approx_count_distinct(field_name=None, alias=None, cast=None):
+        return AggregateField(
+            ibis.expr.types.Column.approx_nunique,
+            field_name=field_name,
+            alias=alias,
+            cast=cast,
+            aggregate_type="approx_count_distinct",
+        )
+
+    @staticmethod
+    def approx_median(field_name=None, alias=None, cast=None):
+        return AggregateField(
+            ibis.expr.types.Column.approx_median,
+            field_name=field_name,
+            alias=alias,
+            cast=cast,
+            aggregate_type="approx_median",
+        )
+
+    @staticmethod
+    def null_count(field_name=None, alias=None, cast=None):
+        def null_count(column, where=None):
+            # SUM is NULL over no rows, an empty table has no nulls
+            return column.isnull().ifelse(1, 0).sum(where=where).coalesce(0)
+
+        return AggregateField(
+            null_count,
+            field_name=field_name,
+            alias=alias,
+            cast=cast,
+            aggregate_type="null_count",
+        )
+
+    @staticmethod
+    def bucket_count(field_name=None, alias=None, cast=None, lower=None, upper=None):
+        """Count the values in the histogram bucket [lower, upper), unbounded if None."""
+
+        def bucket_count(column, where=None):
+            conditions = [] if where is None else [where]
+            if lower is not None:
+                conditions.append(column >= lower)
+            if upper is not None:
+                conditions.append(column < upper)
+            return column.count(
+                where=functools.reduce(operator.and_, conditions)
+                if conditions
+                else None
+            )
+
+        return AggregateField(
+            bucket_count,
+            field_name=field_name,
+            alias=alias,
+            cast=cast,
+            aggregate_type="bucket_count",
+        )
+
+    def compile(self, ibis_table, where=None):
+        """Return the aggregate expression.
+
+        Args:
+            ibis_table (IbisTable): The table to aggregate.
+            where (BooleanValue): Optional filter, only rows matching it are aggregated.
+        """
+        agg_kwargs = {} if where is None else {"where": where}
         if self.field_name:
-            agg_field = self.expr(ibis_table[self.field_name])
+            agg_field = self.expr(ibis_table[self.field_name], **agg_kwargs)
         else:
-            agg_field = self.expr(ibis_table)
+            agg_field = self.expr(ibis_table, **agg_kwargs)
 
         if self.cast:
             agg_field = agg_field.force_cast(self.cast)
@@ -119,6 +214,80 @@ class AggregateField(object):
 
         return agg_field
 
+    def is_mergeable(self) -> bool:
+        """Return True if the aggregate can be computed from partial aggregates of slices of a table."""
+        return self.aggregate_type in PARTIAL_STATES and not self.cast
+
+    def _get_partial_alias(self, state):
+        return f"{self.alias}{consts.PARTIAL_STATE_SEPARATOR}{state}"
+
+    def get_partials(self):
+        """Return the AggregateFields of the partial states of this aggregate, which can be computed
+        over disjoint slices of a table and combined with merge_partials:
+            count, null_count: the partial count
+            sum, bit_xor: the partial aggregate and the count of non null values
+            min, max: the partial aggregate
+            avg: (sum, count)
+            std: (count, avg, population variance)
+        """
+        partials = []
+        for state in PARTIAL_STATES[self.aggregate_type]:
+            if state == "var":
+                partials.append(
+                    AggregateField(
+                        lambda column, **kwargs: column.var(how="pop", **kwargs),
+                        field_name=self.field_name,
+                        alias=self._get_partial_alias(state),
+                    )
+                )
+            else:
+                partials.append(
+                    getattr(AggregateField, state)(
+                        field_name=self.field_name, alias=self._get_partial_alias(state)
+                    )
+                )
+        return partials
+
+    def merge_partials(self, partials_df):
+        """Return the value of the aggregate from the partial states of each slice.
+
+        Args:
+            partials_df (DataFrame): One row per slice with the columns of get_partials.
+        """
+        states = {
+            state: partials_df[self._get_partial_alias(state)]
+            for state in PARTIAL_STATES[self.aggregate_type]
+        }
+        if self.aggregate_type in ("count", "null_count"):
+            return states[self.aggregate_type].sum()
+        if self.aggregate_type in ("min", "max"):
+            values = states[self.aggregate_type].dropna()
+            if values.empty:
+                return None
+            return values.min() if self.aggregate_type == "min" else values.max()
+
+        # Slices without values return NULL partial aggregates
+        non_empty = states["count"] > 0
+        count = int(states["count"].sum())
+        if count == 0:
+            return None
+        if self.aggregate_type == "sum":
+            return functools.reduce(operator.add, states["sum"][non_empty])
+        if self.aggregate_type == "bit_xor":
+            return functools.reduce(operator.xor, states["bit_xor"][non_empty])
+        if self.aggregate_type == "avg":
+            return functools.reduce(operator.add, states["sum"][non_empty]) / count
+
+        # std: combine the population variances of the slices around the overall mean
+        if count < 2:
+            return None
+        counts = states["count"][non_empty].astype("float64")
+        means = states["avg"][non_empty].astype("float64")
+        variances = states["var"][non_empty].astype("float64")
+        mean = (counts * means).sum() / count
+        sum_squares = (counts * variances).sum() + (counts * (means - mean) ** 2).sum()
+        return math.sqrt(sum_squares / (count - 1))
+
 
 class FilterField(object):
     def __init__(
@@ -171,13 +340,31 @@ class FilterField(object):
         )
 
     @staticmethod
-    def custom(expr):
+    def bucket_isin(grouped_field, values):
+        """Returns a FilterField instance on the buckets of a GroupedField with buckets.
+
+        Args:
+            grouped_field (GroupedField): The grouped field whose buckets are filtered.
+            values (list): The buckets to keep, None keeping the null bucket.
+        """
+
+        def isin(bucket, values):
+            if bucket.type().is_numeric():
+                values = [None if _ is None else int(float(_)) for _ in values]
+            expr = bucket.isin([_ for _ in values if _ is not None])
+            return (expr | bucket.isnull()) if None in values else expr
+
+        return FilterField(isin, left=grouped_field, right=values)
+
+    @staticmethod
+    def custom(expr, params=None):
         """Returns a FilterField instance built for any custom SQL using a supported operator.
 
         Args:
             expr (Str): A custom SQL expression used to filter a query.
+            params (Dict): Optional values of the named bind parameters (:name) in expr.
         """
-        return FilterField(None, left=expr)
+        return FilterField(None, left=expr, right=params)
 
     @staticmethod
     def or_(field_list: list):
@@ -185,7 +372,7 @@ class FilterField(object):
 
     def compile(self, ibis_table):
         if self.expr is None:
-            return operations.compile_raw_sql(ibis_table, self.left)
+            return operations.compile_raw_sql(ibis_table, self.left, self.right)
 
         if self.left_field:
             self.left = ibis_table[self.left_field]
@@ -195,6 +382,8 @@ class FilterField(object):
 
         if self.expr == ibis.or_:
             return self.expr(*[_.compile(ibis_table) for _ in self.left])
+        elif isinstance(self.left, GroupedField):
+            return self.expr(self.left.compile(ibis_table), self.right)
         else:
             return self.expr(self.left, self.right)
 
@@ -229,22 +418,92 @@ class ComparisonField(object):
 
 
 class GroupedField(object):
-    def __init__(self, field_name, alias=None, cast=None):
+    def __init__(self, field_name, alias=None, cast=None, buckets=None):
         """A representation of a group by field used to build a query.
 
         Args:
             field_name (String): A field to act on in the table
             alias (String): An alias to use for the group
             cast (String): A cast on the column if required
+            buckets (int): Optional number of buckets the values are hashed into
         """
         self.field_name = field_name
         self.alias = alias
         self.cast = cast
+        self.buckets = buckets
 
-    def compile(self, ibis_table):
-        # Fields are supplied on compile or on build
-        group_field = ibis_table[self.field_name]
+    def _get_bucket(self, group_field):
+        """Return the bucket of a group value, computed the same way by every engine.
 
+        Numeric values are bucketed on the modulo of their absolute floor value, dates on
+        their number of days since the epoch and timestamps on their epoch seconds, as
+        engines cast them to different strings. Strings are bucketed on the leading hex
+        digits of their SHA256 hash, so their number of buckets is rounded up to a power of 16.
+        """
+        if group_field.type().is_integer():
+            return group_field.abs() % self.buckets
+        if group_field.type().is_numeric():
+            return group_field.floor().abs() % self.buckets
+        if group_field.type().is_date():
+            return (group_field.epoch_seconds() // 86400).abs() % self.buckets
+        if group_field.type().is_timestamp():
+            return group_field.epoch_seconds().abs() % self.buckets
+        if not group_field.type().is_string():
+            raise ValueError(
+                f"Grouped column {self.field_name} of type {group_field.type()} cannot be bucketed, "
+                "only numeric, string, date and timestamp columns can be"
+            )
+        digits = max(1, math.ceil(math.log(self.buckets, 16)))
+        return operations.compile_hex_digest(group_field.cast("string")).substr(
+            0, digits
+        )
+
+    def get_key(self, column):
+        """Return an integer key of the group values of a column, computed the same way by
+        every engine.
+
+        Numeric values are keyed on their floor value, dates on their number of days since
+        the epoch, timestamps on their epoch seconds and strings on the ASCII codes of the
+        leading hex digits of their SHA256 hash, all modulo GROUP_FINGERPRINT_MODULUS.
+        NULL is keyed on GROUP_FINGERPRINT_MODULUS.
+        """
+        group_field = self._cast(column)
+        modulus = consts.GROUP_FINGERPRINT_MODULUS
+        # NULL is keyed below, it is only replaced for engines failing to key it
+        if group_field.type().is_integer():
+            key = group_field.fillna(0)
+        elif group_field.type().is_numeric():
+            key = group_field.fillna(0).floor()
+        elif group_field.type().is_date():
+            key = (
+                group_field.fillna(
+                    ibis.literal(datetime.date(1970, 1, 1))
+                ).epoch_seconds()
+                // 86400
+            )
+        elif group_field.type().is_timestamp():
+            key = group_field.fillna(
+                ibis.literal(datetime.datetime(1970, 1, 1))
+            ).epoch_seconds()
+        elif group_field.type().is_string():
+            digest = operations.compile_hex_digest(
+                group_field.cast("string").fillna("")
+            )
+            # The ASCII codes of hex digits less 48 are below 64
+            key = functools.reduce(
+                operator.add,
+                [(digest.substr(i, 1).ascii_str() - 48) * 64**i for i in range(4)],
+            )
+        else:
+            raise ValueError(
+                f"Grouped column {self.field_name} of type {group_field.type()} cannot be bucketed, "
+                "only numeric, string, date and timestamp columns can be"
+            )
+        # Engines differ on the sign of the modulo of negative values
+        key = ((key % modulus) + modulus) % modulus
+        return group_field.isnull().ifelse(modulus, key.cast("int64"))
+
+    def _cast(self, group_field):
         # TODO: generate cast for known types not specified
         if self.cast:
             group_field = group_field.cast(self.cast)
@@ -254,6 +513,13 @@ class GroupedField(object):
             # TODO: need to build Truncation Int support
             # TODO: should be using a logger
             logging.warning("Unknown cast types can cause memory errors")
+        return group_field
+
+    def compile(self, ibis_table):
+        # Fields are supplied on compile or on build
+        group_field = self._cast(ibis_table[self.field_name])
+        if self.buckets:
+            group_field = self._get_bucket(group_field)
 
         # The Casts require we also supply a name.
         alias = self.alias or self.field_name
@@ -400,6 +666,31 @@ class CalculatedField(object):
             target_type=target_type,
         )
 
+    @staticmethod
+    def group_key(config, fields, casts=None):
+        """Return the integer key of the values of grouped columns, see GroupedField.get_key.
+        Its sum over rows fingerprints the groups they belong to.
+
+        Args:
+            casts (list): The casts of the grouped columns
+        """
+        grouped_fields = [
+            GroupedField(field_name=field, cast=cast)
+            for field, cast in zip(fields, casts or [None] * len(fields))
+        ]
+
+        def group_key(*columns):
+            return functools.reduce(
+                lambda key, column_key: (key * 31 + column_key)
+                % consts.GROUP_FINGERPRINT_MODULUS,
+                [
+                    grouped_field.get_key(column)
+                    for grouped_field, column in zip(grouped_fields, columns)
+                ],
+            )
+
+        return CalculatedField(group_key, config, fields)
+
     @staticmethod
     def custom(config, fields):
         """Returns a CalculatedField instance built for any custom ibis expression
@@ -561,6 +852,52 @@ class QueryBuilder(object):
 
         return query
 
+    def is_mergeable(self) -> bool:
+        """Return True if the aggregates of the query can be merged from partial aggregates."""
+        return bool(self.aggregate_fields) and all(
+            _.is_mergeable() for _ in self.aggregate_fields
+        )
+
+    def get_partial_builder(self):
+        """Return a QueryBuilder of the partial states of the aggregates, which can be run over
+        disjoint slices or shards of a table and combined with merge_partials."""
+        return QueryBuilder(
+            [
+                partial
+                for aggregate_field in self.aggregate_fields
+                for partial in aggregate_field.get_partials()
+            ],
+            self.calculated_fields,
+            self.filters,
+            self.grouped_fields,
+            self.comparison_fields,
+        )
+
+    def merge_partials(self, partials_df):
+        """Return the aggregates merged from the results of the partial builder, one row per group.
+
+        Args:
+            partials_df (DataFrame): The concatenated results of the partial builder.
+        """
+        group_aliases = [_.alias or _.field_name for _ in self.grouped_fields]
+        aliases = [_.alias for _ in self.aggregate_fields]
+        if not group_aliases:
+            return pandas.DataFrame(
+                {
+                    aggregate_field.alias: [aggregate_field.merge_partials(partials_df)]
+                    for aggregate_field in self.aggregate_fields
+                }
+            )
+        rows = []
+        for keys, group_df in partials_df.groupby(
+            group_aliases, dropna=False, sort=False
+        ):
+            row = dict(zip(group_aliases, keys))
+            for aggregate_field in self.aggregate_fields:
+                row[aggregate_field.alias] = aggregate_field.merge_partials(group_df)
+            rows.append(row)
+        return pandas.DataFrame(rows, columns=group_aliases + aliases)
+
     def add_aggregate_field(self, aggregate_field):
         """Add an AggregateField instance to the query which
             will be used when compiling your query (ie. SUM(a))
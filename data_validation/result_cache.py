@@ -0,0 +1,156 @@
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+""" A content addressed cache of source query results, so that one source validated
+    against several targets only runs its source queries once. Entries are keyed on
+    the compiled SQL of the queries, the identity of the source connection and an
+    optional freshness token, and are stored as Parquet files under the StateManager
+    root. Entries older than the TTL are ignored and the oldest entries are evicted
+    when the cache grows beyond its maximum size.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+import uuid
+from typing import Dict, List, Optional
+
+import pandas
+import sqlalchemy
+
+from data_validation import consts
+
+# Connection config keys which do not identify the data of a connection
+_NON_IDENTITY_KEYS = ("password",)
+
+
+def get_query_text(client, query) -> Optional[str]:
+    """Return the SQL of a query with its literals bound, or None if the client does not compile to SQL."""
+    try:
+        compiled = client.compile(query)
+        if isinstance(compiled, sqlalchemy.sql.ClauseElement):
+            return str(
+                compiled.compile(
+                    client.con.engine, compile_kwargs={"literal_binds": True}
+                )
+            )
+        if isinstance(compiled, str):
+            return compiled
+    except Exception as e:
+        logging.debug("Unable to compile query for the result cache: %s", e)
+    return None
+
+
+def get_key(
+    connection: Dict, query_texts: List[str], freshness_token: str = None
+) -> str:
+    """Return the cache key of the results of queries run on a connection.
+
+    Args:
+        connection (Dict): The connection config the queries run on.
+        query_texts (List[str]): The SQL of the queries.
+        freshness_token (str): Optional token, changed to invalidate previous entries.
+    """
+    identity = {
+        key: value for key, value in connection.items() if key not in _NON_IDENTITY_KEYS
+    }
+    content = json.dumps(
+        {
+            "connection": identity,
+            "queries": query_texts,
+            "freshness_token": freshness_token,
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+class ResultCache(object):
+    def __init__(
+        self,
+        directory: str,
+        ttl: int,
+        max_bytes: int = consts.SOURCE_CACHE_MAX_BYTES,
+    ):
+        """Initialize a ResultCache in a local directory.
+
+        Args:
+            directory (str): The directory holding the cached results.
+            ttl (int): The number of seconds a cached result is valid for.
+            max_bytes (int): The size beyond which the oldest results are evicted.
+        """
+        self.directory = directory
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _get_path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.parquet")
+
+    def _is_expired(self, path: str) -> bool:
+        return time.time() - os.path.getmtime(path) > self.ttl
+
+    def get(self, key: str) -> Optional[pandas.DataFrame]:
+        """Return the cached result of a key, or None if it is missing or expired."""
+        path = self._get_path(key)
+        try:
+            if self._is_expired(path):
+                os.remove(path)
+                return None
+            return pandas.read_parquet(path)
+        except FileNotFoundError:
+            return None
+
+    def put(self, key: str, df: pandas.DataFrame):
+        """Store the result of a key and evict entries beyond the TTL or maximum size."""
+        path = self._get_path(key)
+        temp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        try:
+            df.to_parquet(temp_path, index=False)
+            os.replace(temp_path, path)
+        except Exception as e:
+            logging.warning("Unable to cache source query results: %s", e)
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            return
+        self.evict()
+
+    def evict(self):
+        """Remove expired entries, then the oldest entries until the cache fits in max_bytes."""
+        entries = []
+        for file_name in os.listdir(self.directory):
+            if not file_name.endswith(".parquet"):
+                continue
+            path = os.path.join(self.directory, file_name)
+            try:
+                stat = os.stat(path)
+                if self._is_expired(path):
+                    os.remove(path)
+                    continue
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total_bytes = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_bytes <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total_bytes -= size
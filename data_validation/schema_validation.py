@@ -13,10 +13,12 @@
 # limitations under the License.
 
 import datetime
+import functools
 import itertools
 import logging
 import pandas
 import re
+from typing import List, Optional, Tuple
 
 from data_validation import metadata, consts, clients, exceptions
 
@@ -117,6 +119,38 @@ class SchemaValidation(object):
         return df
 
 
+def prefetch_table_schemas(config_managers):
+    """Read the schemas of the tables of schema validations with one catalog query per schema.
+
+    Schema validations of several tables in the same source or target schema would otherwise
+    reflect each table separately. The schemas are cached on the shared clients and picked up
+    by clients.get_ibis_table_schema, tables missing from the catalog are still reflected.
+
+    Args:
+        config_managers (list[ConfigManager]): List of config manager instances.
+    """
+    schema_tables = {}
+    for config_manager in config_managers:
+        if config_manager.validation_type != consts.SCHEMA_VALIDATION:
+            continue
+        for client, schema_name in (
+            (config_manager.source_client, config_manager.source_schema),
+            (config_manager.target_client, config_manager.target_schema),
+        ):
+            if schema_name:
+                schema_tables.setdefault((id(client), schema_name), [client, 0])
+                schema_tables[(id(client), schema_name)][1] += 1
+
+    for (_, schema_name), (client, table_count) in schema_tables.items():
+        if table_count > 1:
+            cached_count = clients.prefetch_table_schemas(client, schema_name)
+            logging.info(
+                "Read %s table schemas in %s from the catalog",
+                cached_count,
+                schema_name,
+            )
+
+
 def schema_validation_matching(
     source_fields, target_fields, exclusion_fields, allow_list
 ):
@@ -137,8 +171,8 @@ def schema_validation_matching(
             source_fields_casefold.pop(field, None)
             target_fields_casefold.pop(field, None)
 
-    # Allow list map in case of incompatible  data types in source and target
-    allow_list_map = parse_allow_list(allow_list)
+    # Allow list in case of incompatible  data types in source and target
+    allow_list_matcher = get_allow_list_matcher(allow_list)
     # Go through each source and check if target exists and matches
     for source_field_name, source_field_type in source_fields_casefold.items():
         if source_field_name not in target_fields_casefold:
@@ -166,10 +200,8 @@ def schema_validation_matching(
                     consts.VALIDATION_STATUS_SUCCESS,
                 ]
             )
-        elif (
-            string_val(source_field_type) in allow_list_map
-            and string_val(target_field_type)
-            in allow_list_map[string_val(source_field_type)]
+        elif allow_list_matcher.matches(
+            string_val(source_field_type), string_val(target_field_type)
         ):
             # Data type pair match an allow-list pair.
             results.append(
@@ -329,6 +361,102 @@ def parse_allow_list(st: str) -> dict:
     return return_pairs
 
 
+def parse_precision_range(s: str) -> Tuple[int, int]:
+    """Return the bounds of a precision/scale value or range (e.g. "0-3" becomes (0, 3))."""
+    m_range = DECIMAL_PRECISION_SCALE_RANGE_PATTERN.fullmatch(s)
+    try:
+        if not m_range:
+            return int(s), int(s)
+        p_lower = int(m_range.group(1))
+        p_upper = int(m_range.group(2))
+    except ValueError as e:
+        raise exceptions.SchemaValidationException(
+            f"Invalid allow list data type precision/scale: {s}"
+        ) from e
+    if p_lower >= p_upper:
+        raise exceptions.SchemaValidationException(
+            f"Invalid allow list data type precision/scale: Lower value {p_lower} >= upper value {p_upper}"
+        )
+    return p_lower, p_upper
+
+
+class DataTypePattern(object):
+    def __init__(self, data_type: str):
+        """Initialize a DataTypePattern of an allow-list data type.
+
+        Decimal precision and scale ranges are held as intervals, any other data type must
+        match exactly.
+
+        Args:
+            data_type (str): The data type, e.g. "int64" or "decimal(1-38,0-2)".
+        """
+        self.data_type = data_type.replace(" ", "")
+        self.type_name = None
+        self.precision = None
+        self.scale = None
+        m = DECIMAL_PRECISION_SCALE_PATTERN.fullmatch(self.data_type)
+        if m:
+            self.type_name, p, s = m.groups()
+            self.precision = parse_precision_range(p)
+            self.scale = parse_precision_range(s) if s else None
+
+    def matches(self, data_type: str) -> bool:
+        """Return True if a data type without spaces matches the pattern."""
+        if self.type_name is None:
+            return data_type == self.data_type
+        m = DECIMAL_PRECISION_SCALE_PATTERN.fullmatch(data_type)
+        if not m or m.group(1) != self.type_name:
+            return False
+        try:
+            p = int(m.group(2))
+            s = int(m.group(3)) if m.group(3) else None
+        except ValueError:
+            return False
+        if not self.precision[0] <= p <= self.precision[1]:
+            return False
+        if self.scale is None:
+            return s is None
+        return s is not None and self.scale[0] <= s <= self.scale[1]
+
+
+class AllowListMatcher(object):
+    def __init__(self, allow_list: str):
+        """Initialize an AllowListMatcher of allow-list data type pairs.
+
+        Each data type pair is parsed once. Pairs are indexed on the source data type, or the
+        decimal type name of source types with precision/scale ranges.
+
+        Args:
+            allow_list (str): Comma separated data type pairs, e.g. "decimal(1-9,0):int32".
+        """
+        self._pairs = {}
+        for dt1, dt2 in split_allow_list_str(allow_list or ""):
+            source_pattern = DataTypePattern(dt1)
+            key = source_pattern.type_name or source_pattern.data_type
+            self._pairs.setdefault(key, []).append(
+                (source_pattern, DataTypePattern(dt2))
+            )
+
+    def _get_pairs(
+        self, source_type: str
+    ) -> List[Tuple[DataTypePattern, DataTypePattern]]:
+        m = DECIMAL_PRECISION_SCALE_PATTERN.fullmatch(source_type)
+        return self._pairs.get(m.group(1) if m else source_type, [])
+
+    def matches(self, source_type: str, target_type: str) -> bool:
+        """Return True if a source and target data type pair, without spaces, is allowed."""
+        return any(
+            source_pattern.matches(source_type) and target_pattern.matches(target_type)
+            for source_pattern, target_pattern in self._get_pairs(source_type)
+        )
+
+
+@functools.lru_cache(maxsize=None)
+def get_allow_list_matcher(allow_list: Optional[str]) -> AllowListMatcher:
+    """Return the AllowListMatcher of an allow-list, parsed once per run."""
+    return AllowListMatcher(allow_list)
+
+
 # typea data types: int8,int16
 def get_typea_numeric_sustr(st):
     nums = []
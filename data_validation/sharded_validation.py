@@ -0,0 +1,100 @@
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+""" A source table sharded across several connections is validated against a single
+    target table. The source query runs concurrently on the source connection and on
+    each of the source_shards connections:
+      - Column validations fetch partial aggregates from each shard (see
+        AggregateField.get_partials), which are merged into the source aggregates.
+      - Row validations fetch the rows of each shard, which are combined before being
+        joined to the target rows on the primary keys.
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas
+
+from data_validation import clients, consts
+from data_validation.config_manager import ConfigManager
+from data_validation.validation_builder import ValidationBuilder
+
+
+def is_sharded(config_manager: ConfigManager) -> bool:
+    """Return True if the source of a validation is sharded across several connections."""
+    return bool(config_manager.source_shards)
+
+
+def _is_aggregate_validation(config_manager: ConfigManager) -> bool:
+    return config_manager.validation_type == consts.COLUMN_VALIDATION or (
+        config_manager.validation_type == consts.CUSTOM_QUERY
+        and config_manager.custom_query_type == consts.COLUMN_VALIDATION.lower()
+    )
+
+
+def _get_shard_table(config_manager: ConfigManager, client):
+    """Return the source table or custom query of a validation on a shard client."""
+    if config_manager.validation_type == consts.CUSTOM_QUERY:
+        return clients.get_ibis_query(client, config_manager.source_query)
+    return clients.get_ibis_table(
+        client, config_manager.source_schema, config_manager.source_table
+    )
+
+
+def get_source_df(
+    config_manager: ConfigManager, validation_builder: ValidationBuilder
+) -> pandas.DataFrame:
+    """Run the source query of a validation on every shard and return the merged results.
+
+    Args:
+        config_manager (ConfigManager): A validation with source_shards.
+        validation_builder (ValidationBuilder): The builder of the validation, which may
+            have additional filters, e.g. for recursive row validations.
+    """
+    query_builder = validation_builder.source_builder
+    is_aggregate = _is_aggregate_validation(config_manager)
+    if is_aggregate:
+        if not query_builder.is_mergeable():
+            raise ValueError(
+                "Aggregates cast to another type cannot be merged across source shards"
+            )
+        query_builder = query_builder.get_partial_builder()
+
+    shard_clients = config_manager.get_source_shard_clients()
+    queries = [
+        query_builder.compile(
+            config_manager.validation_type,
+            _get_shard_table(config_manager, client),
+        )
+        for client in shard_clients
+    ]
+    logging.info(
+        "Running source query of %s on %s shards",
+        config_manager.full_source_table,
+        len(queries),
+    )
+    if config_manager.verbose:
+        logging.info("-- ** Source Shard Query ** --")
+        logging.info(queries[0].compile())
+
+    with ThreadPoolExecutor(max_workers=len(queries)) as executor:
+        futures = [
+            executor.submit(client.execute, query)
+            for client, query in zip(shard_clients, queries)
+        ]
+        source_df = pandas.concat([_.result() for _ in futures], ignore_index=True)
+
+    if is_aggregate:
+        return validation_builder.source_builder.merge_partials(source_df)
+    return source_df
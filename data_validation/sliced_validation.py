@@ -0,0 +1,160 @@
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+""" A column validation of a large table is split into key range slices, using the
+    partition boundaries of generate-table-partitions. The slices are aggregated
+    concurrently into partial states (see AggregateField.get_partials), which are
+    merged client side into the same report as the single aggregate query.
+"""
+
+import copy
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas
+
+from data_validation import consts
+from data_validation.config_manager import ConfigManager
+from data_validation.fused_validation import generate_aggregate_report
+from data_validation.partition_builder import PartitionBuilder
+from data_validation.partition_manifest import get_partition_filter
+from data_validation.validation_builder import ValidationBuilder
+
+
+def is_sliced(config_manager: ConfigManager) -> bool:
+    """Return True if a column validation is configured to run in slices."""
+    return (
+        config_manager.validation_type == consts.COLUMN_VALIDATION
+        and config_manager.slices > 1
+        and bool(config_manager.slice_keys)
+        and not config_manager.source_shards
+        and not config_manager.skip_unchanged
+        and not config_manager.group_buckets
+    )
+
+
+class SlicedValidation(object):
+    def __init__(self, config_manager: ConfigManager, verbose=False):
+        """Initialize a SlicedValidation of a column validation.
+
+        Args:
+            config_manager (ConfigManager): A column validation with slices and slice keys.
+            verbose (bool): If verbose, the queries run are logged.
+        """
+        self.config_manager = config_manager
+        self.verbose = verbose
+        self.validation_builder = ValidationBuilder(config_manager)
+
+    def is_mergeable(self) -> bool:
+        """Return True if all the aggregates of the validation can be merged from partial aggregates."""
+        return (
+            self.validation_builder.source_builder.is_mergeable()
+            and self.validation_builder.target_builder.is_mergeable()
+        )
+
+    def _get_slice_config_manager(self, config: dict) -> ConfigManager:
+        return ConfigManager(
+            config,
+            source_client=self.config_manager.source_client,
+            target_client=self.config_manager.target_client,
+            verbose=self.config_manager.verbose,
+        )
+
+    def _get_slice_filters(self):
+        """Return the source and target filters of each slice, split on the slice keys."""
+        config = copy.deepcopy(self.config_manager.config)
+        config[consts.CONFIG_PRIMARY_KEYS] = self.config_manager.slice_keys
+        return PartitionBuilder.get_table_partition_filters(
+            self._get_slice_config_manager(config), self.config_manager.slices
+        )
+
+    @staticmethod
+    def _get_slice_query(query_builder, table, slice_filter):
+        """Return the partial aggregate query of a slice of a table."""
+        partial_builder = query_builder.get_partial_builder()
+        # The partial builder shares the filters of the validation, add the slice filter to a copy
+        partial_builder.filters = partial_builder.filters + [slice_filter]
+        return partial_builder.compile(consts.COLUMN_VALIDATION, table)
+
+    @staticmethod
+    def _execute_slices(client, queries: list) -> pandas.DataFrame:
+        """Run the partial aggregate queries of one side concurrently and concatenate their results."""
+        with ThreadPoolExecutor(
+            max_workers=min(consts.SLICE_MAX_WORKERS, len(queries))
+        ) as executor:
+            return pandas.concat(
+                list(executor.map(client.execute, queries)), ignore_index=True
+            )
+
+    def get_report(self) -> pandas.DataFrame:
+        """Run the partial aggregates of each slice concurrently and return the merged report.
+
+        The slice boundaries are computed once, with a single scan of the slice keys, and each
+        slice only adds its key range filter to the queries of the validation.
+        """
+        source_filters, target_filters = self._get_slice_filters()
+        source_table = self.config_manager.get_source_ibis_table()
+        target_table = self.config_manager.get_target_ibis_table()
+
+        source_queries, target_queries = [], []
+        for source_filter, target_filter in zip(source_filters, target_filters):
+            (
+                source_slice_filter,
+                target_slice_filter,
+            ) = self.validation_builder.get_filter_fields(
+                get_partition_filter(source_filter, target_filter)
+            )
+            source_queries.append(
+                self._get_slice_query(
+                    self.validation_builder.source_builder,
+                    source_table,
+                    source_slice_filter,
+                )
+            )
+            target_queries.append(
+                self._get_slice_query(
+                    self.validation_builder.target_builder,
+                    target_table,
+                    target_slice_filter,
+                )
+            )
+        logging.info(
+            "Running column validation of %s in %s slices",
+            self.config_manager.full_source_table,
+            len(source_queries),
+        )
+        if self.verbose:
+            logging.info("-- ** Slice Source Query ** --")
+            logging.info(source_queries[0].compile())
+            logging.info("-- ** Slice Target Query ** --")
+            logging.info(target_queries[0].compile())
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            source_future = executor.submit(
+                self._execute_slices, self.config_manager.source_client, source_queries
+            )
+            target_future = executor.submit(
+                self._execute_slices, self.config_manager.target_client, target_queries
+            )
+            source_partials = source_future.result()
+            target_partials = target_future.result()
+
+        return generate_aggregate_report(
+            self.config_manager,
+            self.validation_builder,
+            self.validation_builder.source_builder.merge_partials(source_partials),
+            self.validation_builder.target_builder.merge_partials(target_partials),
+            join_on_fields=set(self.validation_builder.get_group_aliases()),
+            verbose=self.verbose,
+        )
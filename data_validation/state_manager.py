@@ -98,6 +98,18 @@ class StateManager(object):
             self._get_connections_directory(), f"{name}.connection.json"
         )
 
+    def get_result_cache_directory(self) -> str:
+        """Returns the directory path of the source result cache."""
+        return os.path.join(self.file_system_root_path, consts.RESULT_CACHE_DIRECTORY)
+
+    def get_fingerprints_directory(self) -> str:
+        """Returns the directory path of the table fingerprints of unchanged tables."""
+        return os.path.join(self.file_system_root_path, consts.FINGERPRINTS_DIRECTORY)
+
+    def get_metadata_cache_directory(self) -> str:
+        """Returns the directory path of cached table schemas and table lists."""
+        return os.path.join(self.file_system_root_path, consts.METADATA_CACHE_DIRECTORY)
+
     def _list_directory(self, directory_path: str) -> List[str]:
         if self.file_system == FileSystem.GCS:
             return gcs_helper.list_gcs_directory(directory_path)
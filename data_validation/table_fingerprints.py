@@ -0,0 +1,161 @@
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+""" Validations of tables which have not changed since their last successful run are
+    skipped with --skip-unchanged. A fingerprint of the source and target tables is
+    read from cheap catalog metadata (see clients.get_table_fingerprint) or from the
+    file stats of FileSystem connections, and stored with the results of successful
+    runs. When both fingerprints match the stored ones, the stored results are emitted
+    again with the metadata of the current run instead of scanning the tables.
+"""
+
+import datetime
+import hashlib
+import json
+import logging
+import os
+from typing import Dict, Optional
+
+import pandas
+
+from data_validation import clients, consts, gcs_helper
+from data_validation.config_manager import ConfigManager
+from data_validation.metadata import RunMetadata
+
+
+def _get_file_fingerprint(file_path: str) -> Optional[str]:
+    """Return the modification time and size of a local or GCS file."""
+    try:
+        if file_path.startswith("gs://"):
+            blob = gcs_helper.get_gcs_bucket(file_path).get_blob(
+                gcs_helper._get_gcs_file_path(file_path)
+            )
+            return f"{blob.generation}:{blob.size}" if blob else None
+        if os.path.exists(file_path):
+            stat = os.stat(file_path)
+            return f"{stat.st_mtime_ns}:{stat.st_size}"
+    except Exception as e:
+        logging.warning(f"File stats unavailable for {file_path}: {e}")
+    return None
+
+
+def _get_table_fingerprint(
+    connection: Dict, client, schema_name: str, table_name: str
+) -> Optional[str]:
+    if connection.get(consts.SOURCE_TYPE) == "FileSystem":
+        return _get_file_fingerprint(connection.get("file_path", ""))
+    return clients.get_table_fingerprint(client, schema_name, table_name)
+
+
+def get_fingerprints(config_manager: ConfigManager) -> Optional[Dict[str, str]]:
+    """Return the source and target table fingerprints of a validation, or None if either is unavailable."""
+    if (
+        config_manager.validation_type == consts.CUSTOM_QUERY
+        or config_manager.source_shards
+    ):
+        return None
+    fingerprints = {
+        "source": _get_table_fingerprint(
+            config_manager.get_source_connection(),
+            config_manager.source_client,
+            config_manager.source_schema,
+            config_manager.source_table,
+        ),
+        "target": _get_table_fingerprint(
+            config_manager.get_target_connection(),
+            config_manager.target_client,
+            config_manager.target_schema,
+            config_manager.target_table,
+        ),
+    }
+    if None in fingerprints.values():
+        return None
+    return fingerprints
+
+
+def _get_record_path(config_manager: ConfigManager) -> str:
+    """Return the path of the stored fingerprints and results of a validation."""
+    config = dict(config_manager.config)
+    config[consts.CONFIG_SOURCE_CONN] = config_manager.get_source_connection()
+    config[consts.CONFIG_TARGET_CONN] = config_manager.get_target_connection()
+    key = hashlib.sha256(
+        json.dumps(config, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+    return os.path.join(
+        config_manager._state_manager.get_fingerprints_directory(), f"{key}.json"
+    )
+
+
+def get_unchanged_result(
+    config_manager: ConfigManager,
+    fingerprints: Optional[Dict[str, str]],
+    run_metadata: RunMetadata,
+) -> Optional[pandas.DataFrame]:
+    """Return the stored results of a validation if its tables are unchanged, else None.
+
+    Args:
+        config_manager (ConfigManager): The validation.
+        fingerprints (Dict): The current source and target table fingerprints.
+        run_metadata (RunMetadata): The metadata of the current run, replacing the
+            metadata of the stored results.
+    """
+    if not fingerprints:
+        return None
+    try:
+        record = json.loads(gcs_helper.read_file(_get_record_path(config_manager)))
+    except Exception:
+        return None
+    if record.get("fingerprints") != fingerprints:
+        return None
+
+    logging.info(
+        "Skipping unchanged tables %s and %s",
+        config_manager.full_source_table,
+        config_manager.full_target_table,
+    )
+    run_metadata.end_time = datetime.datetime.now(datetime.timezone.utc)
+    result_df = pandas.DataFrame(record["results"])
+    result_df["run_id"] = run_metadata.run_id
+    result_df["labels"] = [run_metadata.labels] * len(result_df)
+    result_df["start_time"] = run_metadata.start_time
+    result_df["end_time"] = run_metadata.end_time
+    return result_df
+
+
+def store_result(
+    config_manager: ConfigManager,
+    fingerprints: Optional[Dict[str, str]],
+    result_df: pandas.DataFrame,
+):
+    """Store the fingerprints and results of a validation if all its results succeeded."""
+    if (
+        not fingerprints
+        or result_df.empty
+        or not (
+            result_df[consts.VALIDATION_STATUS] == consts.VALIDATION_STATUS_SUCCESS
+        ).all()
+    ):
+        return
+    record = {
+        "fingerprints": fingerprints,
+        "results": json.loads(
+            result_df.to_json(orient="records", date_format="iso", default_handler=str)
+        ),
+    }
+    try:
+        gcs_helper.write_file(
+            _get_record_path(config_manager), json.dumps(record), include_log=False
+        )
+    except Exception as e:
+        logging.warning(f"Unable to store the results of unchanged tables: {e}")
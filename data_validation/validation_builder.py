@@ -15,7 +15,8 @@ import logging
 from copy import deepcopy
 
 from data_validation import consts, metadata
-from data_validation.clients import get_max_in_list_size
+from data_validation.clients import get_max_aggregates, get_max_in_list_size
+from data_validation.partition_manifest import load_bind_parameters
 from data_validation.query_builder.query_builder import (
     AggregateField,
     CalculatedField,
@@ -199,11 +200,18 @@ class ValidationBuilder(object):
         if not hasattr(AggregateField, aggregate_type):
             raise Exception("Unknown Aggregation Type: {}".format(aggregate_type))
 
+        agg_kwargs = {}
+        if aggregate_type == "bucket_count":
+            agg_kwargs = {
+                "lower": aggregate_field.get(consts.CONFIG_BUCKET_LOWER),
+                "upper": aggregate_field.get(consts.CONFIG_BUCKET_UPPER),
+            }
+
         source_agg = getattr(AggregateField, aggregate_type)(
-            field_name=source_field_name, alias=alias, cast=cast
+            field_name=source_field_name, alias=alias, cast=cast, **agg_kwargs
         )
         target_agg = getattr(AggregateField, aggregate_type)(
-            field_name=target_field_name, alias=alias, cast=cast
+            field_name=target_field_name, alias=alias, cast=cast, **agg_kwargs
         )
 
         self.source_builder.add_aggregate_field(source_agg)
@@ -219,7 +227,7 @@ class ValidationBuilder(object):
             target_column_name=target_field_name,
             primary_keys=self.config_manager.get_primary_keys_list(),
             num_random_rows=self.config_manager.get_random_row_batch_size(),
-            threshold=self.config_manager.threshold,
+            threshold=self.config_manager.get_aggregate_threshold(aggregate_type),
         )
 
     def pop_grouped_fields(self):
@@ -240,18 +248,65 @@ class ValidationBuilder(object):
         source_field_name = grouped_field[consts.CONFIG_SOURCE_COLUMN]
         target_field_name = grouped_field[consts.CONFIG_TARGET_COLUMN]
         cast = grouped_field.get(consts.CONFIG_CAST)
+        buckets = grouped_field.get(consts.CONFIG_GROUP_BUCKETS)
 
         source_field = GroupedField(
-            field_name=source_field_name, alias=alias, cast=cast
+            field_name=source_field_name, alias=alias, cast=cast, buckets=buckets
         )
         target_field = GroupedField(
-            field_name=target_field_name, alias=alias, cast=cast
+            field_name=target_field_name, alias=alias, cast=cast, buckets=buckets
         )
 
         self.source_builder.add_grouped_field(source_field)
         self.target_builder.add_grouped_field(target_field)
         self.group_aliases[alias] = grouped_field
 
+    def add_group_fingerprint(self, grouped_fields, alias):
+        """Add the sum of the group keys of grouped columns to Queries, compared without
+        threshold. See CalculatedField.group_key.
+
+        Args:
+            grouped_fields (list): Objects with source, target, and cast info
+            alias (String): The alias of the aggregate
+        """
+        key_alias = f"{alias}__key"
+        casts = [_.get(consts.CONFIG_CAST) for _ in grouped_fields]
+        # Grouped columns can be calculated fields, the key is computed after them
+        depth = max(
+            [
+                _.get(consts.CONFIG_DEPTH, 0) + 1
+                for _ in self.calculated_aliases.values()
+            ],
+            default=0,
+        )
+        for builder, column_key in (
+            (self.source_builder, consts.CONFIG_SOURCE_COLUMN),
+            (self.target_builder, consts.CONFIG_TARGET_COLUMN),
+        ):
+            builder.add_calculated_field(
+                CalculatedField.group_key(
+                    {consts.CONFIG_FIELD_ALIAS: key_alias, consts.CONFIG_DEPTH: depth},
+                    [_[column_key] for _ in grouped_fields],
+                    casts=casts,
+                )
+            )
+            builder.add_aggregate_field(
+                AggregateField.sum(field_name=key_alias, alias=alias)
+            )
+        self._metadata[alias] = metadata.ValidationMetadata(
+            validation_type=self.validation_type,
+            aggregation_type="group_fingerprint",
+            source_table_schema=self.config_manager.source_schema,
+            source_table_name=self.config_manager.source_table,
+            target_table_schema=self.config_manager.target_schema,
+            target_table_name=self.config_manager.target_table,
+            source_column_name=None,
+            target_column_name=None,
+            primary_keys=self.config_manager.get_primary_keys_list(),
+            num_random_rows=self.config_manager.get_random_row_batch_size(),
+            threshold=0.0,
+        )
+
     def add_primary_key(self, primary_key):
         """Add ComparisonField to Queries
 
@@ -278,15 +333,32 @@ class ValidationBuilder(object):
     def add_filter(self, filter_field):
         """Add FilterField to Queries
 
+        Args:
+            filter_field (Dict): An object with source and target filter details
+        """
+        source_filter, target_filter = self.get_filter_fields(filter_field)
+        # TODO(issues/40): Add metadata around filters
+        self.source_builder.add_filter_field(source_filter)
+        self.target_builder.add_filter_field(target_filter)
+
+    def get_filter_fields(self, filter_field) -> tuple:
+        """Return the source and target FilterFields of a filter
+
         Args:
             filter_field (Dict): An object with source and target filter details
         """
         if filter_field[consts.CONFIG_TYPE] == consts.FILTER_TYPE_CUSTOM:
             source_filter = FilterField.custom(
-                filter_field[consts.CONFIG_FILTER_SOURCE]
+                filter_field[consts.CONFIG_FILTER_SOURCE],
+                load_bind_parameters(
+                    filter_field.get(consts.CONFIG_FILTER_SOURCE_PARAMETERS)
+                ),
             )
             target_filter = FilterField.custom(
-                filter_field[consts.CONFIG_FILTER_TARGET]
+                filter_field[consts.CONFIG_FILTER_TARGET],
+                load_bind_parameters(
+                    filter_field.get(consts.CONFIG_FILTER_TARGET_PARAMETERS)
+                ),
             )
         elif filter_field[consts.CONFIG_TYPE] == consts.FILTER_TYPE_EQUALS:
             source_filter = FilterField.equal_to(
@@ -308,10 +380,38 @@ class ValidationBuilder(object):
                 filter_field[consts.CONFIG_FILTER_TARGET_COLUMN],
                 filter_field[consts.CONFIG_FILTER_TARGET_VALUE],
             )
+        return source_filter, target_filter
 
-        # TODO(issues/40): Add metadata around filters
-        self.source_builder.add_filter_field(source_filter)
-        self.target_builder.add_filter_field(target_filter)
+    def add_bucket_filter(self, grouped_field, buckets: list):
+        """Filter the queries on buckets of a grouped column
+
+        Args:
+            grouped_field (Dict): An object with source, target, cast and group_buckets info
+            buckets (list): The buckets to keep
+        """
+        filters = []
+        for client, column_name in (
+            (self.source_client, grouped_field[consts.CONFIG_SOURCE_COLUMN]),
+            (self.target_client, grouped_field[consts.CONFIG_TARGET_COLUMN]),
+        ):
+            bucket_field = GroupedField(
+                field_name=column_name,
+                cast=grouped_field.get(consts.CONFIG_CAST),
+                buckets=grouped_field[consts.CONFIG_GROUP_BUCKETS],
+            )
+            max_in_list_size = get_max_in_list_size(client) or len(buckets)
+            bucket_filters = [
+                FilterField.bucket_isin(bucket_field, _)
+                for _ in list_to_sublists(buckets, max_in_list_size)
+            ]
+            filters.append(
+                bucket_filters[0]
+                if len(bucket_filters) == 1
+                else FilterField.or_(bucket_filters)
+            )
+
+        self.source_builder.add_filter_field(filters[0])
+        self.target_builder.add_filter_field(filters[1])
 
     def add_comparison_field(self, comparison_field):
         """Add ComparionField to Queries
@@ -375,6 +475,72 @@ class ValidationBuilder(object):
         # register calc field under alias
         self.calculated_aliases[alias] = calc_field
 
+    def _get_source_table(self):
+        if self.validation_type == consts.CUSTOM_QUERY:
+            return self.config_manager.get_source_ibis_table_from_query()
+        return self.config_manager.get_source_ibis_table()
+
+    def _get_target_table(self):
+        if self.validation_type == consts.CUSTOM_QUERY:
+            return self.config_manager.get_target_ibis_table_from_query()
+        return self.config_manager.get_target_ibis_table()
+
+    def _split_query_builder(self, query_builder, client) -> list:
+        """Return the query builder split into builders with at most the maximum number of
+        aggregates per query of the client, each keeping the filters and grouped columns."""
+        max_aggregates = self.config_manager.max_aggregates or get_max_aggregates(
+            client
+        )
+        if not max_aggregates or len(query_builder.aggregate_fields) <= max_aggregates:
+            return [query_builder]
+        # The grouped columns are also part of the select list
+        chunk_size = max(max_aggregates - len(query_builder.grouped_fields), 1)
+        return [
+            QueryBuilder(
+                aggregate_fields,
+                query_builder.calculated_fields,
+                query_builder.filters,
+                query_builder.grouped_fields,
+                query_builder.comparison_fields,
+                limit=query_builder.limit,
+            )
+            for aggregate_fields in list_to_sublists(
+                query_builder.aggregate_fields, chunk_size
+            )
+        ]
+
+    def get_source_queries(self):
+        """Return the source query, split into sub-queries when it has more aggregates than
+        the source supports in a single query."""
+        query_builders = self._split_query_builder(
+            self.source_builder, self.source_client
+        )
+        if len(query_builders) == 1:
+            return [self.get_source_query()]
+        logging.info(
+            "Splitting %s source aggregates into %s queries",
+            len(self.source_builder.aggregate_fields),
+            len(query_builders),
+        )
+        table = self._get_source_table()
+        return [_.compile(self.validation_type, table) for _ in query_builders]
+
+    def get_target_queries(self):
+        """Return the target query, split into sub-queries when it has more aggregates than
+        the target supports in a single query."""
+        query_builders = self._split_query_builder(
+            self.target_builder, self.target_client
+        )
+        if len(query_builders) == 1:
+            return [self.get_target_query()]
+        logging.info(
+            "Splitting %s target aggregates into %s queries",
+            len(self.target_builder.aggregate_fields),
+            len(query_builders),
+        )
+        table = self._get_target_table()
+        return [_.compile(self.validation_type, table) for _ in query_builders]
+
     def get_source_query(self):
         """Return query for source validation"""
         source_config = {
@@ -384,11 +550,9 @@ class ValidationBuilder(object):
             "source_query": self.config_manager.source_query,
         }
 
-        if self.validation_type == consts.CUSTOM_QUERY:
-            table = self.config_manager.get_source_ibis_table_from_query()
-        else:
-            table = self.config_manager.get_source_ibis_table()
-        query = self.source_builder.compile(self.validation_type, table)
+        query = self.source_builder.compile(
+            self.validation_type, self._get_source_table()
+        )
         if self.verbose:
             logging.info(source_config)
             logging.info("-- ** Source Query ** --")
@@ -404,12 +568,9 @@ class ValidationBuilder(object):
             "table_name": self.config_manager.target_table,
             "target_query": self.config_manager.target_query,
         }
-        if self.validation_type == consts.CUSTOM_QUERY:
-            table = self.config_manager.get_target_ibis_table_from_query()
-        else:
-            table = self.config_manager.get_target_ibis_table()
-
-        query = self.target_builder.compile(self.validation_type, table)
+        query = self.target_builder.compile(
+            self.validation_type, self._get_target_table()
+        )
         if self.verbose:
             logging.info(target_config)
             logging.info("-- ** Target Query ** --")
@@ -11,6 +11,8 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import datetime
+
 import ibis
 import pandas
 import pytest
@@ -45,3 +47,66 @@ def test_format_raw_sql_expr(module_under_test):
     raw_sql = operations.format_raw_sql(ibis_table.column, raw_sql_column_expr)
 
     assert raw_sql == WHERE_FILTER
+
+
+def test_format_bound_raw_sql_expr(module_under_test):
+    from ibis.backends.postgres import Backend as PostgresBackend
+
+    ibis_table = ibis.table([("id", "int64"), ("d", "date")], name="my_table")
+    params = {"dvt_p0": 100, "dvt_p1": datetime.date(2020, 1, 1)}
+    query = ibis_table.filter(
+        operations.compile_raw_sql(ibis_table, "id > :dvt_p0 AND d < :dvt_p1", params)
+    )
+    client = PostgresBackend()
+
+    # The values are bind parameters of the statement
+    compiled = client.compile(query).compile()
+    assert "id > :dvt_p0 AND d < :dvt_p1" in str(compiled)
+    assert compiled.params == params
+    # They can still be rendered as literals, e.g. for dry runs
+    assert "id > 100 AND d < '2020-01-01'" in client._to_sql(query)
+
+
+@pytest.mark.parametrize(
+    "backend_module,expected",
+    [
+        ("ibis.backends.postgres", "percentile_cont(0.5) WITHIN GROUP (ORDER BY"),
+        ("ibis.backends.mssql", "approx_percentile_cont(0.5) WITHIN GROUP (ORDER BY"),
+    ],
+)
+def test_format_approx_median(module_under_test, backend_module, expected):
+    import importlib
+
+    client = importlib.import_module(backend_module).Backend()
+    ibis_table = ibis.table([("id", "int64")], name="my_table")
+    query = ibis_table.aggregate(
+        [ibis_table.id.approx_median(where=ibis_table.id > 0).name("med")]
+    )
+    assert expected in client._to_sql(query)
+
+
+def test_execute_approx_median(module_under_test):
+    client = ibis.pandas.connect(
+        {"my_table": pandas.DataFrame({"id": [1, 3, 5, 101], "g": list("aabb")})}
+    )
+    ibis_table = client.table("my_table")
+    assert ibis_table.id.approx_median().execute() == 4
+    grouped = (
+        ibis_table.group_by("g")
+        .aggregate(ibis_table.id.approx_median().name("med"))
+        .execute()
+    )
+    assert grouped.sort_values("g")["med"].tolist() == [2, 53]
+
+
+def test_format_hex_digest(module_under_test):
+    from ibis.backends.postgres import Backend as PostgresBackend
+
+    ibis_table = ibis.table([("id", "string")], name="my_table")
+    query = ibis_table.projection(
+        [module_under_test.compile_hex_digest(ibis_table.id).substr(0, 2).name("h")]
+    )
+    # The hex digest is not converted to hex again
+    assert "substr(encode(sha256(convert_to(t0.id, 'UTF8')), 'hex')" in (
+        PostgresBackend()._to_sql(query)
+    )
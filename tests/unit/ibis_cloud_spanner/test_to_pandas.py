@@ -0,0 +1,90 @@
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import datetime
+import decimal
+from unittest import mock
+
+import pandas
+import pytest
+from google.api_core import exceptions
+from google.cloud.spanner_v1 import StructType, Type, TypeCode
+
+FIELDS = [
+    StructType.Field(name=name, type_=Type(code=code))
+    for name, code in (
+        ("id", TypeCode.INT64),
+        ("amount", TypeCode.FLOAT64),
+        ("flag", TypeCode.BOOL),
+        ("name", TypeCode.STRING),
+        ("price", TypeCode.NUMERIC),
+        ("updated", TypeCode.TIMESTAMP),
+        ("id", TypeCode.INT64),
+    )
+]
+UPDATED = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+ROWS = [
+    [1, 1.5, True, "a", decimal.Decimal("1.1"), UPDATED, None],
+    [2, None, False, None, None, None, None],
+    [3, 2.5, None, "c", decimal.Decimal("2"), UPDATED, 5],
+    [4, float("nan"), True, "d", None, UPDATED, None],
+    [5, 3.5, False, "e", decimal.Decimal("3"), None, None],
+]
+
+
+class _Result(object):
+    """A streamed result set of rows."""
+
+    def __init__(self, rows, fields=FIELDS):
+        self.rows = rows
+        self.fields = fields
+
+    def __iter__(self):
+        return iter(self.rows)
+
+
+@pytest.fixture
+def module_under_test(monkeypatch):
+    from third_party.ibis.ibis_cloud_spanner import to_pandas
+
+    monkeypatch.setattr(to_pandas, "CHUNK_SIZE", 2)
+    return to_pandas
+
+
+def _expected_df(rows):
+    return pandas.DataFrame(rows, columns=[_.name for _ in FIELDS])
+
+
+@pytest.mark.parametrize("rows", (ROWS, ROWS[:2], ROWS[1:2], []))
+def test_to_pandas(module_under_test, rows):
+    snapshot = mock.Mock()
+    snapshot.execute_sql.return_value = _Result(rows)
+    df = module_under_test.pandas_df.to_pandas(snapshot, "SELECT 1", None)
+    pandas.testing.assert_frame_equal(df, _expected_df(rows))
+
+
+def test_to_pandas_partitioned(module_under_test):
+    database = mock.Mock()
+    batch_snapshot = database.batch_snapshot.return_value
+    batch_snapshot.generate_query_batches.return_value = [ROWS[:1], ROWS[1:2], []]
+    batch_snapshot.process_query_batch.side_effect = _Result
+    df = module_under_test.pandas_df.to_pandas_partitioned(database, "SELECT 1", 2)
+    pandas.testing.assert_frame_equal(df, _expected_df(ROWS[:2]))
+    batch_snapshot.close.assert_called_once()
+
+    batch_snapshot.generate_query_batches.side_effect = exceptions.InvalidArgument(
+        "Query is not root partitionable"
+    )
+    with pytest.raises(exceptions.InvalidArgument):
+        module_under_test.pandas_df.to_pandas_partitioned(database, "SELECT 1", 2)
@@ -0,0 +1,207 @@
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pandas
+import pytest
+
+DATA = pandas.DataFrame(
+    {
+        "slice_id": [0, 0, 0, 1, 1, 2],
+        "col_int": [1, 5, 3, 8, 2, None],
+        "col_float": [1.5, -2.25, 3.0, 10.5, 0.125, None],
+        "col_bits": [6, 3, 12, 9, 5, 17],
+    }
+)
+
+
+@pytest.fixture
+def module_under_test():
+    import data_validation.query_builder.query_builder
+
+    return data_validation.query_builder.query_builder
+
+
+@pytest.fixture
+def ibis_table():
+    import ibis
+
+    data = DATA.astype({"col_int": "Int64"})
+    return ibis.pandas.connect({"my_table": data}).table("my_table")
+
+
+@pytest.mark.parametrize(
+    "aggregate_type,field_name",
+    [
+        ("count", None),
+        ("count", "col_int"),
+        ("null_count", "col_int"),
+        ("sum", "col_int"),
+        ("min", "col_float"),
+        ("max", "col_int"),
+        ("bit_xor", "col_bits"),
+        ("avg", "col_float"),
+        ("std", "col_float"),
+    ],
+)
+def test_merge_partials(module_under_test, ibis_table, aggregate_type, field_name):
+    """Aggregates merged from the partials of slices (including a slice of nulls) match the full aggregate"""
+    aggregate_field = getattr(module_under_test.AggregateField, aggregate_type)(
+        field_name=field_name, alias="agg"
+    )
+    assert aggregate_field.is_mergeable()
+    expected = ibis_table.aggregate([aggregate_field.compile(ibis_table)]).execute()
+
+    partials_df = pandas.concat(
+        [
+            ibis_table.filter(ibis_table.slice_id == slice_id)
+            .aggregate([_.compile(ibis_table) for _ in aggregate_field.get_partials()])
+            .execute()
+            for slice_id in range(3)
+        ],
+        ignore_index=True,
+    )
+
+    assert aggregate_field.merge_partials(partials_df) == pytest.approx(
+        expected["agg"][0]
+    )
+
+
+def test_merge_partials_empty(module_under_test):
+    aggregate_field = module_under_test.AggregateField.sum(
+        field_name="col", alias="agg"
+    )
+    partials_df = pandas.DataFrame(
+        {"agg__dvt_sum": [None, None], "agg__dvt_count": [0, 0]}
+    )
+    assert aggregate_field.merge_partials(partials_df) is None
+
+
+def test_null_count_empty(module_under_test, tmp_path):
+    """SUM over no rows is NULL in SQL engines, the null count of an empty table is 0"""
+    import sqlite3
+
+    import ibis
+
+    db_path = str(tmp_path / "my_db.sqlite")
+    with sqlite3.connect(db_path) as con:
+        con.execute("CREATE TABLE my_table (col_int INTEGER)")
+    ibis_table = ibis.sqlite.connect(db_path).table("my_table")
+    aggregate_field = module_under_test.AggregateField.null_count(
+        field_name="col_int", alias="agg"
+    )
+    result = ibis_table.aggregate([aggregate_field.compile(ibis_table)]).execute()
+    assert result["agg"][0] == 0
+
+
+def test_is_mergeable_cast(module_under_test):
+    aggregate_field = module_under_test.AggregateField.sum(
+        field_name="col", alias="agg", cast="string"
+    )
+    assert not aggregate_field.is_mergeable()
+
+
+@pytest.mark.parametrize(
+    "aggregate_type,field_name,expected",
+    [
+        ("approx_count_distinct", "slice_id", 3),
+        ("approx_median", "col_float", 1.5),
+    ],
+)
+def test_approx_aggregates(
+    module_under_test, ibis_table, aggregate_type, field_name, expected
+):
+    aggregate_field = getattr(module_under_test.AggregateField, aggregate_type)(
+        field_name=field_name, alias="agg"
+    )
+    assert not aggregate_field.is_mergeable()
+    result = ibis_table.aggregate([aggregate_field.compile(ibis_table)]).execute()
+    assert result["agg"][0] == expected
+
+
+def test_bucket_count(module_under_test, ibis_table):
+    """Buckets count the non null values in [lower, upper), with unbounded first and last buckets"""
+    aggregates = [
+        module_under_test.AggregateField.bucket_count(
+            field_name="col_int", alias=f"bucket_{n}", lower=lower, upper=upper
+        ).compile(ibis_table, where=ibis_table.slice_id < 2)
+        for n, (lower, upper) in enumerate([(None, 3), (3, 5), (5, None)])
+    ]
+    result = ibis_table.aggregate(aggregates).execute()
+    assert result.iloc[0].tolist() == [2, 1, 2]
+
+
+@pytest.mark.parametrize(
+    "field_name,expected",
+    [
+        ("col_int", [1, 1, 3, 0, 2]),
+        ("col_float", [1, 3, 3, 2, 0]),
+    ],
+)
+def test_grouped_field_buckets(module_under_test, ibis_table, field_name, expected):
+    """Numeric values are bucketed on the modulo of their absolute floor value"""
+    grouped_field = module_under_test.GroupedField(field_name, "bucket", buckets=4)
+    ibis_table = ibis_table.filter(ibis_table.slice_id < 2)
+    result = ibis_table.projection([grouped_field.compile(ibis_table)]).execute()
+    assert result["bucket"].tolist() == expected
+
+
+def test_grouped_field_buckets_string(module_under_test):
+    """String values are bucketed on the leading hex digits of their SHA256 hash"""
+    import ibis
+
+    ibis_table = ibis.pandas.connect(
+        {"my_table": pandas.DataFrame({"col_str": ["a", "b"]})}
+    ).table("my_table")
+    grouped_field = module_under_test.GroupedField("col_str", "bucket", buckets=200)
+    result = ibis_table.projection([grouped_field.compile(ibis_table)]).execute()
+    assert result["bucket"].tolist() == ["ca", "3e"]
+
+
+def test_grouped_field_buckets_temporal(module_under_test):
+    """Dates are bucketed on their day number and timestamps on their epoch seconds"""
+    import ibis
+
+    ibis_table = ibis.pandas.connect(
+        {
+            "my_table": pandas.DataFrame(
+                {
+                    "col_ts": pandas.to_datetime(
+                        ["1970-01-04 12:00:00", "2024-01-02 00:00:05"]
+                    ),
+                    "col_bool": [True, False],
+                }
+            )
+        }
+    ).table("my_table")
+    # Timestamps without a cast are grouped on their date
+    grouped_field = module_under_test.GroupedField("col_ts", "bucket", buckets=7)
+    result = ibis_table.projection([grouped_field.compile(ibis_table)]).execute()
+    assert result["bucket"].tolist() == [3, 19724 % 7]
+
+    grouped_field = module_under_test.GroupedField(
+        "col_ts", "bucket", cast="timestamp", buckets=7
+    )
+    result = ibis_table.projection([grouped_field.compile(ibis_table)]).execute()
+    assert result["bucket"].tolist() == [302400 % 7, 1704153605 % 7]
+
+    grouped_field = module_under_test.GroupedField("col_bool", "bucket", buckets=7)
+    with pytest.raises(ValueError, match="col_bool"):
+        grouped_field.compile(ibis_table)
+
+
+def test_filter_bucket_isin(module_under_test, ibis_table):
+    grouped_field = module_under_test.GroupedField("col_int", buckets=4)
+    filter_field = module_under_test.FilterField.bucket_isin(grouped_field, ["3", None])
+    result = ibis_table.filter(filter_field.compile(ibis_table)).execute()
+    assert result["slice_id"].tolist() == [0, 2]
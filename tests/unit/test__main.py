@@ -17,7 +17,7 @@ import logging
 import os
 from unittest import mock
 
-from data_validation import cli_tools
+from data_validation import cli_tools, consts
 from data_validation import __main__ as main
 
 
@@ -162,3 +162,215 @@ def test_config_runner_3(mock_args, mock_build, mock_run, caplog):
     assert mock_run.call_args.args[0].config_dir is None
     assert os.path.basename(mock_run.call_args.args[0].config_file) == "0002.yaml"
     assert len(mock_run.call_args.args[1]) == 1
+
+
+@mock.patch("data_validation.__main__.run_validations")
+@mock.patch(
+    "data_validation.__main__.build_config_managers_from_yaml_config",
+    return_value=["config manager"],
+)
+@mock.patch("data_validation.partition_manifest.PartitionManifest.read")
+def test_config_runner_manifest(mock_read, mock_build, mock_run, caplog):
+    """Run a partition manifest in a Kubernetes Completion Environment. Expected result
+    1. Only the task corresponding to JOB_COMPLETION_INDEX is built and run
+    2. No warnings
+    """
+    caplog.set_level(logging.WARNING)
+    os.environ["JOB_COMPLETION_INDEX"] = "2"
+    args = argparse.Namespace(
+        verbose=False,
+        dry_run=False,
+        kube_completions=True,
+        config_dir=None,
+        config_file="gs://bucket/partitions/my_table/partitions.json",
+    )
+    main.config_runner(args)
+    assert caplog.messages == []
+    mock_read.return_value.get_yaml_config.assert_called_once_with(2)
+    assert mock_build.call_count == 1
+    assert mock_run.call_args.args[1] == ["config manager"]
+
+
+def _get_row_config_manager():
+    config_manager = mock.MagicMock()
+    config_manager.validation_type = consts.ROW_VALIDATION
+    config_manager.primary_keys = [{"source_column": "id", "target_column": "id"}]
+    config_manager.source_shards = []
+    config_manager.config = {consts.CONFIG_FILTERS: []}
+    return config_manager
+
+
+@mock.patch("data_validation.__main__.ConfigManager")
+@mock.patch("data_validation.__main__.run_validation")
+@mock.patch(
+    "data_validation.__main__.PartitionBuilder.split_validation",
+    return_value=[{"filters": ["a"]}, {"filters": ["b"]}, {"filters": ["c"]}],
+)
+@mock.patch(
+    "data_validation.__main__.PartitionBuilder.get_source_row_count",
+    return_value=(250, True),
+)
+def test_run_partition_validation_max_rows(
+    mock_count, mock_split, mock_run, mock_config_manager
+):
+    """A partition with more rows than --partition-max-rows is split before it is run."""
+    args = argparse.Namespace(
+        dry_run=False, verbose=False, partition_max_rows=100, partition_max_seconds=None
+    )
+    validation_blocks = main.run_partition_validation(args, _get_row_config_manager())
+    assert mock_split.call_args.args[1] == 3
+    assert mock_run.call_count == 3
+    assert validation_blocks == mock_split.return_value
+
+
+@mock.patch("data_validation.__main__.run_validation")
+@mock.patch("data_validation.__main__.PartitionBuilder.split_validation")
+@mock.patch(
+    "data_validation.__main__.PartitionBuilder.get_source_row_count",
+    return_value=(50, True),
+)
+def test_run_partition_validation_under_max_rows(mock_count, mock_split, mock_run):
+    """A partition within the --partition-max-rows target is run as is."""
+    args = argparse.Namespace(
+        dry_run=False, verbose=False, partition_max_rows=100, partition_max_seconds=None
+    )
+    assert main.run_partition_validation(args, _get_row_config_manager()) is None
+    assert not mock_split.called
+    assert mock_run.call_count == 1
+
+
+@mock.patch("data_validation.__main__.time.monotonic", side_effect=[0, 25])
+@mock.patch("data_validation.__main__.run_validation")
+@mock.patch(
+    "data_validation.__main__.PartitionBuilder.split_validation",
+    return_value=[{"filters": ["a"]}, {"filters": ["b"]}, {"filters": ["c"]}],
+)
+@mock.patch(
+    "data_validation.__main__.PartitionBuilder.get_source_row_count",
+    return_value=(1000, True),
+)
+def test_run_partition_validation_max_seconds(
+    mock_count, mock_split, mock_run, mock_time
+):
+    """A partition slower than --partition-max-seconds is run and then split for subsequent runs."""
+    args = argparse.Namespace(
+        dry_run=False, verbose=False, partition_max_rows=None, partition_max_seconds=10
+    )
+    validation_blocks = main.run_partition_validation(args, _get_row_config_manager())
+    assert mock_run.call_count == 1
+    assert mock_split.call_args.args[1] == 3
+    assert validation_blocks == mock_split.return_value
+
+
+def test_store_split_partitions(tmp_path):
+    """Split validations replace the validation they were split from in the YAML file."""
+    yaml_config = {
+        consts.YAML_SOURCE: "src",
+        consts.YAML_TARGET: "tgt",
+        consts.YAML_RESULT_HANDLER: {},
+        consts.YAML_VALIDATIONS: [{"filters": ["p0"]}, {"filters": ["p1"]}],
+    }
+    cli_tools.store_validation(str(tmp_path / "0000.yaml"), yaml_config)
+    args = argparse.Namespace(config_dir=str(tmp_path))
+
+    main.store_split_partitions(
+        args, "0000.yaml", {0: [{"filters": ["p0", "a"]}, {"filters": ["p0", "b"]}]}
+    )
+
+    validations = cli_tools.get_validation("0000.yaml", str(tmp_path))[
+        consts.YAML_VALIDATIONS
+    ]
+    assert validations == [
+        {"filters": ["p0", "a"]},
+        {"filters": ["p0", "b"]},
+        {"filters": ["p1"]},
+    ]
+
+
+@mock.patch("data_validation.__main__.store_split_partitions")
+@mock.patch("data_validation.__main__.run_partition_validation")
+def test_run_validations_split_index(mock_run, mock_store):
+    """Split partitions are stored under the index of the validation they were split from."""
+    config = {
+        consts.CONFIG_FILE: "0000.yaml",
+        consts.CONFIG_TYPE: consts.ROW_VALIDATION,
+    }
+    config_managers = [mock.MagicMock(config=config) for _ in range(2)]
+    for config_manager in config_managers:
+        # Identical validations compare equal
+        config_manager.__eq__.return_value = True
+    validation_blocks = [{"filters": ["a"]}, {"filters": ["b"]}]
+    mock_run.side_effect = [None, validation_blocks]
+    args = argparse.Namespace(dry_run=True, verbose=False)
+
+    main.run_validations(args, config_managers)
+    assert mock_store.call_args.args[2] == {1: validation_blocks}
+
+
+@mock.patch("data_validation.__main__.run_validation")
+@mock.patch("data_validation.batched_validation.BatchedValidation")
+@mock.patch("data_validation.schema_validation.prefetch_table_schemas")
+@mock.patch("data_validation.fused_validation.fits_max_aggregates", return_value=True)
+@mock.patch("data_validation.fused_validation.is_fusible", return_value=True)
+@mock.patch("data_validation.fused_validation.plan_validations")
+def test_run_validations_batch_fallback(
+    mock_plan, mock_fusible, mock_fits, mock_prefetch, mock_batched, mock_run
+):
+    """Only the tables whose batched queries failed are validated on their own."""
+    config_managers = [mock.MagicMock(config={}) for _ in range(3)]
+    mock_plan.return_value = [[_] for _ in config_managers]
+    result_df = mock.MagicMock()
+    mock_batched.return_value.get_reports.return_value = [
+        [result_df],
+        None,
+        [result_df],
+    ]
+    args = argparse.Namespace(
+        dry_run=False, verbose=False, batch_tables=True, batch_max_sql_length=1000
+    )
+
+    main.run_validations(args, config_managers)
+    config_managers[0].get_result_handler.return_value.execute.assert_called_once_with(
+        result_df
+    )
+    assert mock_run.call_args_list == [
+        mock.call(config_managers[1], dry_run=False, verbose=False)
+    ]
+
+
+@mock.patch("data_validation.clients._get_ibis_table_schema")
+@mock.patch("data_validation.clients.get_schema_table_schemas")
+def test_run_validations_prefetched_schemas(mock_catalog, mock_reflect):
+    """Schema validations use the schemas prefetched on the shared clients."""
+    import ibis
+
+    from data_validation.config_manager import ConfigManager
+
+    schema = ibis.schema({"col_a": "int64"})
+    mock_catalog.return_value = {"table_1": schema, "table_2": schema}
+    source_client, target_client = ibis.pandas.connect(), ibis.pandas.connect()
+    source_client._source_type = target_client._source_type = "Pandas"
+    config_managers = [
+        ConfigManager(
+            {
+                consts.CONFIG_SOURCE_CONN: {"source_type": "Pandas"},
+                consts.CONFIG_TARGET_CONN: {"source_type": "Pandas"},
+                consts.CONFIG_TYPE: consts.SCHEMA_VALIDATION,
+                consts.CONFIG_SCHEMA_NAME: "my_schema",
+                consts.CONFIG_TABLE_NAME: table_name,
+                consts.CONFIG_TARGET_SCHEMA_NAME: "my_schema",
+                consts.CONFIG_TARGET_TABLE_NAME: table_name,
+                consts.CONFIG_RESULT_HANDLER: None,
+                consts.CONFIG_FORMAT: "table",
+                consts.CONFIG_FILTER_STATUS: None,
+            },
+            source_client=source_client,
+            target_client=target_client,
+        )
+        for table_name in ("table_1", "table_2")
+    ]
+    args = argparse.Namespace(dry_run=False, verbose=False)
+
+    main.run_validations(args, config_managers)
+    assert mock_catalog.call_count == 2
+    mock_reflect.assert_not_called()
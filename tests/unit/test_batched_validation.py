@@ -0,0 +1,187 @@
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import copy
+from unittest import mock
+
+import ibis.expr.operations as ops
+import pandas
+import pytest
+from ibis.common.graph import Graph
+
+from data_validation import consts
+from data_validation.config_manager import ConfigManager
+
+COLUMN_CONFIG = {
+    "source_conn": {"source_type": "Pandas"},
+    "target_conn": {"source_type": "Pandas"},
+    consts.CONFIG_TYPE: "Column",
+    "schema_name": None,
+    "table_name": "table_1",
+    "target_schema_name": None,
+    "target_table_name": "table_1",
+    consts.CONFIG_GROUPED_COLUMNS: [],
+    consts.CONFIG_AGGREGATES: [
+        {
+            "source_column": None,
+            "target_column": None,
+            "field_alias": "count",
+            "type": "count",
+        },
+        {
+            "source_column": "col_a",
+            "target_column": "col_a",
+            "field_alias": "sum__col_a",
+            "type": "sum",
+        },
+    ],
+    consts.CONFIG_THRESHOLD: 0.0,
+    consts.CONFIG_RESULT_HANDLER: None,
+    consts.CONFIG_FORMAT: "table",
+    consts.CONFIG_FILTER_STATUS: None,
+}
+
+
+@pytest.fixture
+def module_under_test():
+    import data_validation.batched_validation
+
+    return data_validation.batched_validation
+
+
+def _get_client(table_2_col_a):
+    import ibis
+
+    client = ibis.pandas.connect(
+        {
+            "table_1": pandas.DataFrame({"col_a": [1, 2, 4]}),
+            "table_2": pandas.DataFrame({"col_a": table_2_col_a}),
+            "table_3": pandas.DataFrame({"col_a": [0.5, 1.5]}),
+        }
+    )
+    client._source_type = "Pandas"
+    return client
+
+
+def _get_validation_groups(*table_names):
+    source_client = _get_client([1, 1])
+    target_client = _get_client([1, 2])
+    validation_groups = []
+    for table_name in table_names:
+        config = copy.deepcopy(COLUMN_CONFIG)
+        config["table_name"] = config["target_table_name"] = table_name
+        validation_groups.append(
+            [
+                ConfigManager(
+                    config, source_client=source_client, target_client=target_client
+                )
+            ]
+        )
+    return validation_groups
+
+
+def test_plan_batches(module_under_test):
+    validation_groups = _get_validation_groups("table_1", "table_2", "table_3")
+    batched_validation = module_under_test.BatchedValidation(validation_groups)
+    fused_validations = batched_validation.fused_validations
+    batches = batched_validation._plan_batches(
+        [_.config_managers[0].source_client for _ in fused_validations],
+        [_.get_source_query() for _ in fused_validations],
+    )
+
+    # The float sum of table_3 cannot be unioned with the integer sums
+    assert [[_.batch_id for _ in branches] for _, branches in batches] == [
+        [0, 1],
+        [2],
+    ]
+
+
+def test_plan_batches_max_sql_length(module_under_test):
+    validation_groups = _get_validation_groups("table_1", "table_2")
+    batched_validation = module_under_test.BatchedValidation(
+        validation_groups, max_sql_length=1
+    )
+    fused_validations = batched_validation.fused_validations
+    batches = batched_validation._plan_batches(
+        [_.config_managers[0].source_client for _ in fused_validations],
+        [_.get_source_query() for _ in fused_validations],
+    )
+
+    assert len(batches) == 2
+
+
+def test_get_reports(module_under_test):
+    validation_groups = _get_validation_groups("table_1", "table_2", "table_3")
+    reports = module_under_test.BatchedValidation(validation_groups).get_reports()
+
+    assert len(reports) == 3
+    for (validation_group_reports, table_name, status) in zip(
+        reports,
+        ("table_1", "table_2", "table_3"),
+        (
+            consts.VALIDATION_STATUS_SUCCESS,
+            consts.VALIDATION_STATUS_FAIL,
+            consts.VALIDATION_STATUS_SUCCESS,
+        ),
+    ):
+        report = validation_group_reports[0].set_index("validation_name")
+        assert (report["source_table_name"] == table_name).all()
+        assert report.loc["sum__col_a", "validation_status"] == status
+    assert reports[1][0].set_index("validation_name").loc["sum__col_a"][
+        ["source_agg_value", "target_agg_value"]
+    ].tolist() == ["2", "3"]
+
+
+def test_get_reports_failed_branch(module_under_test):
+    """A failing table is left out of the reports without failing the rest of its batch"""
+    validation_groups = _get_validation_groups("table_1", "table_2", "table_3")
+    target_client = validation_groups[0][0].target_client
+    execute = target_client.execute
+
+    def _execute(query, *args, **kwargs):
+        if any(
+            isinstance(_, ops.DatabaseTable) and _.name == "table_2"
+            for _ in Graph.from_bfs(query.op())
+        ):
+            raise ValueError("table_2 is not available")
+        return execute(query, *args, **kwargs)
+
+    target_client.execute = _execute
+    reports = module_under_test.BatchedValidation(validation_groups).get_reports()
+
+    assert reports[1] is None
+    for validation_group_reports, table_name in zip(
+        (reports[0], reports[2]), ("table_1", "table_3")
+    ):
+        report = validation_group_reports[0].set_index("validation_name")
+        assert (report["source_table_name"] == table_name).all()
+        assert (report["validation_status"] == consts.VALIDATION_STATUS_SUCCESS).all()
+
+
+def test_run_batches_max_workers(module_under_test):
+    """Union queries of one side are run by a pool bounded by BATCH_MAX_WORKERS"""
+    batched_validation = module_under_test.BatchedValidation([])
+    batches = [(mock.Mock(), [mock.Mock()]) for _ in range(3)]
+    with mock.patch.object(consts, "BATCH_MAX_WORKERS", 2), mock.patch.object(
+        module_under_test,
+        "ThreadPoolExecutor",
+        wraps=module_under_test.ThreadPoolExecutor,
+    ) as executor, mock.patch.object(
+        module_under_test.BatchedValidation,
+        "_run_batch",
+        side_effect=lambda client, branches: {id(client): None},
+    ):
+        results = batched_validation._run_batches(batches)
+    executor.assert_called_once_with(max_workers=2)
+    assert len(results) == 3
@@ -144,6 +144,14 @@ def test_get_connection_config_from_args():
     conn = cli_tools.get_connection_config_from_args(args)
 
     assert conn["project_id"] == "example-project"
+    assert consts.FETCH_SIZE not in conn
+
+    args = parser.parse_args(
+        CLI_ADD_CONNECTION_ARGS[:2]
+        + ["--fetch-size", "5000"]
+        + CLI_ADD_CONNECTION_ARGS[2:]
+    )
+    assert cli_tools.get_connection_config_from_args(args)[consts.FETCH_SIZE] == 5000
 
 
 def test_create_and_list_connections(caplog, fs):
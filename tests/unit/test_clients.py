@@ -12,12 +12,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import datetime
+import decimal
 from unittest import mock
 import pytest
 
 from google.auth import credentials
 import pandas
+import pyarrow
+import pyarrow.parquet
+import ibis
 import ibis.backends.pandas
+import ibis.expr.datatypes as dt
 from ibis.backends.pandas import BasePandasBackend as PandasBackend
 
 from data_validation import clients, exceptions
@@ -64,6 +70,114 @@ def test_get_all_tables():
     assert all_tables == TABLES_RESULT
 
 
+def test_get_all_tables_catalog():
+    from sqlalchemy.dialects.oracle.base import OracleDialect
+
+    rows = [("HR", "EMPLOYEES"), ("HR", "EMP_VIEW"), ("SALES", "ORDERS")]
+    client = _get_columns_client("oracle", rows, OracleDialect())
+    client.list_databases.return_value = ["hr", "sales", "empty"]
+    assert clients.get_all_tables(client) == [
+        ("hr", "employees"),
+        ("hr", "emp_view"),
+        ("sales", "orders"),
+    ]
+    params = client.begin.return_value.__enter__.return_value.execute.call_args.args[1]
+    assert params == {"schema_names": ["HR", "SALES", "EMPTY"]}
+    client.list_tables.assert_not_called()
+
+
+def test_get_all_tables_concurrent():
+    client = mock.MagicMock()
+    client.name = "mysql"
+    client.list_databases.return_value = ["s1", "s2", "s3"]
+
+    def list_tables(database=None):
+        if database == "s2":
+            raise Exception("Access denied")
+        return [f"{database}_t1", f"{database}_t2"]
+
+    client.list_tables.side_effect = list_tables
+    assert clients.get_all_tables(client) == [
+        ("s1", "s1_t1"),
+        ("s1", "s1_t2"),
+        ("s3", "s3_t1"),
+        ("s3", "s3_t2"),
+    ]
+    assert clients.get_all_tables(client, allowed_schemas=["s3"]) == [
+        ("s3", "s3_t1"),
+        ("s3", "s3_t2"),
+    ]
+
+
+def test_fetch_from_cursor(tmp_path):
+    import sqlite3
+
+    db_path = str(tmp_path / "my_db.sqlite")
+    with sqlite3.connect(db_path) as con:
+        con.execute("CREATE TABLE my_table (id INTEGER, name TEXT, updated TIMESTAMP)")
+        con.execute("INSERT INTO my_table VALUES (1, 'a', '2024-01-01 00:00:00')")
+        con.execute("INSERT INTO my_table VALUES (2, NULL, NULL)")
+    client = ibis.sqlite.connect(db_path)
+    table = client.table(TABLE_NAME)
+
+    # Rows are fetched from the DB-API cursor
+    with mock.patch.object(
+        clients,
+        "_alchemy_fetch_from_cursor",
+        wraps=clients._alchemy_fetch_from_cursor,
+    ) as fetch:
+        df = client.execute(table[["id", "name"]])
+        fetch.assert_not_called()
+        assert df.to_dict("records") == [
+            {"id": 1, "name": "a"},
+            {"id": 2, "name": None},
+        ]
+
+        # Values converted by SQLAlchemy are fetched through SQLAlchemy
+        df = client.execute(table)
+        fetch.assert_called_once()
+        assert df["updated"][0] == pandas.Timestamp("2024-01-01")
+
+
+def test_fetch_from_cursor_batches(tmp_path):
+    import sqlite3
+
+    db_path = str(tmp_path / "my_db.sqlite")
+    with sqlite3.connect(db_path) as con:
+        con.execute("CREATE TABLE my_table (id INTEGER, amount REAL, name TEXT)")
+        con.executemany(
+            "INSERT INTO my_table VALUES (?, ?, ?)",
+            [(None, None, None), (None, 1.5, "b"), (3, None, "c"), (4, 2.5, None)],
+        )
+    client = ibis.sqlite.connect(db_path)
+    table = client.table(TABLE_NAME)
+    queries = [table, table.limit(1), table.filter(table.id > 10)]
+    expected_dfs = [client.execute(_) for _ in queries]
+
+    # Batches typed with the query schema are concatenated
+    client._fetch_size = 2
+    with mock.patch.object(
+        clients,
+        "_iter_fetched_batches",
+        wraps=clients._iter_fetched_batches,
+    ) as fetch:
+        for query, expected_df in zip(queries, expected_dfs):
+            pandas.testing.assert_frame_equal(client.execute(query), expected_df)
+        assert fetch.call_count == 3
+
+
+def test_set_fetch_size():
+    client = mock.MagicMock()
+    client.name = "oracle"
+    clients.set_fetch_size(client, 5000)
+    assert client._fetch_size == 5000
+    assert client.con.dialect.arraysize == 5000
+
+    client = _get_pandas_client()
+    clients.set_fetch_size(client, 5000)
+    assert not hasattr(client, "_fetch_size")
+
+
 def test_get_bigquery_client_sets_user_agent():
     mock_credentials = mock.create_autospec(credentials.Credentials)
     ibis_client = clients.get_bigquery_client(
@@ -93,3 +207,233 @@ def test_get_pandas_data_client():
     ibis_client = clients.get_data_client(conn_config)
 
     assert isinstance(ibis_client, PandasBackend)
+
+
+@pytest.mark.parametrize("file_type", ["orc", "parquet"])
+def test_get_pandas_client_columns(tmp_path, file_type):
+    file_path = str(tmp_path / f"{TABLE_NAME}.{file_type}")
+    df = pandas.DataFrame(
+        {
+            "id": [1, 2, 3],
+            "amount": [1.5, None, 2.5],
+            "count": [1, None, 3],
+            "name": ["a", None, "c"],
+            "updated": pandas.to_datetime(["2024-01-01"] * 3, utc=True),
+        }
+    )
+    if file_type == "orc":
+        df.to_orc(file_path)
+        eager_df = pandas.read_orc(file_path)
+    else:
+        df.to_parquet(file_path)
+        eager_df = pandas.read_parquet(file_path)
+    eager_client = ibis.pandas.connect({TABLE_NAME: eager_df})
+
+    client = clients.get_pandas_client(TABLE_NAME, file_path, file_type)
+    assert client.get_schema(TABLE_NAME) == eager_client.get_schema(TABLE_NAME)
+    assert client._loaded_columns == set()
+
+    # Only the columns an expression references are read
+    table = client.table(TABLE_NAME)
+    assert table.count().execute() == 3
+    assert client._loaded_columns == set()
+    assert table.aggregate(total=table.amount.sum()).execute()["total"][0] == 4
+    assert client._loaded_columns == {"amount"}
+
+    pandas.testing.assert_frame_equal(
+        table.execute(), eager_client.table(TABLE_NAME).execute()
+    )
+
+
+def test_get_pandas_client_schema_from_statistics(tmp_path):
+    file_path = str(tmp_path / f"{TABLE_NAME}.parquet")
+    pyarrow.parquet.write_table(
+        pyarrow.table(
+            {
+                "id": pyarrow.array([1, 2, 3], pyarrow.int32()),
+                "count": [1, None, 3],
+                "name": ["a", None, "c"],
+                "flag": [True, False, None],
+                "day": [datetime.date(2024, 1, 1)] * 3,
+                "price": [decimal.Decimal("1.5"), None, decimal.Decimal("2.5")],
+            }
+        ),
+        file_path,
+    )
+    eager_client = ibis.pandas.connect({TABLE_NAME: pandas.read_parquet(file_path)})
+
+    client = clients.get_pandas_client(TABLE_NAME, file_path, "parquet")
+    with mock.patch.object(client._file, "read", wraps=client._file.read) as mock_read:
+        table = client.table(TABLE_NAME)
+    # Only the decimal column is read, the types of the others follow from the file metadata
+    mock_read.assert_called_once_with(["price"])
+    assert table.schema() == eager_client.get_schema(TABLE_NAME)
+    assert table.schema()["count"] == dt.float64
+
+    # Nullable integers of pandas are not converted to float64
+    df = pandas.DataFrame({"count": pandas.array([1, None, 3], dtype="Int64")})
+    df.to_parquet(file_path)
+    client = clients.get_pandas_client(TABLE_NAME, file_path, "parquet")
+    assert client.table(TABLE_NAME).schema()["count"] == dt.int64
+
+
+def test_get_pandas_client_partitioned(tmp_path):
+    df = pandas.DataFrame({"id": [1, 2, 3], "region": ["eu", "us", "us"]})
+    df.to_parquet(str(tmp_path / "data"), partition_cols=["region"])
+
+    for file_path in (str(tmp_path / "data"), str(tmp_path / "data" / "*" / "*")):
+        client = clients.get_pandas_client(TABLE_NAME, file_path, "parquet")
+        table = client.table(TABLE_NAME)
+        assert table.columns == ["id", "region"]
+        assert sorted(table.id.execute()) == [1, 2, 3]
+        assert client._loaded_columns == {"id"}
+
+
+def _get_catalog_client(name, row_count):
+    client = mock.MagicMock()
+    client.name = name
+    con = client.begin.return_value.__enter__.return_value
+    con.execute.return_value.scalar.return_value = row_count
+    return client
+
+
+def test_get_table_row_count_estimate():
+    client = _get_catalog_client("postgres", 1000.0)
+    assert clients.get_table_row_count_estimate(client, "my_schema", TABLE_NAME) == 1000
+    params = client.begin.return_value.__enter__.return_value.execute.call_args.args[1]
+    assert params == {"schema_name": "my_schema", "table_name": TABLE_NAME}
+
+    # Statistics not gathered
+    client = _get_catalog_client("postgres", -1)
+    assert clients.get_table_row_count_estimate(client, "my_schema", TABLE_NAME) is None
+    client = _get_catalog_client("oracle", None)
+    assert clients.get_table_row_count_estimate(client, "my_schema", TABLE_NAME) is None
+
+    # Engines without catalog statistics
+    assert (
+        clients.get_table_row_count_estimate(
+            _get_pandas_client(), "my_schema", TABLE_NAME
+        )
+        is None
+    )
+
+
+def test_get_table_row_count_estimate_bigquery():
+    client = mock.MagicMock()
+    client.name = "bigquery"
+    client.data_project = "my-project"
+    client.client.get_table.return_value.num_rows = 42
+    assert clients.get_table_row_count_estimate(client, "my_dataset", TABLE_NAME) == 42
+    client.client.get_table.assert_called_once_with("my-project.my_dataset.my_table")
+
+
+def test_get_table_fingerprint_oracle():
+    """Monitoring information is flushed first and tables without modifications have no fingerprint"""
+    client = _get_catalog_client("oracle", None)
+    assert clients.get_table_fingerprint(client, "my_schema", TABLE_NAME) is None
+    con = client.begin.return_value.__enter__.return_value
+    assert [str(_.args[0]) for _ in con.execute.call_args_list] == [
+        clients.TABLE_FINGERPRINT_FLUSH_SQL["oracle"],
+        clients.TABLE_FINGERPRINT_SQL["oracle"],
+    ]
+
+    # The flush requires the ANALYZE ANY privilege
+    con.execute.side_effect = Exception("ORA-20000: insufficient privileges")
+    assert clients.get_table_fingerprint(client, "my_schema", TABLE_NAME) is None
+
+
+def _get_columns_client(name, rows, dialect=None):
+    client = mock.MagicMock()
+    client.name = name
+    client.con.dialect = dialect
+    client._table_schemas = {}
+    con = client.begin.return_value.__enter__.return_value
+    con.execute.return_value.fetchall.return_value = rows
+    return client
+
+
+def test_get_schema_table_schemas():
+    from sqlalchemy.dialects.postgresql.base import PGDialect
+
+    rows = [
+        ("my_table", "id", "integer", 32, 0, "NO"),
+        ("my_table", "amount", "numeric", 10, 2, "YES"),
+        ("my_table", "updated", "timestamp with time zone", None, None, "YES"),
+        ("other_table", "tags", "ARRAY", None, None, "YES"),
+        ("Quoted_Table", "id", "integer", 32, 0, "NO"),
+        ("quoted_table", "id", "integer", 32, 0, "NO"),
+    ]
+    client = _get_columns_client("postgres", rows, PGDialect())
+    table_schemas = clients.get_schema_table_schemas(client, "my_schema")
+    params = client.begin.return_value.__enter__.return_value.execute.call_args.args[1]
+    assert params == {"schema_name": "my_schema"}
+
+    # Tables with unmapped types or names colliding after casefold are left to reflection
+    assert list(table_schemas) == [TABLE_NAME]
+    assert table_schemas[TABLE_NAME] == ibis.schema(
+        {
+            "id": dt.Int32(nullable=False),
+            "amount": dt.Decimal(10, 2),
+            "updated": dt.Timestamp(timezone="UTC"),
+        }
+    )
+
+    # Engines without a catalog query
+    assert clients.get_schema_table_schemas(_get_pandas_client(), "my_schema") is None
+
+
+def test_get_schema_table_schemas_oracle():
+    from sqlalchemy.dialects.oracle.base import OracleDialect
+
+    rows = [
+        ("MY_TABLE", "ID", "NUMBER", None, 0, "N"),
+        ("MY_TABLE", "AMOUNT", "NUMBER", 10, 2, "Y"),
+        ("MY_TABLE", "CREATED", "TIMESTAMP(6)", None, 6, "Y"),
+    ]
+    client = _get_columns_client("oracle", rows, OracleDialect())
+    table_schema = clients.get_schema_table_schemas(client, "my_schema")[TABLE_NAME]
+    assert list(table_schema.names) == ["id", "amount", "created"]
+    assert table_schema["id"].is_integer()
+    assert table_schema["amount"] == dt.Decimal(10, 2)
+    assert table_schema["created"].is_timestamp()
+
+
+def test_get_schema_table_schemas_bigquery():
+    # Registers the BigQuery column types used by the BigQuery backend
+    import third_party.ibis.ibis_addon.operations  # noqa: F401
+
+    client = mock.MagicMock()
+    client.name = "bigquery"
+    client.data_project = "my-project"
+    client.client.query.return_value.result.return_value = [
+        ("my_table", "id", "INT64", None, None, "NO"),
+        ("my_table", "amount", "NUMERIC(10, 2)", None, None, "YES"),
+        ("my_table", "name", "STRING(20)", None, None, "YES"),
+        ("other_table", "tags", "ARRAY<INT64>", None, None, "NO"),
+    ]
+    table_schemas = clients.get_schema_table_schemas(client, "my_dataset")
+    assert "`my-project.my_dataset`" in client.client.query.call_args.args[0]
+    assert list(table_schemas) == [TABLE_NAME]
+    assert table_schemas[TABLE_NAME] == ibis.schema(
+        {
+            "id": dt.Int64(nullable=False),
+            "amount": dt.Decimal(10, 2),
+            "name": dt.string,
+        }
+    )
+
+
+def test_get_ibis_table_schema_prefetched():
+    from sqlalchemy.dialects.postgresql.base import PGDialect
+
+    rows = [("my_table", "id", "bigint", 64, 0, "YES")]
+    client = _get_columns_client("postgres", rows, PGDialect())
+    assert clients.prefetch_table_schemas(client, "my_schema") == 1
+    assert clients.get_ibis_table_schema(client, "my_schema", "MY_TABLE") == (
+        ibis.schema({"id": dt.int64})
+    )
+    client.table.assert_not_called()
+
+    # Tables missing from the catalog are reflected
+    clients.get_ibis_table_schema(client, "my_schema", "new_table")
+    client.table.assert_called_once_with("new_table", schema="my_schema")
@@ -389,6 +389,71 @@ def test_build_config_aggregates_no_match(module_under_test):
     assert not aggregate_configs
 
 
+def test_build_config_aggregates_strict_types(module_under_test):
+    config_manager = module_under_test.ConfigManager(
+        copy.copy(SAMPLE_CONFIG), MockIbisClient(), MockIbisClient(), verbose=False
+    )
+
+    aggregate_configs = config_manager.build_config_column_aggregates(
+        "sum", ["a", "c"], False, ["int64"], strict_types=True
+    )
+    assert aggregate_configs == [AGGREGATE_CONFIG_A]
+
+
+def test_build_config_histogram_aggregates(module_under_test):
+    import ibis
+    import pandas
+
+    client = ibis.pandas.connect(
+        {
+            "my_table": pandas.DataFrame(
+                {"a": [0, 5, 10, 20], "b": [None, None, None, None], "c": list("wxyz")}
+            ).astype({"b": "float64"})
+        }
+    )
+    client._source_type = "Pandas"
+    config = copy.deepcopy(SAMPLE_CONFIG)
+    config[consts.CONFIG_SCHEMA_NAME] = None
+    config[consts.CONFIG_TABLE_NAME] = "my_table"
+    config_manager = module_under_test.ConfigManager(config, client, client)
+
+    aggregate_configs = config_manager.build_config_histogram_aggregates(
+        None, False, ["int64", "float64"], 4
+    )
+
+    # The column of nulls and the string column have no histogram
+    assert [
+        (
+            _[consts.CONFIG_FIELD_ALIAS],
+            _[consts.CONFIG_BUCKET_LOWER],
+            _[consts.CONFIG_BUCKET_UPPER],
+        )
+        for _ in aggregate_configs
+    ] == [
+        ("bucket_count__a_0", None, 5.0),
+        ("bucket_count__a_1", 5.0, 10.0),
+        ("bucket_count__a_2", 10.0, 15.0),
+        ("bucket_count__a_3", 15.0, None),
+    ]
+
+
+def test_get_aggregate_threshold(module_under_test):
+    config = copy.deepcopy(SAMPLE_CONFIG)
+    config[consts.CONFIG_THRESHOLD] = 1.0
+    config[consts.CONFIG_AGGREGATE_THRESHOLDS] = {"avg": 5.0, "approx_median": 0.5}
+    config_manager = module_under_test.ConfigManager(
+        config, MockIbisClient(), MockIbisClient(), verbose=False
+    )
+
+    assert config_manager.get_aggregate_threshold("sum") == 1.0
+    assert config_manager.get_aggregate_threshold("avg") == 5.0
+    assert config_manager.get_aggregate_threshold("approx_median") == 0.5
+    assert (
+        config_manager.get_aggregate_threshold("approx_count_distinct")
+        == consts.DEFAULT_APPROX_THRESHOLD
+    )
+
+
 def test_build_config_count_aggregate(module_under_test):
     config_manager = module_under_test.ConfigManager(
         copy.copy(SAMPLE_CONFIG), MockIbisClient(), MockIbisClient(), verbose=False
@@ -594,3 +659,48 @@ def test_build_dependent_aliases_exception(module_under_test):
         str(excinfo.value)
         == "Exclude columns flag cannot be present with column list '*'"
     )
+
+
+def test_calculated_table_memoized(module_under_test):
+    """The calculated tables of a 1,000 column table are built once per config change"""
+    import ibis
+    import pandas
+
+    df = pandas.DataFrame({f"col_{i}": [1, 2] for i in range(1000)})
+    client = ibis.pandas.connect({"my_table": df})
+    client._source_type = "Pandas"
+    config = copy.deepcopy(SAMPLE_CONFIG)
+    config[consts.CONFIG_TABLE_NAME] = "my_table"
+    config[consts.CONFIG_TARGET_TABLE_NAME] = "my_table"
+    config_manager = module_under_test.ConfigManager(config, client, client)
+
+    with mock.patch.object(
+        module_under_test,
+        "ValidationBuilder",
+        wraps=module_under_test.ValidationBuilder,
+    ) as validation_builder:
+        aggregate_configs = []
+        for agg_type in ("count", "sum", "avg", "min", "max"):
+            aggregate_configs += config_manager.build_config_column_aggregates(
+                agg_type, None, False, ["int64"]
+            )
+        config_manager.build_dependent_aliases("hash")
+        assert len(aggregate_configs) == 5000
+        assert validation_builder.call_count == 1
+
+        # Changing the config builds the calculated tables again
+        config_manager.append_calculated_fields(
+            [
+                {
+                    consts.CONFIG_CALCULATED_SOURCE_COLUMNS: ["col_0"],
+                    consts.CONFIG_CALCULATED_TARGET_COLUMNS: ["col_0"],
+                    consts.CONFIG_FIELD_ALIAS: "cast__col_0",
+                    consts.CONFIG_TYPE: "cast",
+                    consts.CONFIG_DEFAULT_CAST: "string",
+                    consts.CONFIG_DEPTH: 0,
+                }
+            ]
+        )
+        calculated_table = config_manager.get_source_ibis_calculated_table(depth=0)
+        assert "cast__col_0" in calculated_table.columns
+        assert validation_builder.call_count == 2
@@ -12,11 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
 import json
 import logging
 import pandas
 import pytest
 import random
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from unittest import mock
 from google.cloud import bigquery
@@ -149,6 +151,44 @@ SAMPLE_GC_CONFIG = {
     consts.CONFIG_FILTER_STATUS: None,
 }
 
+# Grouped Column config bucketing a high cardinality column
+SAMPLE_BUCKET_GC_CONFIG = {
+    "source_conn": SOURCE_CONN_CONFIG,
+    "target_conn": TARGET_CONN_CONFIG,
+    consts.CONFIG_TYPE: consts.COLUMN_VALIDATION,
+    "schema_name": None,
+    "table_name": "my_table",
+    "target_schema_name": None,
+    "target_table_name": "my_table",
+    consts.CONFIG_GROUPED_COLUMNS: [
+        {
+            consts.CONFIG_FIELD_ALIAS: "id",
+            consts.CONFIG_SOURCE_COLUMN: "id",
+            consts.CONFIG_TARGET_COLUMN: "id",
+            consts.CONFIG_CAST: None,
+        },
+    ],
+    consts.CONFIG_GROUP_BUCKETS: 4,
+    consts.CONFIG_AGGREGATES: [
+        {
+            "source_column": None,
+            "target_column": None,
+            "field_alias": "count",
+            "type": "count",
+        },
+        {
+            "source_column": "int_value",
+            "target_column": "int_value",
+            "field_alias": "sum__int_value",
+            "type": "sum",
+        },
+    ],
+    consts.CONFIG_THRESHOLD: 0.0,
+    consts.CONFIG_RESULT_HANDLER: None,
+    consts.CONFIG_FORMAT: "csv",
+    consts.CONFIG_FILTER_STATUS: None,
+}
+
 # Grouped Column Row config
 SAMPLE_MULTI_GC_CONFIG = {
     # BigQuery Specific Connection Config
@@ -698,6 +738,84 @@ def test_grouped_column_level_validation_multiple_aggregations(module_under_test
     assert validation_df["target_agg_value"].astype(float).sum() == 11
 
 
+def test_bucketed_grouped_column_validation_match(module_under_test, fs):
+    json_data = _get_fake_json_data(_generate_fake_data(rows=20, second_range=0))
+    _create_table_file(SOURCE_TABLE_FILE_PATH, json_data)
+    _create_table_file(TARGET_TABLE_FILE_PATH, json_data)
+
+    result_df = module_under_test.DataValidation(SAMPLE_BUCKET_GC_CONFIG).execute()
+    # Only the aggregates of the 4 buckets are compared
+    assert sorted(result_df["group_by_columns"].unique()) == [
+        '{"bucket__id": "%s"}' % _ for _ in range(4)
+    ]
+    assert (result_df["validation_status"] == consts.VALIDATION_STATUS_SUCCESS).all()
+
+
+def test_bucketed_grouped_column_validation_mismatch(module_under_test, fs):
+    data = _generate_fake_data(rows=20, second_range=0)
+    _create_table_file(SOURCE_TABLE_FILE_PATH, _get_fake_json_data(data))
+    data[5]["int_value"] += 1
+    data.append(_generate_fake_data(initial_id=22, rows=1, second_range=0)[0])
+    _create_table_file(TARGET_TABLE_FILE_PATH, _get_fake_json_data(data))
+
+    result_df = module_under_test.DataValidation(SAMPLE_BUCKET_GC_CONFIG).execute()
+    # The matching buckets are reported as a whole and the groups of the others on their own
+    assert sorted(result_df["group_by_columns"].unique()) == sorted(
+        ['{"bucket__id": "0"}', '{"bucket__id": "3"}']
+        + ['{"id": "%s"}' % _ for _ in (1, 5, 9, 13, 17, 2, 6, 10, 14, 18, 22)]
+    )
+    fail_df = result_df[result_df["validation_status"] == consts.VALIDATION_STATUS_FAIL]
+    assert sorted(fail_df["group_by_columns"].unique()) == [
+        '{"id": "22"}',
+        '{"id": "5"}',
+    ]
+
+
+def test_bucketed_grouped_column_validation_moved_row(module_under_test, fs):
+    data = _generate_fake_data(rows=20, second_range=0)
+    _create_table_file(SOURCE_TABLE_FILE_PATH, _get_fake_json_data(data))
+    # Groups 1 and 5 are in the same bucket, which keeps its count and sum
+    data[1]["id"] = 5
+    _create_table_file(TARGET_TABLE_FILE_PATH, _get_fake_json_data(data))
+
+    result_df = module_under_test.DataValidation(SAMPLE_BUCKET_GC_CONFIG).execute()
+    # The fingerprint is not reported
+    assert "bucket__id__fingerprint" not in set(result_df["validation_name"])
+    fail_df = result_df[result_df["validation_status"] == consts.VALIDATION_STATUS_FAIL]
+    assert sorted(fail_df["group_by_columns"].unique()) == [
+        '{"id": "1"}',
+        '{"id": "5"}',
+    ]
+
+
+def test_bucketed_grouped_column_validation_second_group_mismatch(
+    module_under_test, fs
+):
+    data = _generate_fake_data(rows=20, second_range=0)
+    data[6]["text_value"] = "a"
+    _create_table_file(SOURCE_TABLE_FILE_PATH, _get_fake_json_data(data))
+    # Only the second grouped column differs, the first one assigns the buckets
+    data[6]["text_value"] = "b"
+    _create_table_file(TARGET_TABLE_FILE_PATH, _get_fake_json_data(data))
+
+    config = copy.deepcopy(SAMPLE_BUCKET_GC_CONFIG)
+    config[consts.CONFIG_GROUPED_COLUMNS].append(
+        {
+            consts.CONFIG_FIELD_ALIAS: "text_value",
+            consts.CONFIG_SOURCE_COLUMN: "text_value",
+            consts.CONFIG_TARGET_COLUMN: "text_value",
+            consts.CONFIG_CAST: None,
+        }
+    )
+    result_df = module_under_test.DataValidation(config).execute()
+    fail_df = result_df[result_df["validation_status"] == consts.VALIDATION_STATUS_FAIL]
+    fail_groups = [json.loads(_) for _ in fail_df["group_by_columns"].unique()]
+    assert sorted(fail_groups, key=lambda _: _["text_value"]) == [
+        {"id": "6", "text_value": "a"},
+        {"id": "6", "text_value": "b"},
+    ]
+
+
 def test_row_level_validation(module_under_test, fs):
     data = _generate_fake_data(rows=100, second_range=0)
 
@@ -864,3 +982,48 @@ def test_console_data_shown_for_matching_validation_with_result_written_to_bq_in
     assert len(caplog.records) == 2
     assert caplog.records[0].message == "No results to write to BigQuery"
     assert caplog.records[1].message.startswith("Empty DataFrame")
+
+
+@pytest.mark.parametrize(
+    "join_on_fields,expected",
+    [
+        (set(), pandas.DataFrame({"sum_a": [1], "sum_b": [2], "sum_c": [3]})),
+        (
+            {"group"},
+            pandas.DataFrame({"group": ["x", "y"], "sum_a": [1, 2], "sum_b": [3, 4]}),
+        ),
+    ],
+)
+def test_execute_queries(module_under_test, join_on_fields, expected):
+    """Sub-queries of a wide validation run concurrently and are stitched by group"""
+    client = mock.Mock()
+    if join_on_fields:
+        client.execute.side_effect = [
+            pandas.DataFrame({"group": ["x", "y"], "sum_a": [1, 2]}),
+            pandas.DataFrame({"group": ["y", "x"], "sum_b": [4, 3]}),
+        ]
+    else:
+        client.execute.side_effect = [
+            pandas.DataFrame({"sum_a": [1], "sum_b": [2]}),
+            pandas.DataFrame({"sum_c": [3]}),
+        ]
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        result_df = module_under_test.DataValidation._execute_queries(
+            client, ["query_1", "query_2"], join_on_fields, executor=executor
+        )
+    pandas.testing.assert_frame_equal(
+        result_df.sort_index(axis=1), expected.sort_index(axis=1)
+    )
+
+
+def test_get_query_executor(module_under_test, fs):
+    """Split queries of each side share one pool bounded by max_query_workers"""
+    _create_table_file(SOURCE_TABLE_FILE_PATH, JSON_DATA)
+    _create_table_file(TARGET_TABLE_FILE_PATH, JSON_DATA)
+    config = copy.deepcopy(SAMPLE_CONFIG)
+    config[consts.CONFIG_MAX_QUERY_WORKERS] = 3
+    with module_under_test.DataValidation(config) as client:
+        executor = client._get_query_executor(consts.RESULT_TYPE_SOURCE)
+        assert executor._max_workers == 3
+        assert client._get_query_executor(consts.RESULT_TYPE_SOURCE) is executor
+        assert client._get_query_executor(consts.RESULT_TYPE_TARGET) is not executor
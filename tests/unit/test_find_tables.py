@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import pytest
+import random
 from unittest import mock
 
 from data_validation import consts
@@ -65,6 +66,24 @@ def test__compare_match_tables(module_under_test):
     assert table_configs == RESULT_TABLE_CONFIGS
 
 
+@pytest.mark.parametrize("score_cutoff", (0, 0.5, 0.8, 1))
+def test_closest_match_index(score_cutoff):
+    """Test the index returns the same matches as comparing every target."""
+    from data_validation import jellyfish_distance
+
+    random.seed(score_cutoff)
+    target_list = [
+        "".join(random.choices("abcAB_", k=random.randint(0, 8))) for _ in range(200)
+    ]
+    index = jellyfish_distance.ClosestMatchIndex(target_list)
+    for search_key in target_list[:20] + ["", "zzz", "ab_", "ba_", "BA"]:
+        assert index.extract_closest_match(
+            search_key, score_cutoff=score_cutoff
+        ) == jellyfish_distance.extract_closest_match(
+            search_key, target_list, score_cutoff=score_cutoff
+        )
+
+
 @pytest.mark.parametrize(
     ("tables_list,expected_result"),
     (
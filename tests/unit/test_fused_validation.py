@@ -0,0 +1,174 @@
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import copy
+
+import pytest
+
+from data_validation import consts
+from data_validation.config_manager import ConfigManager
+
+SOURCE_TABLE_FILE_PATH = "source_table_data.json"
+TARGET_TABLE_FILE_PATH = "target_table_data.json"
+JSON_DATA = (
+    """[{"col_a":1,"col_b":"a"},{"col_a":2,"col_b":"b"},{"col_a":4,"col_b":"b"}]"""
+)
+JSON_TARGET_DATA = (
+    """[{"col_a":1,"col_b":"a"},{"col_a":2,"col_b":"b"},{"col_a":5,"col_b":"b"}]"""
+)
+
+SOURCE_CONN_CONFIG = {
+    "source_type": "FileSystem",
+    "table_name": "my_table",
+    "file_path": SOURCE_TABLE_FILE_PATH,
+    "file_type": "json",
+}
+
+TARGET_CONN_CONFIG = {
+    "source_type": "FileSystem",
+    "table_name": "my_table",
+    "file_path": TARGET_TABLE_FILE_PATH,
+    "file_type": "json",
+}
+
+COLUMN_CONFIG = {
+    "source_conn": SOURCE_CONN_CONFIG,
+    "target_conn": TARGET_CONN_CONFIG,
+    consts.CONFIG_TYPE: "Column",
+    "schema_name": None,
+    "table_name": "my_table",
+    "target_schema_name": None,
+    "target_table_name": "my_table",
+    consts.CONFIG_GROUPED_COLUMNS: [],
+    consts.CONFIG_AGGREGATES: [
+        {
+            "source_column": None,
+            "target_column": None,
+            "field_alias": "count",
+            "type": "count",
+        },
+        {
+            "source_column": "col_a",
+            "target_column": "col_a",
+            "field_alias": "sum__col_a",
+            "type": "sum",
+        },
+    ],
+    consts.CONFIG_THRESHOLD: 0.0,
+    consts.CONFIG_RESULT_HANDLER: None,
+    consts.CONFIG_FORMAT: "table",
+    consts.CONFIG_FILTER_STATUS: None,
+}
+
+FILTERED_COLUMN_CONFIG = copy.deepcopy(COLUMN_CONFIG)
+FILTERED_COLUMN_CONFIG[consts.CONFIG_FILTERS] = [
+    {
+        consts.CONFIG_TYPE: consts.FILTER_TYPE_EQUALS,
+        consts.CONFIG_FILTER_SOURCE_COLUMN: "col_b",
+        consts.CONFIG_FILTER_SOURCE_VALUE: "a",
+        consts.CONFIG_FILTER_TARGET_COLUMN: "col_b",
+        consts.CONFIG_FILTER_TARGET_VALUE: "a",
+    }
+]
+
+ROW_CONFIG = copy.deepcopy(COLUMN_CONFIG)
+ROW_CONFIG[consts.CONFIG_TYPE] = consts.ROW_VALIDATION
+
+
+@pytest.fixture
+def ibis_pandas():
+    import ibis
+
+    return ibis.pandas.connect()
+
+
+@pytest.fixture
+def module_under_test(ibis_pandas):
+    import data_validation.fused_validation
+
+    return data_validation.fused_validation
+
+
+def _create_table_file(table_path, data):
+    """Create JSON File"""
+    with open(table_path, "w") as f:
+        f.write(data)
+
+
+def _get_config_managers(*configs):
+    _create_table_file(SOURCE_TABLE_FILE_PATH, JSON_DATA)
+    _create_table_file(TARGET_TABLE_FILE_PATH, JSON_TARGET_DATA)
+    config_managers = [ConfigManager(copy.deepcopy(configs[0]))]
+    for config in configs[1:]:
+        config_managers.append(
+            ConfigManager(
+                copy.deepcopy(config),
+                source_client=config_managers[0].source_client,
+                target_client=config_managers[0].target_client,
+            )
+        )
+    return config_managers
+
+
+def test_plan_validations(module_under_test, fs):
+    config_managers = _get_config_managers(
+        COLUMN_CONFIG, ROW_CONFIG, FILTERED_COLUMN_CONFIG
+    )
+    groups = module_under_test.plan_validations(config_managers)
+    assert groups == [
+        [config_managers[0], config_managers[2]],
+        [config_managers[1]],
+    ]
+
+
+def test_plan_validations_max_aggregates(module_under_test, fs):
+    """Validations are not fused beyond the maximum number of aggregates per query"""
+    config = copy.deepcopy(COLUMN_CONFIG)
+    config[consts.CONFIG_MAX_AGGREGATES] = 4
+    config_managers = _get_config_managers(config, config, FILTERED_COLUMN_CONFIG)
+    groups = module_under_test.plan_validations(config_managers)
+    assert groups == [config_managers[:2], config_managers[2:]]
+
+
+def test_plan_validations_source_cache(module_under_test, fs):
+    """Validations caching their source results are not fused"""
+    config = copy.deepcopy(COLUMN_CONFIG)
+    config[consts.CONFIG_SOURCE_CACHE_TTL] = 3600
+    config_managers = _get_config_managers(config, FILTERED_COLUMN_CONFIG)
+    groups = module_under_test.plan_validations(config_managers)
+    assert groups == [config_managers[:1], config_managers[1:]]
+
+
+def test_get_reports(module_under_test, fs):
+    """Fused validations report the same values as the validations run one by one"""
+    config_managers = _get_config_managers(COLUMN_CONFIG, FILTERED_COLUMN_CONFIG)
+    reports = module_under_test.FusedValidation(config_managers).get_reports()
+
+    assert len(reports) == 2
+    unfiltered = reports[0].set_index("validation_name")
+    assert unfiltered.loc["count", "source_agg_value"] == "3"
+    assert unfiltered.loc["sum__col_a", "source_agg_value"] == "7"
+    assert unfiltered.loc["sum__col_a", "target_agg_value"] == "8"
+    assert (
+        unfiltered.loc["sum__col_a", "validation_status"]
+        == consts.VALIDATION_STATUS_FAIL
+    )
+
+    filtered = reports[1].set_index("validation_name")
+    assert filtered.loc["count", "source_agg_value"] == "1"
+    assert filtered.loc["sum__col_a", "source_agg_value"] == "1"
+    assert (
+        filtered.loc["sum__col_a", "validation_status"]
+        == consts.VALIDATION_STATUS_SUCCESS
+    )
@@ -0,0 +1,173 @@
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+from unittest import mock
+
+import ibis
+import ibis.expr.datatypes as dt
+import pandas
+import pytest
+
+from data_validation import consts
+
+CONNECTION = {"source_type": "Postgres", "host": "localhost", "password": "secret"}
+SCHEMA = ibis.schema(
+    {
+        "id": dt.Int64(nullable=False),
+        "amount": dt.Decimal(10, 2),
+        "updated": dt.Timestamp(timezone="UTC"),
+        "tags": dt.Array(dt.string),
+    }
+)
+
+
+@pytest.fixture
+def module_under_test():
+    import data_validation.metadata_cache
+
+    return data_validation.metadata_cache
+
+
+def _age(directory, seconds):
+    for file_name in os.listdir(directory):
+        path = os.path.join(directory, file_name)
+        mtime = os.path.getmtime(path) - seconds
+        os.utime(path, (mtime, mtime))
+
+
+def test_get_connection_key(module_under_test):
+    key = module_under_test.get_connection_key(CONNECTION)
+    assert key == module_under_test.get_connection_key(
+        dict(CONNECTION, password="rotated")
+    )
+    assert key != module_under_test.get_connection_key(dict(CONNECTION, host="replica"))
+
+
+def test_schema_json(module_under_test):
+    assert (
+        module_under_test.schema_from_json(module_under_test.schema_to_json(SCHEMA))
+        == SCHEMA
+    )
+
+
+def test_get_or_load_memoized(module_under_test):
+    cache = module_under_test.MetadataCache()
+    load = mock.Mock(return_value=["table_1", "table_2"])
+    assert cache.get_or_load("tables", ("my_schema",), load) == ["table_1", "table_2"]
+    assert cache.get_or_load("tables", ("my_schema",), load) == ["table_1", "table_2"]
+    load.assert_called_once()
+
+
+def test_get_or_load_stored(module_under_test, tmp_path):
+    def get_schema(cache, load):
+        return cache.get_or_load(
+            "schema",
+            ("my_schema", "my_table"),
+            load,
+            dump=module_under_test.schema_to_json,
+            restore=module_under_test.schema_from_json,
+        )
+
+    load = mock.Mock(return_value=SCHEMA)
+    get_schema(module_under_test.MetadataCache(str(tmp_path), ttl=60), load)
+    # A later run reads the stored schema
+    assert get_schema(module_under_test.MetadataCache(str(tmp_path), ttl=60), load)
+    load.assert_called_once()
+
+    # Expired entries are loaded again
+    _age(str(tmp_path), 120)
+    assert get_schema(module_under_test.MetadataCache(str(tmp_path), ttl=60), load)
+    assert load.call_count == 2
+
+    # In process entries are not stored
+    module_under_test.MetadataCache(str(tmp_path), ttl=60).get_or_load(
+        "table", ("my_table",), mock.Mock(), persist=False
+    )
+    assert len(os.listdir(str(tmp_path))) == 1
+
+
+def test_get_metadata_cache(module_under_test, tmp_path, monkeypatch):
+    monkeypatch.setenv(consts.ENV_DIRECTORY_VAR, str(tmp_path))
+    assert module_under_test.get_metadata_cache(CONNECTION).directory is None
+
+    monkeypatch.setenv(consts.ENV_METADATA_CACHE_TTL_VAR, "3600")
+    cache = module_under_test.get_metadata_cache(CONNECTION)
+    assert cache.ttl == 3600
+    assert cache.directory == os.path.join(
+        str(tmp_path),
+        consts.METADATA_CACHE_DIRECTORY,
+        module_under_test.get_connection_key(CONNECTION),
+    )
+    file_system_connection = {"source_type": "FileSystem", "file_path": "data.csv"}
+    assert (
+        module_under_test.get_metadata_cache(file_system_connection).directory is None
+    )
+
+
+def test_get_metadata_cache_shared(module_under_test, tmp_path, monkeypatch):
+    """The clients of a connection share one in process cache, even without a TTL"""
+    monkeypatch.setenv(consts.ENV_DIRECTORY_VAR, str(tmp_path))
+    cache = module_under_test.get_metadata_cache(CONNECTION)
+    assert module_under_test.get_metadata_cache(dict(CONNECTION)) is cache
+    assert (
+        module_under_test.get_metadata_cache(dict(CONNECTION, host="replica"))
+        is not cache
+    )
+    file_system_connection = {"source_type": "FileSystem", "file_path": "data.csv"}
+    assert module_under_test.get_metadata_cache(
+        file_system_connection
+    ) is not module_under_test.get_metadata_cache(file_system_connection)
+
+    module_under_test.clear_metadata_cache(str(tmp_path), CONNECTION)
+    assert module_under_test.get_metadata_cache(CONNECTION) is not cache
+
+
+def test_clear_metadata_cache(module_under_test, tmp_path):
+    other_connection = dict(CONNECTION, host="replica")
+    for connection in (CONNECTION, other_connection):
+        cache = module_under_test.MetadataCache(
+            str(tmp_path / module_under_test.get_connection_key(connection)), ttl=60
+        )
+        cache.get_or_load("schemas", (), lambda: ["my_schema"])
+
+    module_under_test.clear_metadata_cache(str(tmp_path), CONNECTION)
+    assert os.listdir(str(tmp_path)) == [
+        module_under_test.get_connection_key(other_connection)
+    ]
+    module_under_test.clear_metadata_cache(str(tmp_path))
+    assert not os.path.exists(str(tmp_path))
+
+
+def test_get_data_client_memoized(module_under_test, tmp_path):
+    from data_validation import clients
+
+    file_path = str(tmp_path / "my_table.csv")
+    pandas.DataFrame({"id": [1, 2]}).to_csv(file_path, index=False)
+    client = clients.get_data_client(
+        {
+            "source_type": "FileSystem",
+            "table_name": "my_table",
+            "file_path": file_path,
+            "file_type": "csv",
+        }
+    )
+    with mock.patch.object(
+        clients, "_get_ibis_table_schema", wraps=clients._get_ibis_table_schema
+    ) as get_schema:
+        for _ in range(2):
+            assert clients.get_ibis_table_schema(client, None, "my_table").names == (
+                "id",
+            )
+        get_schema.assert_called_once()
@@ -18,7 +18,10 @@ import pytest
 import json
 import random
 import math
+import ibis
+import numpy
 from datetime import datetime, timedelta
+from unittest import mock
 
 from data_validation import cli_tools
 from data_validation import consts
@@ -711,3 +714,199 @@ def test_create_partition_query_yaml(module_under_test):
     assert len(yaml_configs_list[0]["yaml_files"][0]["yaml_config"]["validations"]) == 5
     # 4 validations in the second file
     assert len(yaml_configs_list[0]["yaml_files"][1]["yaml_config"]["validations"]) == 4
+
+
+def test_store_partition_manifests(module_under_test, tmp_path):
+    """Store a single partition manifest for a table and check each task matches the YAML file it replaces"""
+    from data_validation.partition_manifest import PartitionManifest
+
+    folder_path = tmp_path / PARTITIONS_DIR
+    folder_path.mkdir()
+    args = TABLE_PART_ARGS + ["--partition-manifest"]
+    args[args.index("-cdir") + 1] = str(folder_path)
+
+    config_manager = _generate_config_manager("test_table")
+    parser = cli_tools.configure_arg_parser()
+    mock_args = parser.parse_args(args)
+
+    partition_filters = PARTITION_FILTERS_LIST
+    master_filter_list = [[partition_filters, partition_filters]]
+
+    builder = module_under_test.PartitionBuilder([config_manager], mock_args)
+    builder._store_partition_manifests(master_filter_list)
+
+    assert os.listdir(folder_path / "test_table") == [consts.PARTITION_MANIFEST_FILE]
+    manifest = PartitionManifest.read(
+        str(folder_path / "test_table" / consts.PARTITION_MANIFEST_FILE)
+    )
+    assert len(manifest) == math.ceil(PARTITION_NUM / PARTS_PER_FILE)
+    for ind, yaml_file in enumerate(YAML_CONFIGS_LIST[0]["yaml_files"]):
+        assert manifest.get_yaml_config(ind) == yaml_file["yaml_config"]
+
+
+@pytest.mark.parametrize(
+    "size_args,expected_partition_num",
+    [
+        (["--partition-num", "7"], 7),
+        (["--rows-per-partition", "300"], 4),
+        # 1 MB per partition at 2 x 512 bytes per row (source and target) is 1024 rows
+        (["--max-partition-mb", "1"], 1),
+        (["--max-partition-mb", "1", "--rows-per-partition", "300"], None),
+    ],
+)
+def test_get_partition_num(module_under_test, size_args, expected_partition_num):
+    """Derive the number of partitions from the requested partition size"""
+    args = TABLE_PART_ARGS.copy()
+    pn_index = args.index("--partition-num")
+    args = args[:pn_index] + args[pn_index + 2 :] + size_args
+    parser = cli_tools.configure_arg_parser()
+    if expected_partition_num is None:
+        # Only one way of sizing partitions is allowed
+        with pytest.raises(SystemExit):
+            parser.parse_args(args)
+        return
+
+    mock_args = parser.parse_args(args)
+    builder = module_under_test.PartitionBuilder(
+        [_generate_config_manager("test_table")], mock_args
+    )
+    with mock.patch.object(
+        module_under_test.PartitionBuilder, "get_source_row_bytes", return_value=512
+    ):
+        assert (
+            builder._get_partition_num(builder.config_managers[0], 1000)
+            == expected_partition_num
+        )
+
+
+def test_extract_partition_filter_bind_parameters(module_under_test):
+    """Partitions of the same shape share the same SQL text when using bind parameters"""
+    from ibis.backends.postgres import Backend as PostgresBackend
+
+    client = PostgresBackend()
+    table = ibis.table([("id", "int64"), ("name", "string")], name="my_table")
+    filters = [
+        module_under_test.PartitionBuilder._extract_partition_filter(
+            table.filter((table.id >= numpy.int64(start)) & (table.id < start + 10)),
+            client,
+            use_bind_parameters=True,
+        )
+        for start in (0, 10)
+    ]
+    assert filters[0] == (
+        " id >= :dvt_p0 AND id < :dvt_p1",
+        {"dvt_p0": 0, "dvt_p1": 10},
+    )
+    assert filters[1] == (
+        " id >= :dvt_p0 AND id < :dvt_p1",
+        {"dvt_p0": 10, "dvt_p1": 20},
+    )
+    assert type(filters[0][1]["dvt_p0"]) is int
+
+    # Filters of backends not using SQLAlchemy keep literal values
+    bq_client = mock.Mock()
+    bq_client.name = "bigquery"
+    with mock.patch.object(
+        module_under_test.PartitionBuilder, "_extract_where", return_value=" id >= 5"
+    ) as mock_extract_where:
+        assert (
+            module_under_test.PartitionBuilder._extract_partition_filter(
+                table.filter(table.id >= 5), bq_client, use_bind_parameters=True
+            )
+            == " id >= 5"
+        )
+        assert mock_extract_where.call_count == 1
+
+
+def _get_sqlite_config_manager(tmp_path, rows):
+    """Returns a ConfigManager of a row validation of a SQLite table with ids 0 to rows - 1"""
+    import sqlite3
+
+    db_path = str(tmp_path / "my_db.sqlite")
+    with sqlite3.connect(db_path) as con:
+        con.execute(
+            "CREATE TABLE my_table (id INTEGER, int_value INTEGER, text_value TEXT)"
+        )
+        con.executemany(
+            "INSERT INTO my_table VALUES (?, ?, ?)",
+            [(i, i % 7, random.choice(RANDOM_STRINGS)) for i in range(rows)],
+        )
+    client = ibis.sqlite.connect(db_path)
+    client._source_type = "Sqlite"
+    config = _generate_config_manager().config
+    return ConfigManager(config, source_client=client, target_client=client)
+
+
+def test_get_table_partition_filters_exact_count(module_under_test, tmp_path):
+    """Partition boundaries are placed with the exact row count, not stale statistics"""
+    config_manager = _get_sqlite_config_manager(tmp_path, 10)
+    with mock.patch(
+        "data_validation.clients.get_table_row_count_estimate", return_value=1000
+    ):
+        (
+            source_filters,
+            target_filters,
+        ) = module_under_test.PartitionBuilder.get_table_partition_filters(
+            config_manager, 3, use_row_count_estimate=True
+        )
+    assert source_filters == [" id < 3", " id >= 3 AND id < 6", " id >= 6"]
+    assert target_filters == source_filters
+
+
+@pytest.mark.parametrize("partition_num", [1, 20])
+def test_get_table_partition_filters_single_partition(
+    module_under_test, tmp_path, partition_num
+):
+    """A table smaller than a partition is validated as a single partition"""
+    config_manager = _get_sqlite_config_manager(tmp_path, 1)
+    assert module_under_test.PartitionBuilder.get_table_partition_filters(
+        config_manager, partition_num
+    ) == [[consts.PARTITION_ALL_ROWS_FILTER], [consts.PARTITION_ALL_ROWS_FILTER]]
+
+
+def test_get_partition_key_filters_sized(module_under_test, tmp_path):
+    """Partitions sized from the row count reuse the count to place their boundaries"""
+    from data_validation.query_builder.partition_row_builder import (
+        PartitionRowBuilder,
+    )
+
+    args = TABLE_PART_ARGS.copy()
+    pn_index = args.index("--partition-num")
+    args = args[:pn_index] + args[pn_index + 2 :] + ["--rows-per-partition", "4"]
+    mock_args = cli_tools.configure_arg_parser().parse_args(args)
+    builder = module_under_test.PartitionBuilder(
+        [_get_sqlite_config_manager(tmp_path, 10)], mock_args
+    )
+    with mock.patch.object(
+        PartitionRowBuilder, "get_count", autospec=True, return_value=10
+    ) as get_count:
+        source_filters, target_filters = builder._get_partition_key_filters()[0]
+    # One source count for sizing and one target count
+    assert get_count.call_count == 2
+    assert source_filters == [" id < 3", " id >= 3 AND id < 6", " id >= 6"]
+
+
+def test_get_partition_key_filters_estimate_fallback(module_under_test, tmp_path):
+    """An exact count from the --row-count-estimate fallback also places the boundaries"""
+    from data_validation.query_builder.partition_row_builder import (
+        PartitionRowBuilder,
+    )
+
+    args = TABLE_PART_ARGS.copy()
+    pn_index = args.index("--partition-num")
+    args = args[:pn_index] + args[pn_index + 2 :]
+    args += ["--rows-per-partition", "4", "--row-count-estimate"]
+    mock_args = cli_tools.configure_arg_parser().parse_args(args)
+    builder = module_under_test.PartitionBuilder(
+        [_get_sqlite_config_manager(tmp_path, 10)], mock_args
+    )
+    with mock.patch.object(
+        PartitionRowBuilder,
+        "get_count",
+        autospec=True,
+        side_effect=PartitionRowBuilder.get_count,
+    ) as get_count:
+        source_filters, target_filters = builder._get_partition_key_filters()[0]
+    # SQLite has no row count statistics, the source is counted once and the target once
+    assert get_count.call_count == 2
+    assert source_filters == [" id < 3", " id >= 3 AND id < 6", " id >= 6"]
@@ -0,0 +1,113 @@
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+from data_validation import consts
+
+YAML_CONFIG = {
+    consts.YAML_SOURCE: "my_source",
+    consts.YAML_TARGET: "my_target",
+    consts.YAML_RESULT_HANDLER: None,
+    consts.YAML_VALIDATIONS: [
+        {
+            consts.CONFIG_TYPE: "Row",
+            consts.CONFIG_TABLE_NAME: "my_table",
+            consts.CONFIG_FILTERS: [
+                {
+                    consts.CONFIG_TYPE: consts.FILTER_TYPE_CUSTOM,
+                    consts.CONFIG_FILTER_SOURCE: "status = 'A'",
+                    consts.CONFIG_FILTER_TARGET: "status = 'A'",
+                }
+            ],
+        }
+    ],
+}
+
+PARTITIONS = [
+    ["id < 10", "id < 10"],
+    ["id >= 10 AND id < 20", "id >= 10 AND id < 20"],
+    ["id >= 20", "id >= 20"],
+]
+
+
+@pytest.fixture
+def module_under_test():
+    from data_validation import partition_manifest
+
+    return partition_manifest
+
+
+def test_get_yaml_config(module_under_test):
+    manifest = module_under_test.PartitionManifest.build(YAML_CONFIG, PARTITIONS, 2)
+
+    assert len(manifest) == 2
+    first = manifest.get_yaml_config(0)
+    assert first[consts.YAML_SOURCE] == "my_source"
+    assert len(first[consts.YAML_VALIDATIONS]) == 2
+    filters = first[consts.YAML_VALIDATIONS][1][consts.CONFIG_FILTERS]
+    # The filters of the base validation are kept and the partition filter appended
+    assert len(filters) == 2
+    assert filters[1][consts.CONFIG_FILTER_SOURCE] == "id >= 10 AND id < 20"
+    # The base validation is not modified
+    assert len(YAML_CONFIG[consts.YAML_VALIDATIONS][0][consts.CONFIG_FILTERS]) == 1
+
+    last = manifest.get_yaml_config(1)
+    assert len(last[consts.YAML_VALIDATIONS]) == 1
+    assert [_ for _ in manifest.iter_yaml_configs()] == [first, last]
+
+    with pytest.raises(ValueError):
+        manifest.get_yaml_config(2)
+
+
+def test_store_read_manifest(module_under_test, tmp_path):
+    manifest = module_under_test.PartitionManifest.build(YAML_CONFIG, PARTITIONS, 1)
+    manifest_path = str(tmp_path / consts.PARTITION_MANIFEST_FILE)
+    manifest.store(manifest_path)
+
+    assert module_under_test.is_manifest_file(manifest_path)
+    assert not module_under_test.is_manifest_file(str(tmp_path / "0000.yaml"))
+    read_manifest = module_under_test.PartitionManifest.read(manifest_path)
+    assert len(read_manifest) == 3
+    assert read_manifest.partitions == PARTITIONS
+    assert read_manifest.get_yaml_config(2) == manifest.get_yaml_config(2)
+
+
+def test_store_read_bind_parameters(module_under_test, tmp_path):
+    import datetime
+    import decimal
+
+    params = {
+        "dvt_p0": datetime.date(2024, 1, 31),
+        "dvt_p1": datetime.datetime(2024, 1, 31, 12, 30, 15, 250),
+        "dvt_p2": decimal.Decimal("10.50"),
+        "dvt_p3": 7,
+    }
+    where = "order_date >= :dvt_p0 AND updated < :dvt_p1 AND amount < :dvt_p2"
+    manifest = module_under_test.PartitionManifest.build(
+        YAML_CONFIG, [[(where, params), (where, params)]], 1
+    )
+    manifest_path = str(tmp_path / consts.PARTITION_MANIFEST_FILE)
+    manifest.store(manifest_path)
+
+    partition_filter = module_under_test.PartitionManifest.read(
+        manifest_path
+    ).get_validation(0)[consts.CONFIG_FILTERS][1]
+    assert partition_filter[consts.CONFIG_FILTER_SOURCE] == where
+    stored_params = partition_filter[consts.CONFIG_FILTER_SOURCE_PARAMETERS]
+    assert stored_params["dvt_p0"] == {"type": "date", "value": "2024-01-31"}
+    # The values are bound with their original type
+    loaded_params = module_under_test.load_bind_parameters(stored_params)
+    assert loaded_params == params
+    assert type(loaded_params["dvt_p0"]) is datetime.date
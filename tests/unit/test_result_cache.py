@@ -0,0 +1,92 @@
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+
+import pandas
+import pytest
+
+CONNECTION = {"source_type": "Postgres", "host": "localhost", "password": "secret"}
+DATA = pandas.DataFrame({"id": [1, 2, 3], "col_a": ["a", "b", None]})
+
+
+@pytest.fixture
+def module_under_test():
+    import data_validation.result_cache
+
+    return data_validation.result_cache
+
+
+def _age(path, seconds):
+    mtime = os.path.getmtime(path) - seconds
+    os.utime(path, (mtime, mtime))
+
+
+def test_get_query_text_literals(module_under_test):
+    """SQL literals are bound, so that queries with different filters have different keys"""
+    import ibis
+
+    client = ibis.sqlite.connect(":memory:")
+    table = ibis.table([("id", "int64")], name="my_table")
+    texts = [
+        module_under_test.get_query_text(client, table.filter(table.id > value).count())
+        for value in (1, 2)
+    ]
+    assert "my_table" in texts[0]
+    assert texts[0] != texts[1]
+
+
+def test_get_query_text_pandas(module_under_test):
+    import ibis
+
+    client = ibis.pandas.connect({"my_table": DATA})
+    assert module_under_test.get_query_text(client, client.table("my_table")) is None
+
+
+def test_get_key(module_under_test):
+    key = module_under_test.get_key(CONNECTION, ["SELECT 1"])
+    assert key == module_under_test.get_key(
+        dict(CONNECTION, password="rotated"), ["SELECT 1"]
+    )
+    assert key != module_under_test.get_key(CONNECTION, ["SELECT 2"])
+    assert key != module_under_test.get_key(
+        dict(CONNECTION, host="replica"), ["SELECT 1"]
+    )
+    assert key != module_under_test.get_key(CONNECTION, ["SELECT 1"], "2024-01-01")
+
+
+def test_put_get(module_under_test, tmp_path):
+    cache = module_under_test.ResultCache(str(tmp_path), ttl=60)
+    assert cache.get("key") is None
+    cache.put("key", DATA)
+    pandas.testing.assert_frame_equal(cache.get("key"), DATA)
+
+
+def test_get_expired(module_under_test, tmp_path):
+    cache = module_under_test.ResultCache(str(tmp_path), ttl=60)
+    cache.put("key", DATA)
+    _age(cache._get_path("key"), 120)
+    assert cache.get("key") is None
+    assert not os.path.exists(cache._get_path("key"))
+
+
+def test_evict_oldest(module_under_test, tmp_path):
+    cache = module_under_test.ResultCache(str(tmp_path), ttl=600)
+    cache.put("old", DATA)
+    _age(cache._get_path("old"), 60)
+    cache.put("new", DATA)
+    cache.max_bytes = os.path.getsize(cache._get_path("new"))
+    cache.evict()
+    assert cache.get("old") is None
+    assert cache.get("new") is not None
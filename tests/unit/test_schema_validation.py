@@ -17,7 +17,7 @@ import pytest
 import random
 from datetime import datetime, timedelta
 
-from data_validation import consts, data_validation
+from data_validation import consts, data_validation, exceptions
 from data_validation.schema_validation import (
     expand_precision_range,
     expand_precision_or_scale_range,
@@ -511,3 +511,86 @@ def test_execute(module_under_test, ibis_pandas, fs):
     assert result_df.labels[0] == SAMPLE_SCHEMA_CONFIG[consts.CONFIG_LABELS]
     assert failures["source_column_name"].to_list() == ["id", "N/A"]
     assert failures["target_column_name"].to_list() == ["N/A", "id_new"]
+
+
+def test_prefetch_table_schemas(module_under_test):
+    from unittest import mock
+
+    source_client, target_client = mock.MagicMock(), mock.MagicMock()
+    config_managers = []
+    for table_name, validation_type in (
+        ("table_1", consts.SCHEMA_VALIDATION),
+        ("table_2", consts.SCHEMA_VALIDATION),
+        ("table_3", consts.COLUMN_VALIDATION),
+    ):
+        config_manager = mock.MagicMock(
+            validation_type=validation_type,
+            source_client=source_client,
+            source_schema="source_schema",
+            source_table=table_name,
+            target_client=target_client,
+            target_schema="target_schema",
+            target_table=table_name,
+        )
+        config_managers.append(config_manager)
+
+    with mock.patch.object(
+        module_under_test.clients, "prefetch_table_schemas", return_value=2
+    ) as prefetch:
+        module_under_test.prefetch_table_schemas(config_managers)
+        assert prefetch.call_args_list == [
+            mock.call(source_client, "source_schema"),
+            mock.call(target_client, "target_schema"),
+        ]
+
+        # A single table is reflected directly
+        prefetch.reset_mock()
+        module_under_test.prefetch_table_schemas(config_managers[:1])
+        prefetch.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "allow_list,source_type,target_type,expected",
+    [
+        ("int32:int64", "int32", "int64", True),
+        ("int32:int64", "int64", "int32", False),
+        ("!int64:int32", "!int64", "int32", True),
+        ("date:timestamp('UTC')", "date", "timestamp('UTC')", True),
+        ("decimal(38,0):int64", "decimal(38,0)", "int64", True),
+        ("decimal(38,0):int64", "decimal(38,1)", "int64", False),
+        ("decimal(1-9,0):int32", "decimal(5,0)", "int32", True),
+        ("decimal(1-9,0):int32", "decimal(10,0)", "int32", False),
+        ("decimal(1-9):int32", "decimal(5)", "int32", True),
+        ("decimal(1-9):int32", "decimal(5,0)", "int32", False),
+        ("decimal(10,0-2):decimal(10,2)", "decimal(10,1)", "decimal(10,2)", True),
+        (
+            "decimal(1-38,0-38):decimal(1-38,0-38)",
+            "decimal(38,10)",
+            "decimal(20,38)",
+            True,
+        ),
+        ("decimal(1-38,0-38):decimal(1-38,0-38)", "decimal(38,10)", "int64", False),
+        ("!decimal(1-2,0):int32", "decimal(1,0)", "int32", False),
+        ("int32:int64,decimal(1-9,0):int32", "decimal(9,0)", "int32", True),
+    ],
+)
+def test_allow_list_matcher(allow_list, source_type, target_type, expected):
+    from data_validation.schema_validation import get_allow_list_matcher
+
+    assert (
+        get_allow_list_matcher(allow_list).matches(source_type, target_type) is expected
+    )
+
+
+def test_allow_list_matcher_shared():
+    from data_validation.schema_validation import get_allow_list_matcher
+
+    allow_list = "decimal(1-38,0-38):decimal(1-38,0-38)"
+    assert get_allow_list_matcher(allow_list) is get_allow_list_matcher(allow_list)
+
+
+def test_allow_list_matcher_invalid_range():
+    from data_validation.schema_validation import AllowListMatcher
+
+    with pytest.raises(exceptions.SchemaValidationException):
+        AllowListMatcher("decimal(9-1,0):int32")
@@ -0,0 +1,179 @@
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import copy
+
+import pandas
+import pytest
+
+from data_validation import consts
+from data_validation.config_manager import ConfigManager
+
+SOURCE_DATA = pandas.DataFrame(
+    {"id": [1, 2, 3, 4, 5], "col_a": [1, 2, 4, 8, 16], "col_b": list("aabbb")}
+)
+
+COLUMN_CONFIG = {
+    "source_conn": {"source_type": "Pandas"},
+    "target_conn": {"source_type": "Pandas"},
+    consts.CONFIG_TYPE: consts.COLUMN_VALIDATION,
+    "schema_name": None,
+    "table_name": "my_table",
+    "target_schema_name": None,
+    "target_table_name": "my_table",
+    consts.CONFIG_AGGREGATES: [
+        {
+            "source_column": None,
+            "target_column": None,
+            "field_alias": "count",
+            "type": "count",
+        },
+        {
+            "source_column": "col_a",
+            "target_column": "col_a",
+            "field_alias": "sum__col_a",
+            "type": "sum",
+        },
+        {
+            "source_column": "col_a",
+            "target_column": "col_a",
+            "field_alias": "avg__col_a",
+            "type": "avg",
+        },
+    ],
+    consts.CONFIG_THRESHOLD: 0.0,
+    consts.CONFIG_RESULT_HANDLER: None,
+    consts.CONFIG_FORMAT: "table",
+    consts.CONFIG_FILTER_STATUS: None,
+    consts.CONFIG_SOURCE_SHARDS: ["shard_1", "shard_2"],
+}
+
+GROUPED_COLUMN_CONFIG = copy.deepcopy(COLUMN_CONFIG)
+GROUPED_COLUMN_CONFIG[consts.CONFIG_GROUPED_COLUMNS] = [
+    {
+        consts.CONFIG_SOURCE_COLUMN: "col_b",
+        consts.CONFIG_TARGET_COLUMN: "col_b",
+        consts.CONFIG_FIELD_ALIAS: "col_b",
+        consts.CONFIG_CAST: None,
+    }
+]
+
+ROW_CONFIG = copy.deepcopy(COLUMN_CONFIG)
+ROW_CONFIG[consts.CONFIG_TYPE] = consts.ROW_VALIDATION
+ROW_CONFIG[consts.CONFIG_AGGREGATES] = []
+ROW_CONFIG[consts.CONFIG_PRIMARY_KEYS] = [
+    {
+        consts.CONFIG_SOURCE_COLUMN: "id",
+        consts.CONFIG_TARGET_COLUMN: "id",
+        consts.CONFIG_FIELD_ALIAS: "id",
+        consts.CONFIG_CAST: None,
+    }
+]
+ROW_CONFIG[consts.CONFIG_COMPARISON_FIELDS] = [
+    {
+        consts.CONFIG_SOURCE_COLUMN: "col_a",
+        consts.CONFIG_TARGET_COLUMN: "col_a",
+        consts.CONFIG_FIELD_ALIAS: "col_a",
+        consts.CONFIG_CAST: None,
+    }
+]
+
+
+@pytest.fixture
+def module_under_test():
+    import data_validation.sharded_validation
+
+    return data_validation.sharded_validation
+
+
+def _get_client(data):
+    import ibis
+
+    client = ibis.pandas.connect({"my_table": data})
+    client._source_type = "Pandas"
+    return client
+
+
+def _get_config_manager(config):
+    """Return a ConfigManager with the source rows spread across three shard clients"""
+    shard_clients = [
+        _get_client(SOURCE_DATA.iloc[0:2]),
+        _get_client(SOURCE_DATA.iloc[2:3]),
+        _get_client(SOURCE_DATA.iloc[3:5]),
+    ]
+    config_manager = ConfigManager(
+        copy.deepcopy(config),
+        source_client=shard_clients[0],
+        target_client=_get_client(SOURCE_DATA),
+    )
+    config_manager._source_shard_clients = shard_clients
+    return config_manager
+
+
+def _get_unsharded_df(config_manager, validation_builder):
+    return config_manager.target_client.execute(
+        validation_builder.source_builder.compile(
+            config_manager.validation_type,
+            config_manager.target_client.table("my_table"),
+        )
+    )
+
+
+def test_is_sharded(module_under_test):
+    assert module_under_test.is_sharded(_get_config_manager(COLUMN_CONFIG))
+    config = copy.deepcopy(COLUMN_CONFIG)
+    config.pop(consts.CONFIG_SOURCE_SHARDS)
+    assert not module_under_test.is_sharded(_get_config_manager(config))
+
+
+@pytest.mark.parametrize("config", [COLUMN_CONFIG, GROUPED_COLUMN_CONFIG])
+def test_get_source_df_column(module_under_test, config):
+    from data_validation.validation_builder import ValidationBuilder
+
+    config_manager = _get_config_manager(config)
+    validation_builder = ValidationBuilder(config_manager)
+    source_df = module_under_test.get_source_df(config_manager, validation_builder)
+
+    expected = _get_unsharded_df(config_manager, validation_builder)
+    sort_by = list(expected.columns[:1])
+    pandas.testing.assert_frame_equal(
+        source_df.sort_values(sort_by).reset_index(drop=True),
+        expected.sort_values(sort_by).reset_index(drop=True),
+        check_dtype=False,
+    )
+
+
+def test_get_source_df_row(module_under_test):
+    from data_validation.validation_builder import ValidationBuilder
+
+    config_manager = _get_config_manager(ROW_CONFIG)
+    validation_builder = ValidationBuilder(config_manager)
+    source_df = module_under_test.get_source_df(config_manager, validation_builder)
+
+    pandas.testing.assert_frame_equal(
+        source_df.sort_values("id").reset_index(drop=True),
+        _get_unsharded_df(config_manager, validation_builder),
+    )
+
+
+def test_get_source_df_cast_aggregate(module_under_test):
+    from data_validation.validation_builder import ValidationBuilder
+
+    config = copy.deepcopy(COLUMN_CONFIG)
+    config[consts.CONFIG_AGGREGATES][1][consts.CONFIG_CAST] = "string"
+    config_manager = _get_config_manager(config)
+    with pytest.raises(ValueError):
+        module_under_test.get_source_df(
+            config_manager, ValidationBuilder(config_manager)
+        )
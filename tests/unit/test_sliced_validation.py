@@ -0,0 +1,194 @@
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import copy
+from unittest import mock
+
+import pytest
+
+from data_validation import consts
+from data_validation.config_manager import ConfigManager
+
+SOURCE_TABLE_FILE_PATH = "source_table_data.json"
+TARGET_TABLE_FILE_PATH = "target_table_data.json"
+JSON_DATA = (
+    """[{"col_a":1,"col_b":"a"},{"col_a":2,"col_b":"b"},{"col_a":4,"col_b":"b"}]"""
+)
+JSON_TARGET_DATA = (
+    """[{"col_a":1,"col_b":"a"},{"col_a":2,"col_b":"b"},{"col_a":5,"col_b":"b"}]"""
+)
+
+SOURCE_CONN_CONFIG = {
+    "source_type": "FileSystem",
+    "table_name": "my_table",
+    "file_path": SOURCE_TABLE_FILE_PATH,
+    "file_type": "json",
+}
+
+TARGET_CONN_CONFIG = {
+    "source_type": "FileSystem",
+    "table_name": "my_table",
+    "file_path": TARGET_TABLE_FILE_PATH,
+    "file_type": "json",
+}
+
+COLUMN_CONFIG = {
+    "source_conn": SOURCE_CONN_CONFIG,
+    "target_conn": TARGET_CONN_CONFIG,
+    consts.CONFIG_TYPE: "Column",
+    "schema_name": None,
+    "table_name": "my_table",
+    "target_schema_name": None,
+    "target_table_name": "my_table",
+    consts.CONFIG_GROUPED_COLUMNS: [],
+    consts.CONFIG_AGGREGATES: [
+        {
+            "source_column": None,
+            "target_column": None,
+            "field_alias": "count",
+            "type": "count",
+        },
+        {
+            "source_column": "col_a",
+            "target_column": "col_a",
+            "field_alias": "sum__col_a",
+            "type": "sum",
+        },
+    ],
+    consts.CONFIG_THRESHOLD: 0.0,
+    consts.CONFIG_RESULT_HANDLER: None,
+    consts.CONFIG_FORMAT: "table",
+    consts.CONFIG_FILTER_STATUS: None,
+}
+
+SLICED_COLUMN_CONFIG = copy.deepcopy(COLUMN_CONFIG)
+SLICED_COLUMN_CONFIG[consts.CONFIG_AGGREGATES] += [
+    {
+        "source_column": "col_a",
+        "target_column": "col_a",
+        "field_alias": "avg__col_a",
+        "type": "avg",
+    },
+    {
+        "source_column": "col_a",
+        "target_column": "col_a",
+        "field_alias": "std__col_a",
+        "type": "std",
+    },
+]
+SLICED_COLUMN_CONFIG[consts.CONFIG_SLICES] = 2
+SLICED_COLUMN_CONFIG[consts.CONFIG_SLICE_KEYS] = [
+    {
+        consts.CONFIG_SOURCE_COLUMN: "col_b",
+        consts.CONFIG_TARGET_COLUMN: "col_b",
+        consts.CONFIG_FIELD_ALIAS: "col_b",
+        consts.CONFIG_CAST: None,
+    }
+]
+
+
+@pytest.fixture
+def ibis_pandas():
+    import ibis
+
+    return ibis.pandas.connect()
+
+
+@pytest.fixture
+def module_under_test(ibis_pandas):
+    import data_validation.sliced_validation
+
+    return data_validation.sliced_validation
+
+
+def _get_config_manager(config):
+    for table_path, data in (
+        (SOURCE_TABLE_FILE_PATH, JSON_DATA),
+        (TARGET_TABLE_FILE_PATH, JSON_TARGET_DATA),
+    ):
+        with open(table_path, "w") as f:
+            f.write(data)
+    return ConfigManager(copy.deepcopy(config))
+
+
+def _get_equals_filter(source_value, target_value):
+    """Key range filters are SQL, which the pandas backend cannot run"""
+    return {
+        consts.CONFIG_TYPE: consts.FILTER_TYPE_EQUALS,
+        consts.CONFIG_FILTER_SOURCE_COLUMN: "col_b",
+        consts.CONFIG_FILTER_SOURCE_VALUE: source_value,
+        consts.CONFIG_FILTER_TARGET_COLUMN: "col_b",
+        consts.CONFIG_FILTER_TARGET_VALUE: target_value,
+    }
+
+
+def test_is_sliced(module_under_test, fs):
+    assert module_under_test.is_sliced(_get_config_manager(SLICED_COLUMN_CONFIG))
+    assert not module_under_test.is_sliced(_get_config_manager(COLUMN_CONFIG))
+
+
+def test_get_report(module_under_test, fs):
+    """The report merged from slices matches the report of the single aggregate query"""
+    from data_validation.fused_validation import FusedValidation
+
+    config_manager = _get_config_manager(SLICED_COLUMN_CONFIG)
+    sliced_validation = module_under_test.SlicedValidation(config_manager)
+    assert sliced_validation.is_mergeable()
+    with mock.patch.object(
+        module_under_test.SlicedValidation,
+        "_get_slice_filters",
+        return_value=(["a", "b"], ["a", "b"]),
+    ), mock.patch.object(
+        module_under_test, "get_partition_filter", side_effect=_get_equals_filter
+    ):
+        report = sliced_validation.get_report().set_index("validation_name")
+
+    unsliced_config = copy.deepcopy(SLICED_COLUMN_CONFIG)
+    unsliced_config.pop(consts.CONFIG_SLICES)
+    expected = (
+        FusedValidation([_get_config_manager(unsliced_config)])
+        .get_reports()[0]
+        .set_index("validation_name")
+    )
+
+    columns = ["source_agg_value", "target_agg_value", "validation_status"]
+    for validation_name in ("count", "sum__col_a", "avg__col_a"):
+        assert (
+            report.loc[validation_name, columns].tolist()
+            == expected.loc[validation_name, columns].tolist()
+        )
+    assert float(report.loc["std__col_a", "source_agg_value"]) == pytest.approx(
+        float(expected.loc["std__col_a", "source_agg_value"])
+    )
+
+
+def test_get_report_slice_filters(module_under_test, fs):
+    """Each slice only adds its own filter, the filters of the validation are left as is"""
+    config_manager = _get_config_manager(SLICED_COLUMN_CONFIG)
+    sliced_validation = module_under_test.SlicedValidation(config_manager)
+    with mock.patch.object(
+        module_under_test.SlicedValidation,
+        "_get_slice_filters",
+        return_value=(["a", "b"], ["a", "b"]),
+    ) as mock_slice_filters, mock.patch.object(
+        module_under_test, "get_partition_filter", side_effect=_get_equals_filter
+    ), mock.patch.object(
+        consts, "SLICE_MAX_WORKERS", 1
+    ):
+        report = sliced_validation.get_report().set_index("validation_name")
+
+    mock_slice_filters.assert_called_once()
+    assert sliced_validation.validation_builder.source_builder.filters == []
+    assert sliced_validation.validation_builder.target_builder.filters == []
+    assert report.loc["count", "source_agg_value"] == "3"
@@ -0,0 +1,134 @@
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import copy
+from unittest import mock
+
+import pytest
+
+from data_validation import consts
+
+SOURCE_TABLE_FILE_PATH = "source_table_data.json"
+TARGET_TABLE_FILE_PATH = "target_table_data.json"
+JSON_DATA = """[{"col_a":1,"col_b":"a"},{"col_a":2,"col_b":"b"}]"""
+
+SOURCE_CONN_CONFIG = {
+    "source_type": "FileSystem",
+    "table_name": "my_table",
+    "file_path": SOURCE_TABLE_FILE_PATH,
+    "file_type": "json",
+}
+
+TARGET_CONN_CONFIG = {
+    "source_type": "FileSystem",
+    "table_name": "my_table",
+    "file_path": TARGET_TABLE_FILE_PATH,
+    "file_type": "json",
+}
+
+SKIP_UNCHANGED_CONFIG = {
+    "source_conn": SOURCE_CONN_CONFIG,
+    "target_conn": TARGET_CONN_CONFIG,
+    consts.CONFIG_TYPE: "Column",
+    "schema_name": None,
+    "table_name": "my_table",
+    "target_schema_name": None,
+    "target_table_name": "my_table",
+    consts.CONFIG_GROUPED_COLUMNS: [],
+    consts.CONFIG_AGGREGATES: [
+        {
+            "source_column": None,
+            "target_column": None,
+            "field_alias": "count",
+            "type": "count",
+        },
+    ],
+    consts.CONFIG_THRESHOLD: 0.0,
+    consts.CONFIG_RESULT_HANDLER: None,
+    consts.CONFIG_FORMAT: "csv",
+    consts.CONFIG_FILTER_STATUS: None,
+    consts.CONFIG_SKIP_UNCHANGED: True,
+}
+
+
+@pytest.fixture
+def ibis_pandas():
+    import ibis
+
+    return ibis.pandas.connect()
+
+
+@pytest.fixture
+def module_under_test(ibis_pandas, monkeypatch):
+    import data_validation.table_fingerprints
+
+    monkeypatch.setenv(consts.ENV_DIRECTORY_VAR, "/dvt_home/")
+    return data_validation.table_fingerprints
+
+
+def _write_tables(target_data=JSON_DATA):
+    for table_path, data in (
+        (SOURCE_TABLE_FILE_PATH, JSON_DATA),
+        (TARGET_TABLE_FILE_PATH, target_data),
+    ):
+        with open(table_path, "w") as f:
+            f.write(data)
+
+
+def _execute(config=SKIP_UNCHANGED_CONFIG):
+    from data_validation.data_validation import DataValidation
+
+    return DataValidation(copy.deepcopy(config)).execute()
+
+
+def test_get_fingerprints(module_under_test, fs):
+    from data_validation.config_manager import ConfigManager
+
+    _write_tables()
+    config_manager = ConfigManager(copy.deepcopy(SKIP_UNCHANGED_CONFIG))
+    fingerprints = module_under_test.get_fingerprints(config_manager)
+    assert set(fingerprints) == {"source", "target"}
+
+    config = copy.deepcopy(SKIP_UNCHANGED_CONFIG)
+    config[consts.CONFIG_TYPE] = consts.CUSTOM_QUERY
+    assert module_under_test.get_fingerprints(ConfigManager(config)) is None
+
+
+def test_skip_unchanged(module_under_test, fs):
+    from data_validation.data_validation import DataValidation
+
+    _write_tables()
+    first_df = _execute()
+    with mock.patch.object(DataValidation, "_execute_validation") as execute:
+        second_df = _execute()
+        execute.assert_not_called()
+    assert second_df["validation_status"].tolist() == ["success"]
+    assert second_df["run_id"][0] != first_df["run_id"][0]
+
+    # A changed table is validated again
+    _write_tables(target_data="""[{"col_a":1,"col_b":"a"}]""")
+    third_df = _execute()
+    assert third_df["validation_status"].tolist() == ["fail"]
+
+
+def test_skip_unchanged_after_failure(module_under_test, fs):
+    from data_validation.data_validation import DataValidation
+
+    _write_tables(target_data="""[{"col_a":1,"col_b":"a"}]""")
+    _execute()
+    with mock.patch.object(
+        DataValidation, "_execute_validation", side_effect=RuntimeError
+    ):
+        with pytest.raises(RuntimeError):
+            _execute()
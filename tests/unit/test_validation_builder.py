@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import datetime
 from copy import deepcopy
 
 import pandas
@@ -175,6 +176,36 @@ def test_column_validation_aggregates(module_under_test):
     assert list(builder.get_metadata().keys()) == ["sum_starttime"]
 
 
+def test_column_validation_approx_threshold(module_under_test):
+    """Approximate aggregates are compared with at least the approximate threshold"""
+    config = deepcopy(COLUMN_VALIDATION_CONFIG)
+    config[consts.CONFIG_THRESHOLD] = 0.5
+    mock_config_manager = ConfigManager(
+        config, MockIbisClient(), MockIbisClient(), verbose=False
+    )
+    builder = module_under_test.ValidationBuilder(mock_config_manager)
+
+    mock_config_manager.append_aggregates(
+        AGGREGATES_TEST
+        + [
+            {
+                consts.CONFIG_FIELD_ALIAS: "approx_count_distinct_bikeid",
+                consts.CONFIG_SOURCE_COLUMN: "bikeid",
+                consts.CONFIG_TARGET_COLUMN: "bikeid",
+                consts.CONFIG_TYPE: "approx_count_distinct",
+            }
+        ]
+    )
+    builder.add_config_aggregates()
+
+    metadata = builder.get_metadata()
+    assert metadata["sum_starttime"].threshold == 0.5
+    assert (
+        metadata["approx_count_distinct_bikeid"].threshold
+        == consts.DEFAULT_APPROX_THRESHOLD
+    )
+
+
 def test_validation_add_groups(module_under_test):
     mock_config_manager = ConfigManager(
         COLUMN_VALIDATION_CONFIG, MockIbisClient(), MockIbisClient(), verbose=False
@@ -285,6 +316,27 @@ def test_validation_add_filter(module_under_test, filter_field: dict):
     builder.add_filter(filter_field)
 
 
+def test_validation_add_filter_bind_parameters(module_under_test):
+    mock_config_manager = ConfigManager(
+        COLUMN_VALIDATION_CONFIG, MockIbisClient(), MockIbisClient(), verbose=False
+    )
+    builder = module_under_test.ValidationBuilder(mock_config_manager)
+    params = {"dvt_p0": {consts.CONFIG_TYPE: "date", "value": "2024-01-31"}}
+    builder.add_filter(
+        {
+            consts.CONFIG_TYPE: consts.FILTER_TYPE_CUSTOM,
+            consts.CONFIG_FILTER_SOURCE: "order_date >= :dvt_p0",
+            consts.CONFIG_FILTER_TARGET: "order_date >= :dvt_p0",
+            consts.CONFIG_FILTER_SOURCE_PARAMETERS: params,
+            consts.CONFIG_FILTER_TARGET_PARAMETERS: params,
+        }
+    )
+    # Typed parameters read from a partition file are bound with their type
+    assert builder.source_builder.filters[-1].right == {
+        "dvt_p0": datetime.date(2024, 1, 31)
+    }
+
+
 @pytest.mark.parametrize(
     "input_list,max_length,expected_result",
     [
@@ -347,3 +399,40 @@ def test_list_to_sublists(
 ):
     result = module_under_test.list_to_sublists(input_list, max_length)
     assert result == expected_result
+
+
+@pytest.mark.parametrize(
+    "max_aggregates,query_groups,expected_chunks",
+    [
+        (None, [], [5]),
+        (2, [], [2, 2, 1]),
+        # The grouped column is part of the select list of every sub-query
+        (3, QUERY_GROUPS_TEST, [2, 2, 1]),
+        (5, [], [5]),
+    ],
+)
+def test_split_query_builder(
+    module_under_test, max_aggregates, query_groups, expected_chunks
+):
+    config = deepcopy(COLUMN_VALIDATION_CONFIG)
+    config[consts.CONFIG_AGGREGATES] = [
+        {
+            consts.CONFIG_SOURCE_COLUMN: f"col_{_}",
+            consts.CONFIG_TARGET_COLUMN: f"col_{_}",
+            consts.CONFIG_FIELD_ALIAS: f"sum__col_{_}",
+            consts.CONFIG_TYPE: "sum",
+        }
+        for _ in range(5)
+    ]
+    config[consts.CONFIG_GROUPED_COLUMNS] = query_groups
+    config[consts.CONFIG_MAX_AGGREGATES] = max_aggregates
+    mock_config_manager = ConfigManager(
+        config, MockIbisClient(), MockIbisClient(), verbose=False
+    )
+    builder = module_under_test.ValidationBuilder(mock_config_manager)
+
+    query_builders = builder._split_query_builder(
+        builder.source_builder, MockIbisClient()
+    )
+    assert [len(_.aggregate_fields) for _ in query_builders] == expected_chunks
+    assert all(len(_.grouped_fields) == len(query_groups) for _ in query_builders)
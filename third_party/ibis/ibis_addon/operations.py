@@ -23,6 +23,7 @@ Ibis as an override, though it would not apply for Pandas and other
 non-textual languages.
 """
 import datetime
+import hashlib
 
 import google.cloud.bigquery as bq
 import ibis
@@ -33,6 +34,7 @@ import pandas as pd
 import sqlalchemy as sa
 from ibis.backends.base.sql.alchemy.registry import _cast as sa_fixed_cast
 from ibis.backends.base.sql.alchemy.registry import fixed_arity as sa_fixed_arity
+from ibis.backends.base.sql.alchemy.registry import reduction as sa_reduction
 from ibis.backends.base.sql.alchemy.translator import AlchemyExprTranslator
 from ibis.backends.base.sql.compiler.translator import ExprTranslator
 from ibis.backends.base.sql.registry import (
@@ -55,6 +57,8 @@ from ibis.backends.pandas.dispatch import execute_node
 from ibis.backends.pandas.execution.temporal import execute_epoch_seconds
 from ibis.backends.postgres.compiler import PostgreSQLExprTranslator
 from ibis.expr.operations import (
+    ApproxCountDistinct,
+    ApproxMedian,
     Cast,
     Comparison,
     ExtractEpochSeconds,
@@ -67,6 +71,7 @@ from ibis.expr.operations import (
     TableColumn,
 )
 from ibis.expr.types import BinaryValue, NumericValue, TemporalValue
+from pandas.core.groupby import SeriesGroupBy
 
 # Do not remove these lines, they trigger patching of Ibis code.
 import third_party.ibis.ibis_mysql.compiler  # noqa
@@ -121,10 +126,26 @@ class ToChar(Value):
     output_type = rlz.shape_like("arg")
 
 
+class HexDigest(HashBytes):
+    """The hash of a value as a lowercase hex string, which the HashBytes translators return."""
+
+    output_dtype = dt.string
+
+
 class RawSQL(Comparison):
     pass
 
 
+class BoundRawSQL(Value):
+    """Raw SQL filter with named bind parameters (:name) and their values."""
+
+    arg = rlz.any
+    sql = rlz.string
+    params = rlz.any
+    output_dtype = dt.boolean
+    output_shape = rlz.shape_like("arg")
+
+
 def compile_binary_length(binary_value):
     return BinaryLength(binary_value).to_expr()
 
@@ -133,6 +154,10 @@ def compile_to_char(numeric_value, fmt):
     return ToChar(numeric_value, fmt=fmt).to_expr()
 
 
+def compile_hex_digest(string_value, how="sha256"):
+    return HexDigest(string_value, how=how).to_expr()
+
+
 @bigquery_cast.register(str, dt.Binary, dt.String)
 def bigquery_cast_from_binary_generate(compiled_arg, from_, to):
     """Cast of binary to string should be hex conversion."""
@@ -279,7 +304,12 @@ def format_hashbytes_base(translator, op):
     return f"sha2({arg}, 256)"
 
 
-def compile_raw_sql(table, sql):
+def compile_raw_sql(table, sql, params=None):
+    if params:
+        op = BoundRawSQL(
+            table[table.columns[0]].cast(dt.string), sql, ibis.literal(params)
+        )
+        return op.to_expr()
     op = RawSQL(table[table.columns[0]].cast(dt.string), ibis.literal(sql))
     return op.to_expr()
 
@@ -294,6 +324,33 @@ def sa_format_raw_sql(translator, op):
     return sa.text(raw_sql.args[0])
 
 
+class _TemporalBindType(sa.types.TypeDecorator):
+    """Bind type for date and timestamp parameters which can also be rendered as literals,
+    as SQLAlchemy has no literal renderer for them, e.g. for dry runs."""
+
+    impl = sa.types.DateTime
+    cache_ok = True
+
+    def process_literal_param(self, value, dialect):
+        return f"'{value.isoformat(sep=' ') if isinstance(value, datetime.datetime) else value.isoformat()}'"
+
+
+def sa_format_bound_raw_sql(translator, op):
+    # The values are sent as bind variables so the statement text is the same for every value
+    return sa.text(op.sql.value).bindparams(
+        *[
+            sa.bindparam(
+                name,
+                value,
+                type_=_TemporalBindType()
+                if isinstance(value, (datetime.date, datetime.datetime))
+                else None,
+            )
+            for name, value in op.params.value.items()
+        ]
+    )
+
+
 def sa_format_hashbytes_mssql(translator, op):
     arg = translator.translate(op.arg)
     cast_arg = sa.func.convert(sa.sql.literal_column("VARCHAR(MAX)"), arg)
@@ -535,6 +592,16 @@ def _sa_string_join(t, op):
         return sa.func.concat(*map(t.translate, op.arg))
 
 
+def sa_format_percentile_median(sa_func):
+    """Return a formatter of the median as a PERCENTILE(0.5) WITHIN GROUP (ORDER BY arg) aggregate."""
+
+    def formatter(t, op):
+        arg = op.arg if op.where is None else ops.Where(op.where, op.arg, None)
+        return sa_func(0.5).within_group(t.translate(arg))
+
+    return formatter
+
+
 def sa_format_new_id(t, op):
     return sa.func.NEWID()
 
@@ -619,6 +686,25 @@ def execute_epoch_seconds_new(op, data, **kwargs):
 
 execute_epoch_seconds = execute_epoch_seconds_new
 
+
+@execute_node.register(ApproxMedian, pd.Series, (pd.Series, type(None)))
+def execute_approx_median_series_mask(op, data, mask, aggcontext=None, **kwargs):
+    return aggcontext.agg(data[mask] if mask is not None else data, "median")
+
+
+@execute_node.register(ApproxMedian, SeriesGroupBy, type(None))
+def execute_approx_median_series_groupby(op, data, _, aggcontext=None, **kwargs):
+    return aggcontext.agg(data, "median")
+
+
+@execute_node.register(HexDigest, pd.Series)
+def execute_hex_digest(op, data, **kwargs):
+    return data.map(
+        lambda value: hashlib.new(op.how, value.encode("utf-8")).hexdigest(),
+        na_action="ignore",
+    )
+
+
 BinaryValue.byte_length = compile_binary_length
 
 NumericValue.to_char = compile_to_char
@@ -643,18 +729,28 @@ ImpalaExprTranslator._registry[BinaryLength] = sa_format_binary_length
 
 if OracleExprTranslator:
     OracleExprTranslator._registry[RawSQL] = sa_format_raw_sql
+    OracleExprTranslator._registry[BoundRawSQL] = sa_format_bound_raw_sql
     OracleExprTranslator._registry[HashBytes] = sa_format_hashbytes_oracle
     OracleExprTranslator._registry[ToChar] = sa_format_to_char
     OracleExprTranslator._registry[BinaryLength] = sa_format_binary_length_oracle
+    OracleExprTranslator._registry[ApproxCountDistinct] = sa_reduction(
+        sa.func.approx_count_distinct
+    )
+    OracleExprTranslator._registry[ApproxMedian] = sa_reduction(sa.func.approx_median)
 
 PostgreSQLExprTranslator._registry[HashBytes] = sa_format_hashbytes_postgres
 PostgreSQLExprTranslator._registry[RawSQL] = sa_format_raw_sql
+PostgreSQLExprTranslator._registry[BoundRawSQL] = sa_format_bound_raw_sql
 PostgreSQLExprTranslator._registry[ToChar] = sa_format_to_char
 PostgreSQLExprTranslator._registry[Cast] = sa_cast_postgres
 PostgreSQLExprTranslator._registry[BinaryLength] = sa_format_binary_length
+PostgreSQLExprTranslator._registry[ApproxMedian] = sa_format_percentile_median(
+    sa.func.percentile_cont
+)
 
 MsSqlExprTranslator._registry[HashBytes] = sa_format_hashbytes_mssql
 MsSqlExprTranslator._registry[RawSQL] = sa_format_raw_sql
+MsSqlExprTranslator._registry[BoundRawSQL] = sa_format_bound_raw_sql
 MsSqlExprTranslator._registry[IfNull] = sa_fixed_arity(sa.func.isnull, 2)
 MsSqlExprTranslator._registry[StringJoin] = _sa_string_join
 MsSqlExprTranslator._registry[RandomScalar] = sa_format_new_id
@@ -662,22 +758,35 @@ MsSqlExprTranslator._registry[Strftime] = strftime_mssql
 MsSqlExprTranslator._registry[Cast] = sa_cast_mssql
 MsSqlExprTranslator._registry[BinaryLength] = sa_format_binary_length_mssql
 MsSqlExprTranslator._registry[TableColumn] = mssql_table_column
+MsSqlExprTranslator._registry[ApproxCountDistinct] = sa_reduction(
+    sa.func.approx_count_distinct
+)
+MsSqlExprTranslator._registry[ApproxMedian] = sa_format_percentile_median(
+    sa.func.approx_percentile_cont
+)
 
 MySQLExprTranslator._registry[Cast] = sa_cast_mysql
 MySQLExprTranslator._registry[RawSQL] = sa_format_raw_sql
+MySQLExprTranslator._registry[BoundRawSQL] = sa_format_bound_raw_sql
 MySQLExprTranslator._registry[HashBytes] = sa_format_hashbytes_mysql
 MySQLExprTranslator._registry[Strftime] = strftime_mysql
 MySQLExprTranslator._registry[BinaryLength] = sa_format_binary_length
 
 RedShiftExprTranslator._registry[HashBytes] = sa_format_hashbytes_redshift
 RedShiftExprTranslator._registry[RawSQL] = sa_format_raw_sql
+RedShiftExprTranslator._registry[BoundRawSQL] = sa_format_bound_raw_sql
 RedShiftExprTranslator._registry[BinaryLength] = sa_format_binary_length
+RedShiftExprTranslator._registry[ApproxMedian] = sa_format_percentile_median(
+    sa.func.percentile_cont
+)
 
 if Db2ExprTranslator:
     Db2ExprTranslator._registry[HashBytes] = sa_format_hashbytes_db2
     Db2ExprTranslator._registry[RawSQL] = sa_format_raw_sql
+    Db2ExprTranslator._registry[BoundRawSQL] = sa_format_bound_raw_sql
     Db2ExprTranslator._registry[BinaryLength] = sa_format_binary_length
     Db2ExprTranslator._registry[Strftime] = strftime_db2
+    Db2ExprTranslator._registry[ApproxMedian] = sa_reduction(sa.func.median)
 
 SpannerExprTranslator._registry[RawSQL] = format_raw_sql
 SpannerExprTranslator._registry[HashBytes] = format_hashbytes_bigquery
@@ -692,7 +801,33 @@ if SnowflakeExprTranslator:
     SnowflakeExprTranslator._registry[Cast] = sa_cast_snowflake
     SnowflakeExprTranslator._registry[HashBytes] = sa_format_hashbytes_snowflake
     SnowflakeExprTranslator._registry[RawSQL] = sa_format_raw_sql
+    SnowflakeExprTranslator._registry[BoundRawSQL] = sa_format_bound_raw_sql
     SnowflakeExprTranslator._registry[IfNull] = sa_fixed_arity(sa.func.ifnull, 2)
     SnowflakeExprTranslator._registry[ExtractEpochSeconds] = sa_epoch_time_snowflake
     SnowflakeExprTranslator._registry[RandomScalar] = sa_format_random
     SnowflakeExprTranslator._registry[BinaryLength] = sa_format_binary_length
+    SnowflakeExprTranslator._registry[ApproxCountDistinct] = sa_reduction(
+        sa.func.approx_count_distinct
+    )
+    SnowflakeExprTranslator._registry[ApproxMedian] = sa_reduction(
+        lambda arg: sa.func.approx_percentile(arg, 0.5)
+    )
+
+# The hex digest of a string is translated like HashBytes, which already returns hex strings
+for translator in (
+    BigQueryExprTranslator,
+    AlchemyExprTranslator,
+    ExprTranslator,
+    ImpalaExprTranslator,
+    OracleExprTranslator,
+    PostgreSQLExprTranslator,
+    MsSqlExprTranslator,
+    MySQLExprTranslator,
+    RedShiftExprTranslator,
+    Db2ExprTranslator,
+    SpannerExprTranslator,
+    TeradataExprTranslator,
+    SnowflakeExprTranslator,
+):
+    if translator and HashBytes in translator._registry:
+        translator._registry[HexDigest] = translator._registry[HashBytes]
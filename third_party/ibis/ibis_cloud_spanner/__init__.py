@@ -12,9 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import logging
 from typing import Any, Mapping, Optional, Tuple
 
 import google.cloud.spanner as cs
+from google.api_core import exceptions
 import ibis.expr.schema as sch
 import ibis.expr.types as ir
 from google.cloud import spanner
@@ -39,8 +41,10 @@ class Backend(BaseSQLBackend):
         database_id: str = None,
         project_id: str = None,
         credentials=None,
+        partition_workers: int = 0,
     ) -> None:
 
+        self.partition_workers = int(partition_workers or 0)
         self.spanner_client = spanner.Client(
             project=project_id, credentials=credentials
         )
@@ -160,6 +164,16 @@ class Backend(BaseSQLBackend):
         self._register_in_memory_tables(expr)
         db = self.instance.database(self.dataset_id)
 
+        if self.partition_workers > 0:
+            try:
+                result = pandas_df.to_pandas_partitioned(
+                    db, sql, self.partition_workers
+                )
+                if result is not None:
+                    return result
+            except exceptions.InvalidArgument as e:
+                logging.debug(f"Query is not partitionable: {e}")
+
         with db.snapshot() as snapshot:
             result = pandas_df.to_pandas(snapshot, sql, query_parameters=None)
 
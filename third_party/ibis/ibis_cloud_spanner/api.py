@@ -22,6 +22,7 @@ def spanner_connect(
     database_id,
     project_id=None,
     credentials=None,
+    partition_workers=0,
 ):
     """Create a Cloud Spanner Backend for use with Ibis.
 
@@ -33,6 +34,9 @@ def spanner_connect(
         A database id inside of the Cloud Spanner Instance
     project_id  : str (Optional)
         The ID of the project which owns the instances, tables and data.
+    partition_workers : int (Optional)
+        The number of partitions of a partitioned query read concurrently, or 0 to
+        read every query with a single snapshot.
     """
     backend = SpannerBackend()
     backend.do_connect(
@@ -40,5 +44,6 @@ def spanner_connect(
         database_id=database_id,
         project_id=project_id,
         credentials=credentials,
+        partition_workers=partition_workers,
     )
     return backend
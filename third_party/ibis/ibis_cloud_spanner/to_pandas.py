@@ -12,8 +12,104 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy
+from google.cloud.spanner_v1 import TypeCode
 from pandas import DataFrame
 
+# Number of streamed rows converted to columns at a time, small enough for the rows to be
+# freed before they are promoted out of the youngest garbage collector generation
+CHUNK_SIZE = 500
+
+# Types read into typed arrays, with the value standing in for NULLs
+_TYPED_COLUMNS = {
+    TypeCode.INT64: (numpy.int64, 0),
+    TypeCode.FLOAT64: (numpy.float64, numpy.nan),
+    TypeCode.BOOL: (numpy.bool_, False),
+}
+
+
+class ColumnReader:
+    """Read a streamed result set into columns as it arrives.
+
+    Rows are converted CHUNK_SIZE at a time, so only one chunk of rows is held as Python
+    lists. INT64, FLOAT64 and BOOL values are stored in typed arrays. The DataFrame has the
+    same columns and dtypes as one built from all the rows.
+    """
+
+    def __init__(self):
+        self.fields = None
+        self.chunks = []
+        self.num_rows = 0
+
+    def read(self, result):
+        rows = iter(result)
+        while chunk := list(itertools.islice(rows, CHUNK_SIZE)):
+            self._add_chunk(result.fields, chunk)
+        if self.fields is None:
+            self.fields = list(result.fields)
+        return self
+
+    def _add_chunk(self, fields, rows):
+        if self.fields is None:
+            self.fields = list(fields)
+            self.chunks = [[] for _ in self.fields]
+        for field, chunks, values in zip(self.fields, self.chunks, zip(*rows)):
+            if field.type_.code in _TYPED_COLUMNS:
+                dtype, fill_value = _TYPED_COLUMNS[field.type_.code]
+                nulls = None
+                if None in values:
+                    nulls = numpy.fromiter(
+                        (_ is None for _ in values), dtype=bool, count=len(values)
+                    )
+                    values = [fill_value if _ is None else _ for _ in values]
+                chunks.append((numpy.array(values, dtype=dtype), nulls))
+            else:
+                chunks.append(values)
+        self.num_rows += len(rows)
+
+
+def _get_column(field, chunks, num_rows):
+    """Return the values of a column as DataFrame would infer them from the rows."""
+    if field.type_.code not in _TYPED_COLUMNS:
+        return list(itertools.chain.from_iterable(chunks))
+    values = numpy.concatenate([_[0] for _ in chunks])
+    nulls = numpy.concatenate(
+        [numpy.zeros(len(v), dtype=bool) if n is None else n for v, n in chunks]
+    )
+    if not nulls.any():
+        return values
+    if nulls.all():
+        return [None] * num_rows
+    if field.type_.code == TypeCode.BOOL:
+        return [None if null else value for value, null in zip(values.tolist(), nulls)]
+    values = values.astype(numpy.float64)
+    values[nulls] = numpy.nan
+    return values
+
+
+def _to_dataframe(readers):
+    fields = readers[0].fields
+    columns = [f.name for f in fields]
+    num_rows = sum(_.num_rows for _ in readers)
+    if not num_rows:
+        return DataFrame([], columns=columns)
+
+    data = {
+        i: _get_column(
+            field,
+            [chunk for _ in readers if _.num_rows for chunk in _.chunks[i]],
+            num_rows,
+        )
+        for i, field in enumerate(fields)
+    }
+    df = DataFrame(data)
+    # Columns are set afterwards as query results may repeat column names
+    df.columns = columns
+    return df
+
 
 class pandas_df:
     def to_pandas(snapshot, sql, query_parameters):
@@ -30,13 +126,27 @@ class pandas_df:
         else:
             data_qry = snapshot.execute_sql(sql)
 
-        data = []
-        for row in data_qry:
-            data.append(row)
-
-        columns = [f.name for f in data_qry.fields]
+        return _to_dataframe([ColumnReader().read(data_qry)])
 
-        # Creating pandas dataframe from data and columns
-        df = DataFrame(data, columns=columns)
+    def to_pandas_partitioned(database, sql, max_workers):
+        """Read a query with a partitioned query, reading the partitions concurrently.
 
-        return df
+        Returns None when the query has no partitions. Raises
+        google.api_core.exceptions.InvalidArgument when the query is not root partitionable,
+        e.g. an aggregation or an ordered query.
+        """
+        batch_snapshot = database.batch_snapshot()
+        try:
+            batches = list(batch_snapshot.generate_query_batches(sql))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                readers = list(
+                    executor.map(
+                        lambda _: ColumnReader().read(
+                            batch_snapshot.process_query_batch(_)
+                        ),
+                        batches,
+                    )
+                )
+        finally:
+            batch_snapshot.close()
+        return _to_dataframe(readers) if readers else None
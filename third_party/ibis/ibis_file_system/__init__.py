@@ -0,0 +1,298 @@
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+""" A pandas backend over the file of a FileSystem connection, which is read when an
+    expression is executed rather than when the connection is created. Only the columns
+    an expression references are read from Parquet and ORC files, directories of
+    partitioned files or globs of files. CSV and JSON files are read in full on first use.
+"""
+
+import glob
+import threading
+from typing import Dict, List, Optional, Set
+
+import fsspec
+import ibis.expr.datatypes as dt
+import ibis.expr.operations as ops
+import ibis.expr.schema as sch
+import ibis.expr.types as ir
+import pandas
+import pyarrow
+import pyarrow.dataset
+import pyarrow.parquet
+from ibis.backends.pandas import Backend as PandasBackend
+from ibis.common.graph import Graph
+
+COLUMNAR_FILE_TYPES = ("orc", "parquet")
+FILE_TYPES = ("csv", "json") + COLUMNAR_FILE_TYPES
+
+
+class ColumnarFile(object):
+    def __init__(self, file_path: str, file_type: str):
+        """Open a Parquet or ORC file, a directory of partitioned files or a glob of files."""
+        self.file_type = file_type
+        self.filesystem, path = fsspec.core.url_to_fs(file_path)
+        self.paths = (
+            sorted(self.filesystem.glob(path)) if glob.has_magic(path) else path
+        )
+        self.dataset = pyarrow.dataset.dataset(
+            self.paths,
+            format=file_type,
+            filesystem=self.filesystem,
+            partitioning="hive",
+        )
+        # Columns restoring the index of a DataFrame written by pandas are not data
+        pandas_metadata = self.dataset.schema.pandas_metadata or {}
+        index_columns = {
+            name
+            for name in pandas_metadata.get("index_columns", [])
+            if isinstance(name, str)
+        }
+        self.names = [
+            name for name in self.dataset.schema.names if name not in index_columns
+        ]
+        # Columns restored to pandas extension types, e.g. nullable integers
+        self.extension_columns = {
+            column["field_name"]
+            for column in pandas_metadata.get("columns", [])
+            if _is_extension_type(column.get("numpy_type"))
+        }
+
+    def count_rows(self) -> int:
+        return self.dataset.count_rows()
+
+    def get_null_counts(self) -> Dict[str, int]:
+        """Return the number of nulls of the columns with null count statistics in every file,
+        from the Parquet file footers. pyarrow does not expose the statistics of ORC files."""
+        if self.file_type != "parquet":
+            return {}
+        null_counts = {}
+        unknown = set()
+        for fragment in self.dataset.get_fragments():
+            # Columns missing from a file are read as nulls
+            missing = set(self.names)
+            metadata = fragment.metadata
+            for i in range(metadata.num_row_groups):
+                row_group = metadata.row_group(i)
+                for j in range(row_group.num_columns):
+                    column = row_group.column(j)
+                    name = column.path_in_schema
+                    missing.discard(name)
+                    statistics = column.statistics
+                    if statistics is None or not statistics.has_null_count:
+                        unknown.add(name)
+                    else:
+                        null_counts[name] = (
+                            null_counts.get(name, 0) + statistics.null_count
+                        )
+            unknown.update(missing)
+        return {
+            name: null_count
+            for name, null_count in null_counts.items()
+            if name not in unknown
+        }
+
+    def read(self, columns: List[str]) -> pandas.DataFrame:
+        """Return the columns of the file, as pandas.read_parquet or pandas.read_orc would."""
+        if self.file_type == "parquet":
+            table = pyarrow.parquet.read_table(
+                self.paths,
+                columns=columns,
+                filesystem=self.filesystem,
+                use_pandas_metadata=True,
+            )
+        else:
+            table = self.dataset.to_table(columns=columns)
+        return table.to_pandas()
+
+
+def _is_extension_type(numpy_type: Optional[str]) -> bool:
+    if numpy_type is None:
+        return False
+    try:
+        return isinstance(
+            pandas.api.types.pandas_dtype(numpy_type),
+            pandas.api.extensions.ExtensionDtype,
+        )
+    except TypeError:
+        return True
+
+
+def _get_pandas_type(
+    arrow_type: pyarrow.DataType, null_count: Optional[int]
+) -> Optional[dt.DataType]:
+    """Return the type inferred from the pandas column of an Arrow column, or None when it
+    depends on the values of the column.
+
+    pandas converts integers with nulls to float64, and strings, binaries, dates and times to
+    objects of their Python type. Objects of other types, e.g. decimals, are inferred from
+    their values.
+    """
+    if (
+        pyarrow.types.is_string(arrow_type)
+        or pyarrow.types.is_large_string(arrow_type)
+        or pyarrow.types.is_binary(arrow_type)
+        or pyarrow.types.is_large_binary(arrow_type)
+    ):
+        return dt.string
+    if pyarrow.types.is_date(arrow_type):
+        return dt.date
+    if pyarrow.types.is_time(arrow_type):
+        return dt.time
+    if pyarrow.types.is_integer(arrow_type):
+        if null_count is None:
+            return None
+        if null_count:
+            return dt.float64
+    elif not (
+        pyarrow.types.is_floating(arrow_type)
+        or pyarrow.types.is_timestamp(arrow_type)
+        or pyarrow.types.is_boolean(arrow_type)
+    ):
+        return None
+    empty_df = pyarrow.schema([("column", arrow_type)]).empty_table().to_pandas()
+    return sch.infer(empty_df)["column"]
+
+
+def _read_text_file(file_path: str, file_type: str) -> pandas.DataFrame:
+    if file_type == "csv":
+        return pandas.read_csv(file_path)
+    return pandas.read_json(file_path)
+
+
+class Backend(PandasBackend):
+    def do_connect(self, table_name: str, file_path: str, file_type: str) -> None:
+        if file_type not in FILE_TYPES:
+            raise ValueError(f"Unknown Pandas File Type: {file_type}")
+        super().do_connect({table_name: pandas.DataFrame()})
+        self.table_name = table_name
+        self.file_path = file_path
+        self.file_type = file_type
+        self._file = (
+            ColumnarFile(file_path, file_type)
+            if file_type in COLUMNAR_FILE_TYPES
+            else None
+        )
+        self._loaded_columns = set()
+        self._loaded_rows = False
+        self._lock = threading.Lock()
+
+    def _load(self, columns: Optional[Set[str]] = None) -> pandas.DataFrame:
+        """Read the columns of the file missing from the table, or all of them when None.
+
+        With no columns only the number of rows of the file is loaded.
+        """
+        with self._lock:
+            df = self.dictionary[self.table_name]
+            if self._file is None:
+                if not self._loaded_rows:
+                    df = _read_text_file(self.file_path, self.file_type)
+                    self._loaded_columns = set(df.columns)
+                    self._loaded_rows = True
+                    self.dictionary[self.table_name] = df
+                return df
+
+            missing = [
+                name
+                for name in self._file.names
+                if (columns is None or name in columns)
+                and name not in self._loaded_columns
+            ]
+            if missing:
+                loaded = self._file.read(missing)
+                if self._loaded_columns:
+                    loaded = loaded.set_axis(df.index)
+                    df = pandas.concat([df, loaded], axis=1, copy=False)
+                    df = df[[name for name in self._file.names if name in df.columns]]
+                else:
+                    df = loaded
+                self._loaded_columns.update(missing)
+            elif not self._loaded_rows:
+                df = pandas.DataFrame(index=pandas.RangeIndex(self._file.count_rows()))
+            self._loaded_rows = True
+            self.dictionary[self.table_name] = df
+            return df
+
+    def _get_referenced_columns(self, node: ops.Node) -> Optional[Set[str]]:
+        """Return the columns of the file an expression references, or None for all of them."""
+        if self._is_file_table(node):
+            return None
+        columns = set()
+        for parent, children in Graph.from_bfs(node).items():
+            for child in children:
+                if not self._is_file_table(child):
+                    continue
+                if isinstance(parent, ops.TableColumn):
+                    columns.add(parent.name)
+                elif isinstance(parent, ops.Selection) and child in parent.selections:
+                    return None
+                elif not isinstance(
+                    parent, (ops.Aggregation, ops.CountStar, ops.Selection)
+                ):
+                    return None
+        return columns
+
+    def _is_file_table(self, node: ops.Node) -> bool:
+        return (
+            isinstance(node, ops.DatabaseTable)
+            and node.source is self
+            and node.name == self.table_name
+        )
+
+    def _infer_schema(self) -> sch.Schema:
+        if self._file is None:
+            return sch.infer(self._load())
+        # The pandas types of columns follow from their Arrow types and, for integers, from
+        # the null counts of the file statistics. Other columns, and columns restored to
+        # extension types by pandas metadata, are read and inferred one at a time.
+        arrow_schema = self._file.dataset.schema
+        null_counts = (
+            self._file.get_null_counts()
+            if any(pyarrow.types.is_integer(_.type) for _ in arrow_schema)
+            else {}
+        )
+        df = self.dictionary[self.table_name]
+        schema = {}
+        for name in self._file.names:
+            if name not in self._file.extension_columns:
+                schema[name] = _get_pandas_type(
+                    arrow_schema.field(name).type, null_counts.get(name)
+                )
+                if schema[name] is not None:
+                    continue
+            if name in self._loaded_columns:
+                column_df = df[[name]]
+            else:
+                column_df = self._file.read([name])
+            schema[name] = sch.infer(column_df)[name]
+        return sch.Schema(schema)
+
+    def get_schema(self, table_name, database=None):
+        if table_name != self.table_name:
+            return super().get_schema(table_name, database=database)
+        if table_name not in self.schemas:
+            self.schemas[table_name] = self._infer_schema()
+        return self.schemas[table_name]
+
+    def table(self, name: str, schema: sch.Schema = None):
+        if name != self.table_name:
+            return super().table(name, schema=schema)
+        return self.table_class(name, schema or self.get_schema(name), self).to_expr()
+
+    def execute(self, query, params=None, limit="default", **kwargs):
+        if isinstance(query, ir.Expr):
+            node = query.op()
+            if any(self._is_file_table(n) for n in Graph.from_bfs(node)):
+                self._load(self._get_referenced_columns(node))
+        return super().execute(query, params=params, limit=limit, **kwargs)
@@ -0,0 +1,37 @@
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from third_party.ibis.ibis_file_system import Backend as FileSystemBackend
+
+
+def file_system_connect(table_name, file_path, file_type):
+    """Create a FileSystem Backend reading a file as a table for use with Ibis.
+
+    Parameters
+    ----------
+    table_name : str
+        The name of the table holding the data of the file.
+    file_path : str
+        The local, s3 or GCS path of a file, a directory of partitioned files
+        or a glob of files.
+    file_type : str
+        The type of the file (csv, json, orc or parquet).
+    """
+    backend = FileSystemBackend()
+    backend.do_connect(
+        table_name=table_name,
+        file_path=file_path,
+        file_type=file_type,
+    )
+    return backend